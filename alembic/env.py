@@ -7,6 +7,8 @@ from sqlalchemy import engine_from_config, pool
 from alembic import context
 from src.interview_system.models.question import Question
 from src.interview_system.models.review_queue import ReviewQueue
+from src.interview_system.models.analysis_cache import AnalysisCacheEntry
+from src.interview_system.models.index_alias import IndexAlias, IndexVersion
 
 # Add your project's 'src' directory to the Python path
 # This allows Alembic to find your models
@@ -0,0 +1,115 @@
+# scripts/bench_async_retrieval.py
+"""
+Measures event-loop stall during concurrent vector searches.
+
+Runs the same batch of concurrent queries twice, once calling the blocking
+query_similar from coroutines (the old retrieval path) and once through
+aquery_similar, while a ticker coroutine records how late each of its 10 ms
+wake-ups fires. A loop that is never blocked shows lag close to zero.
+
+Usage:
+    python scripts/bench_async_retrieval.py --concurrency 32 --namespace updated-namespace
+"""
+import argparse
+import asyncio
+import os
+import pathlib
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# --- Boilerplate to set up path for imports ---
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+# --- End Boilerplate ---
+
+from interview_system.services.vector_store import get_vector_store
+
+QUERIES = [
+    "python generators and iterators",
+    "designing a rate limiter",
+    "database indexing strategies",
+    "handling conflict in a team",
+    "gradient descent intuition",
+    "hash map collision handling",
+    "eventual consistency trade-offs",
+    "explain bias and variance",
+]
+TICK_SECONDS = 0.01
+
+
+async def ticker(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append((time.perf_counter() - start - TICK_SECONDS) * 1000)
+
+
+async def measure(label: str, make_call, concurrency: int) -> None:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(stop, lags))
+
+    # The label keeps query strings unique per run, so neither run is served
+    # from the other's query caches.
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            make_call(f"{QUERIES[i % len(QUERIES)]} ({label} {i})")
+            for i in range(concurrency)
+        )
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    stop.set()
+    await tick_task
+
+    lags = lags or [0.0]
+    print(
+        f"{label:<12}{wall_ms:>10.0f}{statistics.median(lags):>12.2f}"
+        f"{max(lags):>12.2f}"
+    )
+
+
+async def run(concurrency: int, namespace: str | None) -> None:
+    store = get_vector_store()
+    # Warm up the model and the connection pool outside the measurement.
+    store.query_similar("warm up", 3, {}, namespace=namespace)
+
+    async def blocking(query: str):
+        return store.query_similar(query, 7, {}, namespace=namespace)
+
+    async def non_blocking(query: str):
+        return await store.aquery_similar(query, 7, {}, namespace=namespace)
+
+    header = f"{'path':<12}{'wall ms':>10}{'p50 lag ms':>12}{'max lag ms':>12}"
+    print(header)
+    print("-" * len(header))
+    await measure("blocking", blocking, concurrency)
+    await measure("async", non_blocking, concurrency)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare event-loop stall of blocking and async vector search."
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--namespace", type=str, default="updated-namespace")
+    args = parser.parse_args()
+
+    if os.getenv("VECTOR_STORE_BACKEND", "pinecone") == "pinecone" and not os.getenv(
+        "PINECONE_API_KEY"
+    ):
+        print("Error: PINECONE_API_KEY must be set in .env file.")
+        return
+
+    asyncio.run(run(args.concurrency, args.namespace))
+
+
+if __name__ == "__main__":
+    main()
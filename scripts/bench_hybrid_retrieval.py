@@ -0,0 +1,138 @@
+# scripts/bench_hybrid_retrieval.py
+"""
+Compares vector-only, lexical-only (BM25) and hybrid (reciprocal rank fusion)
+retrieval over questions.txt.
+
+Each evaluation query is a short keyword query built from one question: its
+N rarest terms (highest idf), which mimics short technical plan topics such
+as "GIL" or "CAP theorem". A query counts as a hit at k if its source
+question is among the top k results.
+
+The vector side uses an in-process exact index over the same questions, so
+no Pinecone access is needed and all three retrievers see the same corpus.
+
+Usage:
+    python scripts/bench_hybrid_retrieval.py --queries 300 --terms 2
+"""
+import argparse
+import json
+import pathlib
+import random
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# --- Boilerplate to set up path for imports ---
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+# --- End Boilerplate ---
+
+from interview_system.services.lexical_index import (
+    LexicalIndex,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+from interview_system.services.local_store import LocalVectorStore
+
+INPUT_FILE = "questions.txt"
+KS = (1, 3, 7, 20)
+
+
+def build_queries(questions, index: LexicalIndex, count: int, terms: int, seed: int):
+    rng = random.Random(seed)
+    sample = rng.sample(questions, min(count, len(questions)))
+    queries = []
+    for q in sample:
+        tokens = [t for t in dict.fromkeys(tokenize(q["text"])) if t in index._idf]
+        if not tokens:
+            continue
+        rare = sorted(tokens, key=lambda t: -index._idf[t])[:terms]
+        queries.append((" ".join(rare), q["id"]))
+    return queries
+
+
+def evaluate(name: str, search, queries, max_k: int) -> tuple:
+    hits = {k: 0 for k in KS}
+    latencies = []
+    for query, relevant_id in queries:
+        start = time.perf_counter()
+        results = search(query, max_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        ids = [r["id"] for r in results]
+        for k in KS:
+            hits[k] += relevant_id in ids[:k]
+    recalls = [hits[k] / len(queries) for k in KS]
+    p95 = sorted(latencies)[int(0.95 * (len(latencies) - 1))]
+    return (name, *recalls, statistics.median(latencies), p95)
+
+
+def run(args) -> None:
+    with open(args.input, "r", encoding="utf-8") as f:
+        questions = json.load(f)
+
+    lexical = LexicalIndex()
+    lexical.build(questions)
+
+    print(f"Embedding {len(questions)} questions for the vector index...")
+    vector = LocalVectorStore()
+    vector.upsert_questions(questions)
+
+    queries = build_queries(questions, lexical, args.queries, args.terms, args.seed)
+    max_k = max(KS)
+    print(f"Evaluating {len(queries)} queries of {args.terms} term(s).\n")
+
+    def vector_search(query, k):
+        return vector.query_similar(query, k, {})
+
+    def lexical_search(query, k):
+        return lexical.search(query, k)
+
+    def hybrid_search(query, k):
+        return reciprocal_rank_fusion(
+            [vector_search(query, k), lexical_search(query, k)], k=args.rrf_k
+        )[:k]
+
+    rows = [
+        evaluate("vector", vector_search, queries, max_k),
+        evaluate("lexical", lexical_search, queries, max_k),
+        evaluate("hybrid", hybrid_search, queries, max_k),
+    ]
+
+    header = (
+        f"{'retriever':<10}"
+        + "".join(f"{f'R@{k}':>8}" for k in KS)
+        + f"{'p50 ms':>9}{'p95 ms':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row[0]:<10}"
+            + "".join(f"{r:>8.3f}" for r in row[1 : 1 + len(KS)])
+            + f"{row[-2]:>9.2f}{row[-1]:>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark vector, lexical and hybrid question retrieval."
+    )
+    parser.add_argument("--input", type=str, default=INPUT_FILE)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument(
+        "--terms", type=int, default=2, help="Rarest terms per keyword query."
+    )
+    parser.add_argument("--rrf-k", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# scripts/bench_query_strategies.py
+"""
+Side-by-side benchmark of the two ways of building a retrieval query:
+
+  * llm-transform:  _transform_query (flash LLM call) + SentenceTransformer encode
+  * profile-blend:  one session profile embedding blended with a domain vector
+
+For every domain it reports the query-build latency, the share of the top-k
+results whose domain matches the requested topic, the mean relevance score,
+and how much the two top-k result sets overlap.
+
+Usage:
+    python scripts/bench_query_strategies.py --namespace updated-namespace --top-k 7
+"""
+import argparse
+import asyncio
+import os
+import pathlib
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# --- Boilerplate to set up path for imports ---
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+# --- End Boilerplate ---
+
+from interview_system.agents.question_retrieval import (
+    _transform_query,
+    build_query_vector,
+    embed_session_profile,
+)
+from interview_system.services.embeddings import embed_texts
+from interview_system.services.vector_store import get_vector_store
+
+RESUME_SUMMARY = {
+    "skills": [
+        {"name": "Python", "confidence": 0.95},
+        {"name": "Spark", "confidence": 0.9},
+        {"name": "PostgreSQL", "confidence": 0.8},
+    ],
+    "topics": ["distributed-systems", "system-design", "data-engineering"],
+    "experience_summary": "5+ years building data platforms and distributed services",
+    "projects": [{"title": "Orion", "summary": "Real-time personalization engine"}],
+}
+JOB_SUMMARY = {
+    "required_skills": ["Python", "System Design", "SQL"],
+    "seniority": "Senior",
+    "keywords": ["Scalability", "Reliability", "Data Pipelines"],
+}
+DOMAINS = [
+    "python",
+    "machine-learning",
+    "system-design",
+    "databases",
+    "behavioral",
+    "data-structures",
+]
+
+
+def domain_precision(candidates: list[dict], domain: str) -> float:
+    if not candidates:
+        return 0.0
+    hits = sum(
+        1
+        for c in candidates
+        if str((c.get("metadata") or {}).get("domain", "")).endswith(domain)
+    )
+    return hits / len(candidates)
+
+
+async def run(namespace: str | None, top_k: int) -> None:
+    store = get_vector_store()
+
+    start = time.perf_counter()
+    profile = embed_session_profile(RESUME_SUMMARY, JOB_SUMMARY)
+    profile_ms = (time.perf_counter() - start) * 1000
+    print(f"Session profile embedding (once per session): {profile_ms:.1f} ms\n")
+
+    rows = []
+    for domain in DOMAINS:
+        start = time.perf_counter()
+        query_text = await _transform_query(RESUME_SUMMARY, JOB_SUMMARY, domain)
+        llm_vector = embed_texts([query_text])[0].tolist()
+        llm_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        blend_vector = build_query_vector(profile, domain)
+        blend_ms = (time.perf_counter() - start) * 1000
+
+        llm_results = store.query_similar(
+            query_text, top_k, {}, namespace=namespace, query_vector=llm_vector
+        )
+        blend_results = store.query_similar(
+            domain, top_k, {}, namespace=namespace, query_vector=blend_vector
+        )
+
+        llm_ids = {c["id"] for c in llm_results}
+        blend_ids = {c["id"] for c in blend_results}
+        overlap = len(llm_ids & blend_ids) / max(len(llm_ids | blend_ids), 1)
+
+        rows.append(
+            (
+                domain,
+                llm_ms,
+                blend_ms,
+                domain_precision(llm_results, domain),
+                domain_precision(blend_results, domain),
+                statistics.fmean([c["relevance_score"] for c in llm_results] or [0]),
+                statistics.fmean([c["relevance_score"] for c in blend_results] or [0]),
+                overlap,
+            )
+        )
+
+    header = (
+        f"{'domain':<18}{'llm ms':>9}{'blend ms':>10}{'llm P@k':>9}"
+        f"{'blend P@k':>11}{'llm rel':>9}{'blend rel':>11}{'jaccard':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row[0]:<18}{row[1]:>9.1f}{row[2]:>10.2f}{row[3]:>9.2f}"
+            f"{row[4]:>11.2f}{row[5]:>9.3f}{row[6]:>11.3f}{row[7]:>9.2f}"
+        )
+
+    print("-" * len(header))
+    print(
+        f"{'mean':<18}"
+        f"{statistics.fmean(r[1] for r in rows):>9.1f}"
+        f"{statistics.fmean(r[2] for r in rows):>10.2f}"
+        f"{statistics.fmean(r[3] for r in rows):>9.2f}"
+        f"{statistics.fmean(r[4] for r in rows):>11.2f}"
+        f"{statistics.fmean(r[5] for r in rows):>9.3f}"
+        f"{statistics.fmean(r[6] for r in rows):>11.3f}"
+        f"{statistics.fmean(r[7] for r in rows):>9.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare LLM query transformation with profile-blend queries."
+    )
+    parser.add_argument("--namespace", type=str, default="updated-namespace")
+    parser.add_argument("--top-k", type=int, default=7)
+    args = parser.parse_args()
+
+    if not all(os.getenv(k) for k in ["GOOGLE_API_KEY", "PINECONE_API_KEY"]):
+        print("Error: GOOGLE_API_KEY and PINECONE_API_KEY must be set in .env file.")
+        return
+
+    asyncio.run(run(args.namespace, args.top_k))
+
+
+if __name__ == "__main__":
+    main()
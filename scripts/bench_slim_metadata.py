@@ -0,0 +1,127 @@
+# scripts/bench_slim_metadata.py
+"""
+Before/after benchmark for slim vector metadata.
+
+Seed the same questions into two namespaces first:
+
+    python scripts/seed_database.py --namespace bench-full --metadata-mode full
+    python scripts/seed_database.py --namespace bench-slim --metadata-mode slim
+
+Then, for each namespace, this sends the same random query vectors and reports:
+
+  * raw query latency and response payload size (the Pinecone call alone)
+  * end-to-end query_similar latency with a cold hydration cache, and again
+    with a warm one (slim results are hydrated from questions_meta)
+
+Usage:
+    python scripts/bench_slim_metadata.py --full bench-full --slim bench-slim --queries 100
+"""
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import sys
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# --- Boilerplate to set up path for imports ---
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+# --- End Boilerplate ---
+
+from interview_system.services.pinecone_store import PineconeVectorStore
+from interview_system.services.question_hydration import question_hydrator
+
+
+def random_vectors(count: int, dim: int, seed: int) -> list[list[float]]:
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.tolist()
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def measure(store: PineconeVectorStore, namespace: str, vectors, top_k: int) -> tuple:
+    raw_ms, payload_kb = [], []
+    for vector in vectors:
+        ms, response = timed(
+            lambda: store.index.query(
+                vector=vector, top_k=top_k, include_metadata=True, namespace=namespace
+            )
+        )
+        raw_ms.append(ms)
+        payload_kb.append(len(json.dumps(response.to_dict(), default=str)) / 1024)
+
+    question_hydrator._cache.clear()
+    passes = []
+    for label in ("cold", "warm"):
+        timings = []
+        for vector in vectors:
+            # Clear the result cache so each call really queries and hydrates.
+            store._result_cache.clear()
+            ms, _ = timed(
+                lambda: store.query_similar(
+                    "", top_k, {}, namespace=namespace, query_vector=vector
+                )
+            )
+            timings.append(ms)
+        passes.append(statistics.median(timings))
+
+    return (
+        namespace,
+        statistics.median(raw_ms),
+        statistics.fmean(payload_kb),
+        passes[0],
+        passes[1],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare query latency and payload of full and slim metadata."
+    )
+    parser.add_argument("--full", type=str, default="bench-full")
+    parser.add_argument("--slim", type=str, default="bench-slim")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=7)
+    args = parser.parse_args()
+
+    if not os.getenv("PINECONE_API_KEY"):
+        print("Error: PINECONE_API_KEY must be set in .env file.")
+        return
+
+    store = PineconeVectorStore()
+    dim = store.embedding_model.get_sentence_embedding_dimension()
+    vectors = random_vectors(args.queries, dim, seed=0)
+
+    rows = [
+        measure(store, args.full, vectors, args.top_k),
+        measure(store, args.slim, vectors, args.top_k),
+    ]
+
+    header = (
+        f"{'namespace':<16}{'raw ms':>9}{'payload KB':>12}"
+        f"{'e2e cold ms':>13}{'e2e warm ms':>13}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row[0]:<16}{row[1]:>9.1f}{row[2]:>12.1f}{row[3]:>13.1f}{row[4]:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# scripts/bench_snapshot.py
+"""
+Benchmark of the on-disk embedding snapshot formats (float32, float16, int8).
+
+The question bank is embedded once; each format is then written to a
+temporary directory and reopened through LocalVectorStore.load_snapshot.
+For every format it reports the size on disk, the time to open the snapshot,
+the resident memory it adds after one full scan, the median query latency,
+and recall@k against exact float32 search.
+
+Queries are question embeddings with gaussian noise added, so they land near,
+but not exactly on, indexed questions.
+
+Usage:
+    python scripts/bench_snapshot.py --input questions.txt --queries 200 --top-k 7
+"""
+import argparse
+import json
+import os
+import pathlib
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# --- Boilerplate to set up path for imports ---
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+# --- End Boilerplate ---
+
+from interview_system.services.embedding_snapshot import QUANTIZATIONS
+from interview_system.services.local_store import LocalVectorStore
+
+INPUT_FILE = "questions.txt"
+
+
+def resident_mb() -> float:
+    """Current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def directory_mb(path: str) -> float:
+    return sum(f.stat().st_size for f in pathlib.Path(path).iterdir()) / (1024 * 1024)
+
+
+def make_queries(vectors: np.ndarray, count: int, noise: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    picks = vectors[rng.choice(len(vectors), size=min(count, len(vectors)), replace=False)]
+    queries = picks + rng.normal(scale=noise, size=picks.shape).astype(np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def top_ids(store: LocalVectorStore, queries: np.ndarray, top_k: int):
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        hits = store.query_similar("", top_k, {}, query_vector=query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append({hit["id"] for hit in hits})
+    return results, latencies
+
+
+def run(args) -> None:
+    with open(args.input, "r", encoding="utf-8") as f:
+        questions = json.load(f)
+
+    print(f"Embedding {len(questions)} questions...")
+    reference = LocalVectorStore()
+    reference.upsert_questions(questions)
+    vectors = reference._partition(None).dense()
+    queries = make_queries(vectors, args.queries, args.noise)
+    exact, _ = top_ids(reference, queries, args.top_k)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for dtype in QUANTIZATIONS:
+            directory = os.path.join(tmp, dtype)
+            reference.save_snapshot(directory, dtype=dtype)
+
+            open_times = []
+            for _ in range(args.repeats):
+                store = LocalVectorStore()
+                start = time.perf_counter()
+                store.load_snapshot(directory)
+                open_times.append((time.perf_counter() - start) * 1000)
+
+            rss_before = resident_mb()
+            found, latencies = top_ids(store, queries, args.top_k)
+            rss_added = resident_mb() - rss_before
+
+            recall = statistics.fmean(
+                len(f & e) / max(len(e), 1) for f, e in zip(found, exact)
+            )
+            rows.append(
+                (
+                    dtype,
+                    directory_mb(directory),
+                    statistics.median(open_times),
+                    rss_added,
+                    statistics.median(latencies),
+                    recall,
+                )
+            )
+
+    header = (
+        f"{'format':<10}{'disk MB':>10}{'open ms':>10}{'+RSS MB':>10}"
+        f"{'query ms':>10}{f'recall@{args.top_k}':>12}"
+    )
+    print()
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row[0]:<10}{row[1]:>10.2f}{row[2]:>10.1f}{row[3]:>10.2f}"
+            f"{row[4]:>10.2f}{row[5]:>12.4f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare load time, memory and recall of embedding snapshot formats."
+    )
+    parser.add_argument("--input", type=str, default=INPUT_FILE)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=7)
+    parser.add_argument("--noise", type=float, default=0.02)
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Snapshot opens timed per format."
+    )
+    args = parser.parse_args()
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# scripts/generate_question_variants.py
+"""
+Offline batch job that pre-generates conversational variants for the
+question bank, so retrieval can present a bank question with zero LLM latency.
+
+It fills in `conversational_variants` for every question in questions.txt
+that has none (written back to the file, so the next seed run indexes them),
+and, with --update-db, for every row of the questions_meta table.
+
+Usage:
+    python scripts/generate_question_variants.py --variants 3 --concurrency 8
+    python scripts/generate_question_variants.py --update-db
+"""
+import argparse
+import asyncio
+import json
+import os
+import pathlib
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# --- Boilerplate to set up path for imports ---
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+# --- End Boilerplate ---
+
+from interview_system.agents.question_retrieval import generate_conversational_variants
+from interview_system.api.database import get_db_session
+from interview_system.repositories.question_repository import QuestionRepository
+
+INPUT_FILE = "questions.txt"
+
+
+async def generate_all(
+    texts: dict[str, str], count: int, concurrency: int
+) -> dict[str, list[str]]:
+    """Generates variants for {id: text}, at most `concurrency` calls at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    results: dict[str, list[str]] = {}
+    done = 0
+
+    async def worker(question_id: str, text: str) -> None:
+        nonlocal done
+        async with semaphore:
+            try:
+                results[question_id] = await generate_conversational_variants(
+                    text, count
+                )
+            except Exception as e:
+                print(f"  - Skipping {question_id[:12]}...: {e}")
+        done += 1
+        if done % 25 == 0 or done == len(texts):
+            print(f"  Generated {done}/{len(texts)}")
+
+    await asyncio.gather(*(worker(qid, text) for qid, text in texts.items()))
+    return results
+
+
+async def run(args) -> None:
+    # 1. Questions from the seed file
+    with open(args.input, "r", encoding="utf-8") as f:
+        questions = json.load(f)
+    pending = {
+        q["id"]: q["text"]
+        for q in questions
+        if not q.get("conversational_variants") or args.force
+    }
+
+    # 2. Questions that only exist in the database (e.g. approved fallbacks)
+    if args.update_db:
+        with get_db_session() as db:
+            for row in QuestionRepository(db).get_without_variants():
+                pending.setdefault(row.id, row.text)
+
+    print(f"--- Generating {args.variants} variants for {len(pending)} questions ---")
+    variants = await generate_all(pending, args.variants, args.concurrency)
+
+    # 3. Write back to the seed file, so the next seed run indexes the variants
+    for q in questions:
+        if q["id"] in variants:
+            q["conversational_variants"] = variants[q["id"]]
+    with open(args.input, "w", encoding="utf-8") as f:
+        json.dump(questions, f, indent=2, ensure_ascii=False)
+    print(f"Updated {args.input}.")
+
+    # 4. Store them with the question metadata in the database
+    if args.update_db:
+        updated = 0
+        with get_db_session() as db:
+            repo = QuestionRepository(db)
+            for question_id, question_variants in variants.items():
+                updated += repo.set_conversational_variants(
+                    question_id, question_variants
+                )
+        print(f"Updated {updated} rows in questions_meta.")
+
+    print(
+        "\nRe-run scripts/seed_database.py so the vector index picks up the variants."
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pre-generate conversational variants for the question bank."
+    )
+    parser.add_argument("--input", type=str, default=INPUT_FILE)
+    parser.add_argument("--variants", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--update-db",
+        action="store_true",
+        help="Also fill in variants for rows of the questions_meta table.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate variants even for questions that already have them.",
+    )
+    args = parser.parse_args()
+
+    if not os.getenv("GOOGLE_API_KEY"):
+        print("Error: GOOGLE_API_KEY must be set in .env file.")
+        return
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
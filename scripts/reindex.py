@@ -0,0 +1,327 @@
+# scripts/reindex.py
+"""
+Blue/green reindexing of the question bank.
+
+Interviews always query a logical namespace (QUESTION_NAMESPACE). Behind it,
+the index_aliases table points at one versioned build, e.g.
+'updated-namespace.v2'. A new embedding model or text template is built
+into a fresh version next to the live one, compared against it, and then
+switched to with a single row update. The previous version is left intact,
+so a rollback is another row update.
+
+The embedding settings (EMBEDDING_MODEL_NAME, QUESTION_TEXT_TEMPLATE) are
+read from the environment, so a build with a new model looks like:
+
+    EMBEDDING_MODEL_NAME=all-mpnet-base-v2 python scripts/reindex.py build --version v2
+
+Commands:
+    build --version V     Embed the bank into '<namespace>.V'. Re-running it
+                          only syncs what changed (e.g. newly approved questions).
+    compare --version V   Shadow-query V and the live version with the same
+                          questions; report recall, overlap and latency.
+    flip --version V      Point the alias at V. Workers follow within
+                          INDEX_ALIAS_TTL_SECONDS.
+    rollback              Point the alias back at the previous version.
+    list                  Show the versions and where the alias points.
+"""
+import argparse
+import os
+import pathlib
+import random
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# --- Boilerplate to set up path for imports ---
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+# --- End Boilerplate ---
+
+from interview_system.api.database import get_db_session
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.repositories.index_alias_repository import IndexAliasRepository
+from interview_system.repositories.question_repository import QuestionRepository
+from interview_system.services.embeddings import (
+    EMBEDDING_MODEL_NAME,
+    QUESTION_TEXT_TEMPLATE,
+    embed_texts,
+)
+from interview_system.services.index_aliases import version_namespace
+from interview_system.services.index_sync import IndexSync
+from interview_system.services.namespaces import resolve_namespace, shard_namespace
+from interview_system.services.question_bank import load_question_bank
+from interview_system.services.vector_store import get_vector_store
+
+
+def backend_store():
+    # Versions are addressed by their physical namespace; skip alias resolution.
+    store = get_vector_store()
+    return getattr(store, "store", store)
+
+
+def manifest_path(namespace: str) -> str:
+    backend = vector_store_settings.VECTOR_STORE_BACKEND
+    return os.path.join(
+        vector_store_settings.SYNC_MANIFEST_DIR, f"{backend}-{namespace}.json"
+    )
+
+
+# --- build ---
+
+
+def build(args) -> None:
+    alias = resolve_namespace(args.alias)
+    namespace = version_namespace(alias, args.version)
+    with get_db_session() as db:
+        repo = IndexAliasRepository(db)
+        existing = repo.get_version(namespace)
+        if existing is not None and existing.status == "live":
+            print(f"Error: {namespace} is live; build a new version instead.")
+            return
+        repo.save_version(
+            namespace,
+            alias,
+            args.version,
+            EMBEDDING_MODEL_NAME,
+            QUESTION_TEXT_TEMPLATE,
+            status="building",
+        )
+
+    print(f"Building {namespace} with {EMBEDDING_MODEL_NAME}.")
+    store = backend_store()
+    sync = IndexSync(
+        store,
+        namespace,
+        manifest_path(namespace),
+        backend=vector_store_settings.VECTOR_STORE_BACKEND,
+    )
+    sync.load_manifest()
+    questions = load_question_bank()
+    plan = sync.plan(questions)
+    print(f"Bank has {len(questions)} questions: {plan.summary()}.")
+
+    if getattr(store, "metadata_mode", "full") == "slim":
+        changed = [item for items in plan.upserts.values() for item in items]
+        if changed:
+            with get_db_session() as db:
+                QuestionRepository(db).upsert_many(changed)
+    sync.apply(plan)
+
+    with get_db_session() as db:
+        IndexAliasRepository(db).save_version(
+            namespace,
+            alias,
+            args.version,
+            EMBEDDING_MODEL_NAME,
+            QUESTION_TEXT_TEMPLATE,
+            status="ready",
+            question_count=len(sync.entries),
+        )
+    print(f"{namespace} is ready with {len(sync.entries)} questions.")
+
+
+# --- compare ---
+
+
+def _version_settings(repo: IndexAliasRepository, namespace: str) -> tuple:
+    version = repo.get_version(namespace)
+    if version is None:
+        # A namespace indexed before versioning: built with today's settings.
+        return namespace, EMBEDDING_MODEL_NAME
+    return namespace, version.model
+
+
+def _run_queries(store, namespace: str, model: str, queries, top_k: int) -> tuple:
+    vectors = embed_texts([q["text"] for q in queries], model_name=model)
+    results, latencies = [], []
+    for q, vector in zip(queries, vectors):
+        target = namespace
+        if vector_store_settings.DOMAIN_SHARDING_ENABLED:
+            target = shard_namespace(namespace, q["domain"])
+        start = time.perf_counter()
+        matches = store.query_similar(
+            "", top_k, {}, namespace=target, query_vector=vector.tolist()
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([m["id"] for m in matches])
+    return results, latencies
+
+
+def compare(args) -> None:
+    alias = resolve_namespace(args.alias)
+    with get_db_session() as db:
+        repo = IndexAliasRepository(db)
+        entry = repo.get_alias(alias)
+        live = _version_settings(repo, entry.target if entry else alias)
+        shadow = _version_settings(repo, version_namespace(alias, args.version))
+
+    questions = load_question_bank()
+    queries = random.Random(args.seed).sample(
+        questions, min(args.queries, len(questions))
+    )
+    store = backend_store()
+    print(
+        f"Shadow-querying {len(queries)} questions against live {live[0]} "
+        f"({live[1]}) and {shadow[0]} ({shadow[1]}).\n"
+    )
+
+    rows, top_ids = [], []
+    for label, (namespace, model) in (("live", live), ("shadow", shadow)):
+        ids, latencies = _run_queries(store, namespace, model, queries, args.top_k)
+        top_ids.append(ids)
+        recall = statistics.fmean(q["id"] in r for q, r in zip(queries, ids))
+        p95 = sorted(latencies)[int(0.95 * (len(latencies) - 1))]
+        rows.append((label, namespace, recall, statistics.median(latencies), p95))
+
+    overlap = statistics.fmean(
+        len(set(a) & set(b)) / max(len(a), 1) for a, b in zip(*top_ids)
+    )
+
+    header = (
+        f"{'':<8}{'namespace':<36}{f'R@{args.top_k}':>8}{'p50 ms':>9}{'p95 ms':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for label, namespace, recall, p50, p95 in rows:
+        print(f"{label:<8}{namespace:<36}{recall:>8.3f}{p50:>9.1f}{p95:>9.1f}")
+    print(f"\nTop-{args.top_k} overlap between live and shadow: {overlap:.3f}")
+
+
+# --- flip / rollback / list ---
+
+
+def flip(args) -> None:
+    alias = resolve_namespace(args.alias)
+    namespace = version_namespace(alias, args.version)
+    with get_db_session() as db:
+        repo = IndexAliasRepository(db)
+        version = repo.get_version(namespace)
+        if version is None:
+            print(f"Error: {namespace} has not been built.")
+            return
+        if version.status not in ("ready", "live") and not args.force:
+            print(
+                f"Error: {namespace} is '{version.status}'. "
+                "Use --force to flip anyway."
+            )
+            return
+        if repo.get_alias(alias) is None:
+            # The first flip: keep the unversioned namespace for rollback.
+            if repo.get_version(alias) is None:
+                repo.save_version(
+                    alias,
+                    alias,
+                    "legacy",
+                    EMBEDDING_MODEL_NAME,
+                    QUESTION_TEXT_TEMPLATE,
+                    status="live",
+                )
+            repo.point_alias(alias, alias)
+        entry = repo.point_alias(alias, namespace)
+        previous = entry.previous_target
+        built_with = version.model
+        mismatch = (version.model, version.text_template) != (
+            EMBEDDING_MODEL_NAME,
+            QUESTION_TEXT_TEMPLATE,
+        )
+
+    print(f"'{alias}' now points at {namespace} (previously {previous}).")
+    if mismatch:
+        print(
+            f"Note: {namespace} was built with {built_with}. Workers still "
+            f"configured with other embedding settings keep serving {previous} "
+            "until they are redeployed."
+        )
+    print(
+        f"Workers pick up the change within "
+        f"{vector_store_settings.INDEX_ALIAS_TTL_SECONDS}s."
+    )
+
+
+def rollback(args) -> None:
+    alias = resolve_namespace(args.alias)
+    with get_db_session() as db:
+        repo = IndexAliasRepository(db)
+        entry = repo.get_alias(alias)
+        if entry is None or not entry.previous_target:
+            print(f"Error: '{alias}' has no previous version to roll back to.")
+            return
+        current = entry.target
+        entry = repo.point_alias(alias, entry.previous_target)
+        target = entry.target
+    print(f"'{alias}' rolled back from {current} to {target}.")
+
+
+def list_versions(args) -> None:
+    alias = resolve_namespace(args.alias)
+    with get_db_session() as db:
+        repo = IndexAliasRepository(db)
+        entry = repo.get_alias(alias)
+        target = entry.target if entry else alias
+        previous = entry.previous_target if entry else None
+        versions = [
+            (v.namespace, v.status, v.model, v.question_count)
+            for v in repo.get_versions(alias)
+        ]
+    print(f"'{alias}' -> {target}" + (f" (previous: {previous})" if previous else ""))
+    for namespace, status, model, count in versions:
+        marker = "*" if namespace == target else " "
+        print(f" {marker} {namespace:<36}{status:<10}{model:<28}{count:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build, compare and switch versioned question indexes."
+    )
+    parser.add_argument(
+        "--alias",
+        type=str,
+        help="Logical namespace to manage. If not provided, QUESTION_NAMESPACE is used.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Build or update a version.")
+    build_parser.add_argument("--version", type=str, required=True)
+    build_parser.set_defaults(handler=build)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Shadow-query a version against the live one."
+    )
+    compare_parser.add_argument("--version", type=str, required=True)
+    compare_parser.add_argument("--queries", type=int, default=200)
+    compare_parser.add_argument("--top-k", type=int, default=7)
+    compare_parser.add_argument("--seed", type=int, default=0)
+    compare_parser.set_defaults(handler=compare)
+
+    flip_parser = commands.add_parser("flip", help="Point the alias at a version.")
+    flip_parser.add_argument("--version", type=str, required=True)
+    flip_parser.add_argument("--force", action="store_true")
+    flip_parser.set_defaults(handler=flip)
+
+    rollback_parser = commands.add_parser(
+        "rollback", help="Point the alias back at the previous version."
+    )
+    rollback_parser.set_defaults(handler=rollback)
+
+    list_parser = commands.add_parser("list", help="Show versions and the alias.")
+    list_parser.set_defaults(handler=list_versions)
+
+    args = parser.parse_args()
+
+    if vector_store_settings.VECTOR_STORE_BACKEND == "local":
+        print("The local backend is rebuilt on every start; it has no versions.")
+        return
+    if args.command in ("build", "compare") and not os.getenv("PINECONE_API_KEY"):
+        print("Error: PINECONE_API_KEY must be set in .env file.")
+        return
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import hashlib
 import os
@@ -14,9 +15,28 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 # --- End Boilerplate ---
 
+from interview_system.api.database import get_db_session
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.repositories.question_repository import QuestionRepository
+from interview_system.services.dedupe import (
+    DEFAULT_THRESHOLD,
+    cluster_near_duplicates,
+    drop_duplicates,
+    write_report,
+)
+from interview_system.services.embedding_snapshot import QUANTIZATIONS
+from interview_system.services.ingestion import (
+    IngestCheckpoint,
+    IngestionPipeline,
+    checkpoint_header,
+    transform_question,
+)
+from interview_system.services.local_store import LocalVectorStore
+from interview_system.services.namespaces import group_by_namespace, resolve_namespace
 from interview_system.services.vector_store import get_vector_store
 
 INPUT_FILE = "questions.txt"
+DEDUPE_REPORT_FILE = "dedupe_report.json"
 
 
 def process_questions(questions: list) -> list:
@@ -41,25 +61,67 @@ def process_questions(questions: list) -> list:
         print("No duplicate question texts found.")
 
     for q in questions:
-        original_id = q.get("id", "")
-        original_domain = q.get("domain", "")
-        question_text = q.get("text", "")
-        new_id = hashlib.sha256(question_text.encode("utf-8")).hexdigest()
-        new_domain = original_domain
-        if original_id.startswith("q-") and original_id.count("-") >= 2:
-            parts = original_id.split("-")
-            topic = "-".join(parts[1:-1])
-            if topic:
-                new_domain = f"{original_domain}-{topic}"
-        if q.get("rubric_id") is None:
-            q["rubric_id"] = ""
-        q["id"] = new_id
-        q["domain"] = new_domain
-        transformed_questions.append(q)
+        transformed_questions.append(transform_question(q))
 
     return transformed_questions
 
 
+def stream_questions(args) -> None:
+    """
+    Streams the input file into the vector store (see services/ingestion.py),
+    resuming from the checkpoint of an interrupted run.
+    """
+    if not os.path.isfile(args.input):
+        print(f"Error reading {args.input}: no such file.")
+        return
+    store = get_vector_store()
+    if args.metadata_mode and hasattr(store, "metadata_mode"):
+        store.metadata_mode = args.metadata_mode
+    namespace = resolve_namespace(args.namespace)
+    checkpoint_path = args.checkpoint or os.path.join(
+        vector_store_settings.INGEST_CHECKPOINT_DIR,
+        f"{vector_store_settings.VECTOR_STORE_BACKEND}-{namespace}.json",
+    )
+    checkpoint = IngestCheckpoint(
+        checkpoint_path, checkpoint_header(args.input, namespace, store)
+    )
+    if not args.restart:
+        checkpoint.load()
+    if checkpoint.complete:
+        print(
+            f"{args.input} is already ingested into '{namespace}' "
+            f"(checkpoint {checkpoint_path}). Use --restart to ingest it again."
+        )
+        return
+    if checkpoint.records_done:
+        print(f"Resuming after record {checkpoint.records_done} ({checkpoint_path}).")
+
+    pipeline = IngestionPipeline(
+        store,
+        args.input,
+        namespace,
+        checkpoint,
+        batch_size=args.batch_size,
+    )
+    print(f"\n--- Streaming {args.input} into namespace '{namespace}' ---")
+    try:
+        asyncio.run(pipeline.run())
+    except (OSError, ValueError) as e:
+        print(f"Error reading {args.input}: {e}")
+    finally:
+        print(
+            f"\n{checkpoint.records_done} records done in "
+            f"{pipeline.elapsed_seconds:.1f}s ({pipeline.skipped} skipped from "
+            f"the checkpoint, {pipeline.duplicate_texts} duplicate texts)."
+        )
+        print(f"{'stage':<10}{'records':>10}{'busy s':>10}{'records/s':>12}")
+        for stats in pipeline.stats.values():
+            print(
+                f"{stats.name:<10}{stats.records:>10}"
+                f"{stats.busy_seconds:>10.1f}{stats.rate:>12.0f}"
+            )
+
+
 def main():
     """
     Main function to read, process, and upsert questions into a specified namespace.
@@ -71,43 +133,159 @@ def main():
     parser.add_argument(
         "--namespace",
         type=str,
-        help="The Pinecone namespace to upsert the questions into. If not provided, the default namespace is used.",
+        help="The Pinecone namespace to upsert the questions into. If not provided, QUESTION_NAMESPACE is used.",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        help="Write a memory-mapped embedding snapshot to this directory instead of upserting to Pinecone.",
+    )
+    parser.add_argument(
+        "--quantize",
+        type=str,
+        choices=QUANTIZATIONS,
+        default="float16",
+        help="Storage type of the snapshot embeddings (default: float16).",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Cluster near-duplicate questions by embedding similarity and write a report.",
+    )
+    parser.add_argument(
+        "--dedupe-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Cosine similarity at which two questions are near-duplicates (default: {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "--dedupe-report",
+        type=str,
+        default=DEDUPE_REPORT_FILE,
+        help=f"Where to write the near-duplicate report (default: {DEDUPE_REPORT_FILE}).",
+    )
+    parser.add_argument(
+        "--drop-duplicates",
+        action="store_true",
+        help="Implies --dedupe. Keep only the canonical question of each near-duplicate cluster.",
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=INPUT_FILE,
+        help=f"Questions file: a JSON array or JSON Lines (default: {INPUT_FILE}).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the file through a concurrent, resumable pipeline instead of loading it whole.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        help="Checkpoint file for --stream (default: one per backend and namespace in INGEST_CHECKPOINT_DIR).",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="With --stream, ignore the checkpoint and start from the first record.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=vector_store_settings.INGEST_BATCH_SIZE,
+        help="Questions per batch moving through the --stream pipeline.",
+    )
+    parser.add_argument(
+        "--metadata-mode",
+        type=str,
+        choices=("full", "slim"),
+        help="Override VECTOR_METADATA_MODE. 'slim' also writes the questions to questions_meta.",
     )
     args = parser.parse_args()
 
     # 2. Load environment variables
     load_dotenv()
-    if not all(os.getenv(k) for k in ["PINECONE_API_KEY"]):
+    if not args.snapshot and not all(os.getenv(k) for k in ["PINECONE_API_KEY"]):
         print("Error: PINECONE_API_KEY must be set in .env file.")
         return
 
+    if args.stream:
+        if args.snapshot or args.dedupe or args.drop_duplicates:
+            print("Error: --stream cannot be combined with --snapshot or --dedupe.")
+            return
+        stream_questions(args)
+        return
+
     # 3. Load and process questions from the file
     try:
-        with open(INPUT_FILE, "r", encoding="utf-8") as f:
+        with open(args.input, "r", encoding="utf-8") as f:
             questions_data = json.load(f)
-        print(f"Loaded {len(questions_data)} questions from {INPUT_FILE}.")
+        print(f"Loaded {len(questions_data)} questions from {args.input}.")
     except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"Error reading {INPUT_FILE}: {e}")
+        print(f"Error reading {args.input}: {e}")
         return
 
     questions_to_upsert = process_questions(questions_data)
 
+    if args.dedupe or args.drop_duplicates:
+        print(
+            "\n--- Checking for near-duplicate questions "
+            f"(similarity >= {args.dedupe_threshold}) ---"
+        )
+        clusters = cluster_near_duplicates(
+            questions_to_upsert, threshold=args.dedupe_threshold
+        )
+        write_report(
+            args.dedupe_report, questions_to_upsert, clusters, args.dedupe_threshold
+        )
+        duplicates = sum(len(cluster.duplicates) for cluster in clusters)
+        print(
+            f"Found {len(clusters)} clusters with {duplicates} near-duplicates; "
+            f"report written to {args.dedupe_report}."
+        )
+        if args.drop_duplicates:
+            questions_to_upsert = drop_duplicates(questions_to_upsert, clusters)
+            print(f"Kept {len(questions_to_upsert)} canonical questions.")
+
+    if args.snapshot:
+        print(f"\n--- Embedding questions and writing snapshot to {args.snapshot} ---")
+        store = LocalVectorStore()
+        store.upsert_questions(questions_to_upsert, namespace=args.namespace)
+        manifest = store.save_snapshot(
+            args.snapshot, namespace=args.namespace, dtype=args.quantize
+        )
+        print(
+            f"\nWrote {manifest['count']} {manifest['dtype']} embeddings "
+            f"(dim {manifest['dim']}) to {args.snapshot}."
+        )
+        return
+
     # 4. Connect to the vector store and upsert the data
     print("\n--- Connecting to vector store and upserting data ---")
     store = get_vector_store()
+    if args.metadata_mode and hasattr(store, "metadata_mode"):
+        store.metadata_mode = args.metadata_mode
 
-    # 5. Pass the namespace from the command-line to the upsert function
-    store.upsert_questions(questions_to_upsert, namespace=args.namespace)
+    # Slim vectors hold no question bodies; they are hydrated from questions_meta.
+    if getattr(store, "metadata_mode", "full") == "slim":
+        with get_db_session() as db:
+            written = QuestionRepository(db).upsert_many(questions_to_upsert)
+        print(f"Wrote {written} question bodies to questions_meta.")
+
+    # 5. Upsert into the namespace, or its per-domain shards when
+    # DOMAIN_SHARDING_ENABLED is set
+    namespace = resolve_namespace(args.namespace)
+    groups = group_by_namespace(questions_to_upsert, namespace)
+    for target, group in groups.items():
+        store.upsert_questions(group, namespace=target)
 
     # 6. Provide clear user feedback
-    if args.namespace:
-        print(
-            f"\nSuccessfully sent {len(questions_to_upsert)} records for upserting to namespace '{args.namespace}'."
-        )
-    else:
-        print(
-            f"\nSuccessfully sent {len(questions_to_upsert)} records for upserting to the default namespace."
-        )
+    print(
+        f"\nSuccessfully sent {len(questions_to_upsert)} records for upserting to "
+        f"namespace '{namespace}'"
+        + (f" ({len(groups)} domain shards)." if len(groups) > 1 else ".")
+    )
 
 
 if __name__ == "__main__":
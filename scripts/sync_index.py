@@ -0,0 +1,118 @@
+# scripts/sync_index.py
+"""
+Incrementally syncs the vector index with the question bank (questions.txt
+plus every row of questions_meta).
+
+Unlike seed_database.py, which re-embeds and re-upserts everything, this
+diffs the bank against a local manifest of content hashes: only new and
+changed questions are embedded and upserted, removed ones are deleted, and
+a run with nothing to do finishes without touching the index.
+
+Usage:
+    python scripts/sync_index.py            # sync QUESTION_NAMESPACE
+    python scripts/sync_index.py --dry-run  # only print the plan
+    python scripts/sync_index.py --verify   # also re-upsert vectors missing from the index
+    python scripts/sync_index.py --rebuild  # ignore the manifest, upsert everything
+"""
+import argparse
+import os
+import pathlib
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# --- Boilerplate to set up path for imports ---
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+# --- End Boilerplate ---
+
+from interview_system.api.database import get_db_session
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.repositories.question_repository import QuestionRepository
+from interview_system.services.index_aliases import index_aliases
+from interview_system.services.index_sync import IndexSync
+from interview_system.services.namespaces import resolve_namespace
+from interview_system.services.question_bank import load_question_bank
+from interview_system.services.vector_store import get_vector_store
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Sync the vector index with the question bank by content hash."
+    )
+    parser.add_argument(
+        "--namespace",
+        type=str,
+        help="Namespace to sync. If not provided, QUESTION_NAMESPACE is used.",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Print the plan without writing."
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check the index for every manifest entry and re-upsert missing ones.",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Ignore the manifest and upsert every question.",
+    )
+    args = parser.parse_args()
+
+    backend = vector_store_settings.VECTOR_STORE_BACKEND
+    if backend == "local":
+        print("The local backend is rebuilt on every start; there is nothing to sync.")
+        return
+    if not os.getenv("PINECONE_API_KEY"):
+        print("Error: PINECONE_API_KEY must be set in .env file.")
+        return
+
+    started = time.perf_counter()
+    # The manifest belongs to the version the alias currently points at.
+    namespace = index_aliases.resolve(resolve_namespace(args.namespace))
+    store = get_vector_store()
+    manifest_path = os.path.join(
+        vector_store_settings.SYNC_MANIFEST_DIR, f"{backend}-{namespace}.json"
+    )
+    sync = IndexSync(store, namespace, manifest_path, backend=backend)
+    if not args.rebuild:
+        sync.load_manifest()
+    print(f"Manifest lists {len(sync.entries)} indexed questions.")
+
+    if args.verify and sync.entries:
+        missing = sync.verify()
+        print(f"Verified the index: {missing} manifest entries have no vector.")
+
+    questions = load_question_bank()
+    plan = sync.plan(questions)
+    print(f"Bank has {len(questions)} questions: {plan.summary()}.")
+
+    if plan.empty or args.dry_run:
+        if args.verify and not args.dry_run:
+            sync.save_manifest()
+        print(f"Nothing written ({time.perf_counter() - started:.2f}s).")
+        return
+
+    # Slim vectors hold no question bodies; they are hydrated from questions_meta.
+    if getattr(store, "metadata_mode", "full") == "slim":
+        changed = [item for items in plan.upserts.values() for item in items]
+        if changed:
+            with get_db_session() as db:
+                written = QuestionRepository(db).upsert_many(changed)
+            print(f"Wrote {written} question bodies to questions_meta.")
+
+    sync.apply(plan)
+    print(
+        f"\nSynced namespace '{namespace}' in {time.perf_counter() - started:.1f}s "
+        f"({plan.summary()})."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,161 @@
 import json
+import logging
+from collections import defaultdict
+from typing import Any
 
+import numpy as np
 from jinja2 import Environment, FileSystemLoader
+from pydantic import BaseModel
 
 from interview_system.orchestration.state import SessionState
-from interview_system.schemas.agent_outputs import PersonalizationOutput
+from interview_system.schemas.agent_outputs import (
+    PersonalizationOutput,
+    PersonalizationReasonsOutput,
+    SessionFocus,
+)
 from interview_system.services.llm_clients import get_llm
 
+logger = logging.getLogger(__name__)
 
-async def create_personalization_plan(session_state: SessionState) -> PersonalizationOutput:
+# Plan steps that say nothing about the candidate's technical weak spots.
+NON_ASSESSED_TOPICS = {"introduction", "wrap_up"}
+MAX_FOCUS_TOPICS = 2
+MAX_RECOMMENDED_EXERCISES = 3
+# Every follow-up needed on a topic counts like 10 missing score points.
+FOLLOW_UP_PENALTY = 10.0
+
+
+class TopicSignal(BaseModel):
+    """Deterministic performance signals for one interview_plan topic."""
+
+    topic: str
+    question_count: int
+    # None when the topic only has unscored follow-ups
+    mean_score: float | None = None
+    min_score: float | None = None
+    follow_up_count: int
+    weakest_criterion: str | None = None
+    weakest_criterion_score: float | None = None
+    weakness: float
+    # Bank question IDs of the scored main questions, lowest score first
+    weakest_question_ids: list[str]
+
+
+def compute_topic_signals(question_history: list[dict[str, Any]]) -> list[TopicSignal]:
     """
-    Analyzes the full session to create a personalized plan for the next one.
+    Aggregates canonical scores, rubric criteria and follow-up counts per topic
+    and ranks the topics from weakest to strongest.
 
     Args:
-        session_state: The complete final state of the interview.
+        question_history: The serialized QuestionTurn dicts of the session.
 
     Returns:
-        A Pydantic object containing the personalization plan.
+        The topic signals, weakest first. Ties are broken by topic name so the
+        ranking is fully deterministic.
     """
+    scores: dict[str, list[float]] = defaultdict(list)
+    # (score, question ID) of scored main questions; follow-ups have no bank ID
+    questions: dict[str, list[tuple[float, str]]] = defaultdict(list)
+    follow_ups: dict[str, int] = defaultdict(int)
+    criteria: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+
+    for turn in question_history:
+        topic = turn.get("topic")
+        if not topic or topic in NON_ASSESSED_TOPICS:
+            continue
+
+        if turn.get("is_follow_up"):
+            follow_ups[topic] += 1
+
+        canonical = turn.get("evals", {}).get("canonical", {})
+        if "final_score" not in canonical:
+            continue
+        score = float(canonical["final_score"])
+        scores[topic].append(score)
+        if not turn.get("is_follow_up") and turn.get("question_id"):
+            questions[topic].append((score, turn["question_id"]))
+
+        per_rubric = (canonical.get("full_rubric") or {}).get("per_rubric", {})
+        for name, item in per_rubric.items():
+            # Rubric items are scored 1-10; keep them on the same 0-100 scale.
+            criteria[topic][name].append(float(item.get("score", 0)) * 10)
+
+    signals = []
+    for topic in scores.keys() | follow_ups.keys():
+        topic_scores = np.asarray(scores.get(topic, []), dtype=np.float64)
+        follow_up_count = follow_ups.get(topic, 0)
+        if topic_scores.size:
+            mean_score = round(float(topic_scores.mean()), 1)
+            min_score = round(float(topic_scores.min()), 1)
+            weakness = (100.0 - mean_score) + FOLLOW_UP_PENALTY * follow_up_count
+        else:
+            # Only unscored follow-ups: rank on those alone, without
+            # inventing a score.
+            mean_score = min_score = None
+            weakness = FOLLOW_UP_PENALTY * follow_up_count
+
+        weakest_criterion, weakest_criterion_score = None, None
+        if criteria.get(topic):
+            names = sorted(criteria[topic])
+            means = np.array([np.mean(criteria[topic][name]) for name in names])
+            weakest = int(np.argmin(means))
+            weakest_criterion = names[weakest]
+            weakest_criterion_score = round(float(means[weakest]), 1)
+
+        # Lowest-scoring questions first, for the exercise recommendations.
+        weakest_question_ids = [
+            question_id
+            for _, question_id in sorted(questions.get(topic, []), key=lambda q: q[0])
+        ]
+
+        signals.append(
+            TopicSignal(
+                topic=topic,
+                question_count=int(topic_scores.size),
+                mean_score=mean_score,
+                min_score=min_score,
+                follow_up_count=follow_up_count,
+                weakest_criterion=weakest_criterion,
+                weakest_criterion_score=weakest_criterion_score,
+                weakness=round(weakness, 1),
+                weakest_question_ids=weakest_question_ids,
+            )
+        )
+
+    return sorted(signals, key=lambda signal: (-signal.weakness, signal.topic))
+
+
+def _default_reason(signal: TopicSignal) -> str:
+    """A plain-language reason used when the LLM phrasing is unavailable."""
+    if signal.mean_score is None:
+        return (
+            f"Needed {signal.follow_up_count} follow-up(s) without a scored answer."
+        )
+    reason = (
+        f"Averaged {signal.mean_score} across {signal.question_count} question(s)"
+    )
+    if signal.weakest_criterion:
+        reason += (
+            f", weakest on '{signal.weakest_criterion}' "
+            f"({signal.weakest_criterion_score})"
+        )
+    if signal.follow_up_count:
+        reason += f", and needed {signal.follow_up_count} follow-up(s)"
+    return reason + "."
+
+
+async def _phrase_reasons(focus: list[TopicSignal]) -> dict[str, str]:
+    """Uses a fast LLM to turn the compact topic signals into short reasons."""
     env = Environment(loader=FileSystemLoader("src/interview_system/prompts/"))
     template = env.get_template("personalization_agent.j2")
 
-    prompt = template.render(session_history=session_state["question_history"])
+    prompt = template.render(
+        topic_signals=[
+            signal.model_dump(exclude={"weakest_question_ids"}) for signal in focus
+        ]
+    )
 
-    llm = get_llm(model_type="pro")  # Use Pro for insightful analysis
+    llm = get_llm(model_type="flash")  # Only phrasing is left for the model
     response = await llm.ainvoke(prompt)
 
     try:
@@ -30,8 +163,47 @@ async def create_personalization_plan(session_state: SessionState) -> Personaliz
         end_index = response.content.rfind("}") + 1
         json_str = response.content[start_index:end_index]
         response_data = json.loads(json_str)
-        return PersonalizationOutput(**response_data)
-    except (json.JSONDecodeError, KeyError) as exc:
+        return PersonalizationReasonsOutput(**response_data).reasons
+    except (json.JSONDecodeError, KeyError, ValueError) as exc:
         raise ValueError(
             f"PersonalizationAgent returned malformed JSON: {response.content}"
         ) from exc
+
+
+async def create_personalization_plan(session_state: SessionState) -> PersonalizationOutput:
+    """
+    Analyzes the full session to create a personalized plan for the next one.
+
+    Weak topics are ranked locally from the session's scores; the LLM is only
+    used to phrase the reason for each chosen topic.
+
+    Args:
+        session_state: The complete final state of the interview.
+
+    Returns:
+        A Pydantic object containing the personalization plan.
+    """
+    signals = compute_topic_signals(session_state["question_history"])
+    focus = signals[:MAX_FOCUS_TOPICS]
+
+    reasons: dict[str, str] = {}
+    if focus:
+        try:
+            reasons = await _phrase_reasons(focus)
+        except Exception as e:
+            logger.error(f"Failed to phrase personalization reasons: {e}")
+
+    exercises: list[str] = []
+    for signal in focus:
+        exercises.extend(signal.weakest_question_ids)
+
+    return PersonalizationOutput(
+        next_session_focus=[
+            SessionFocus(
+                topic=signal.topic,
+                reason=reasons.get(signal.topic) or _default_reason(signal),
+            )
+            for signal in focus
+        ],
+        recommended_exercises=exercises[:MAX_RECOMMENDED_EXERCISES],
+    )
@@ -1,17 +1,51 @@
 # src/interview_system/agents/question_retrieval.py
+import asyncio
 import json
 import logging
+import random
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from jinja2 import Environment, FileSystemLoader
 
+from interview_system.config.retrieval_config import retrieval_settings
+from interview_system.config.vector_store_config import vector_store_settings
 from interview_system.schemas.agent_outputs import (
     ConversationalQuestionOutput,
     JobDescriptionAnalysisOutput,
     RawQuestionData,
     ResumeAnalysisOutput,
 )
+from interview_system.services import metrics
+from interview_system.services.domain_catalog import domain_matches
+from interview_system.services.domain_taxonomy import domain_taxonomy
+from interview_system.services.embedding_service import embedding_batcher
+from interview_system.services.embeddings import (
+    embed_document,
+    question_embedding_text,
+)
+from interview_system.services.executors import (
+    embedding_executor,
+    io_executor,
+    run_in_executor,
+)
+from interview_system.services.hot_tier import hot_tier
+from interview_system.services.lexical_index import (
+    get_lexical_index,
+    reciprocal_rank_fusion,
+)
 from interview_system.services.llm_clients import get_llm
+from interview_system.services.namespaces import (
+    merge_results,
+    query_namespaces,
+    resolve_namespace,
+)
+from interview_system.services.provisional_questions import (
+    find_provisional_question,
+    provisional_domain,
+    question_fields,
+)
 from interview_system.services.vector_store import get_vector_store
 
 from ..api.database import get_db_session
@@ -20,6 +54,59 @@ from ..repositories.review_queue_repository import ReviewQueueRepository
 logger = logging.getLogger(__name__)
 
 FALLBACK_MIN_RELEVANCE = 0.35
+# Share of the retrieval query vector taken by the domain; the rest comes from
+# the candidate's resume/job profile. The domain must dominate the query.
+DOMAIN_WEIGHT = 0.6
+
+
+def _profile_text(resume_summary: dict | None, job_summary: dict | None) -> str:
+    """Flattens the resume and job summaries into one text for embedding."""
+    resume_summary = resume_summary or {}
+    job_summary = job_summary or {}
+    parts = [
+        "Skills: "
+        + ", ".join(skill.get("name", "") for skill in resume_summary.get("skills", [])),
+        "Topics: " + ", ".join(resume_summary.get("topics", [])),
+        "Experience: " + (resume_summary.get("experience_summary") or ""),
+        "Projects: "
+        + "; ".join(
+            f"{project.get('title', '')}: {project.get('summary', '')}"
+            for project in resume_summary.get("projects", [])
+        ),
+        "Required skills: " + ", ".join(job_summary.get("required_skills", [])),
+        "Keywords: " + ", ".join(job_summary.get("keywords", [])),
+        "Seniority: " + (job_summary.get("seniority") or ""),
+    ]
+    return "\n".join(parts)
+
+
+def embed_session_profile(
+    resume_summary: dict | None, job_summary: dict | None
+) -> list[float]:
+    """
+    Embeds the resume and job summaries once per session. Every retrieval in
+    the session reuses this vector instead of re-deriving a query with an LLM.
+    """
+    return embed_document(_profile_text(resume_summary, job_summary)).tolist()
+
+
+@lru_cache(maxsize=1024)
+def _domain_vector(domain: str) -> np.ndarray:
+    """
+    The embedding of a domain in the same "Domain: X." form the question bank
+    was indexed with. Computed once per domain per process.
+    """
+    domain_text = domain.replace(":", " ").replace("_", " ").replace("-", " ")
+    return embedding_batcher.embed([f"Domain: {domain_text}."])[0]
+
+
+def build_query_vector(profile_embedding: list[float], domain: str) -> list[float]:
+    """Blends the session profile with the domain vector into a unit query vector."""
+    blended = DOMAIN_WEIGHT * _domain_vector(domain) + (1.0 - DOMAIN_WEIGHT) * np.asarray(
+        profile_embedding, dtype=np.float32
+    )
+    norm = np.linalg.norm(blended)
+    return (blended / norm if norm else blended).tolist()
 
 
 async def _transform_query(
@@ -27,6 +114,9 @@ async def _transform_query(
 ) -> str:
     """
     Uses a fast LLM to transform resume and job summaries into a natural language query.
+
+    No longer on the retrieval path (see build_query_vector); kept as the
+    baseline for scripts/bench_query_strategies.py.
     """
     env = Environment(loader=FileSystemLoader("src/interview_system/prompts/"))
     template = env.get_template("query_transformer.j2")
@@ -52,15 +142,54 @@ async def _make_question_conversational(
     )
 
 
+async def generate_conversational_variants(question_text: str, count: int = 3) -> list[str]:
+    """
+    Uses a fast LLM to pre-generate several conversational phrasings of a bank
+    question. Run offline (scripts/generate_question_variants.py), never per turn.
+    """
+    env = Environment(loader=FileSystemLoader("src/interview_system/prompts/"))
+    template = env.get_template("conversational_variants.j2")
+    prompt = template.render(question_text=question_text, count=count)
+    llm = get_llm(model_type="flash")
+    response = await llm.ainvoke(prompt)
+
+    try:
+        start_index = response.content.find("{")
+        end_index = response.content.rfind("}") + 1
+        data = json.loads(response.content[start_index:end_index])
+        variants = [str(v).strip() for v in data["variants"] if str(v).strip()]
+    except (json.JSONDecodeError, KeyError, TypeError) as exc:
+        raise ValueError(
+            f"Variant generation returned malformed JSON: {response.content}"
+        ) from exc
+    if not variants:
+        raise ValueError("Variant generation returned no variants.")
+    return variants[:count]
+
+
+def _present_question(
+    raw_question: RawQuestionData, variants: List[str] | None
+) -> ConversationalQuestionOutput | None:
+    """Picks a pre-generated conversational variant, if the question has any."""
+    if not variants:
+        return None
+    return ConversationalQuestionOutput(
+        conversational_text=random.choice(variants), raw_question=raw_question
+    )
+
+
 async def _generate_and_present_fallback(
     domain: str,
     difficulty: int,
     last_topics: List[str],
     resume_summary: dict | None,
     job_summary: dict | None,
+    domains: List[str] | None = None,
 ) -> ConversationalQuestionOutput:
     """
     If no relevant question is found, generates a new one and presents it.
+    The question is queued for review together with its embedding, so later
+    sessions can reuse it before it is approved.
     """
     env = Environment(loader=FileSystemLoader("src/interview_system/prompts/"))
     template = env.get_template("generate_and_present_fallback.j2")
@@ -92,9 +221,20 @@ async def _generate_and_present_fallback(
         json_str = response.content[start_index:end_index]
         data = json.loads(json_str)
         try:
+            filed_under = provisional_domain(domain, domains or [])
+            question_text = question_fields(data).get("text")
+            embedding = None
+            if question_text:
+                text = question_embedding_text(
+                    {"domain": filed_under, "text": question_text}
+                )
+                vectors = await embedding_batcher.aembed([text])
+                embedding = vectors[0].tolist()
             with get_db_session() as db:
                 repo = ReviewQueueRepository(db)
-                repo.create_pending_question(question_json=data)
+                repo.create_pending_question(
+                    question_json=data, domain=filed_under, embedding=embedding
+                )
             logger.info(
                 f"Successfully saved fallback question for '{domain}' to review queue."
             )
@@ -141,6 +281,145 @@ async def _generate_and_present_fallback(
         )
 
 
+async def _query_candidates(
+    store,
+    namespace: str,
+    domain: str,
+    domains: List[str],
+    where: Dict[str, Any],
+    top_k: int,
+    query_vector: List[float],
+) -> List[Dict[str, Any]]:
+    """
+    Vector candidates, fused with BM25 candidates for the topic's words when
+    hybrid retrieval is on. Both searches run concurrently off the loop.
+    """
+    vector_search = _vector_candidates(
+        store, namespace, domain, domains, where, top_k, query_vector
+    )
+    # The BM25 index holds the default bank only, so it must not answer
+    # sessions bound to another namespace.
+    if not (
+        retrieval_settings.HYBRID_RETRIEVAL_ENABLED
+        and namespace == resolve_namespace()
+    ):
+        return await vector_search
+
+    lexical_query = domain.replace(":", " ").replace("-", " ").replace("_", " ")
+    vector_results, lexical_results = await asyncio.gather(
+        vector_search,
+        run_in_executor(
+            embedding_executor, _lexical_candidates, lexical_query, top_k, where
+        ),
+    )
+    return reciprocal_rank_fusion(
+        [vector_results, lexical_results], k=retrieval_settings.RRF_K
+    )[:top_k]
+
+
+def _lexical_candidates(
+    query_text: str, top_k: int, where: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    return get_lexical_index().search(query_text, top_k, where)
+
+
+def _hot_tier_active(namespace: str) -> bool:
+    # Like the BM25 index, the hot tier is a copy of the default bank.
+    return (
+        retrieval_settings.HOT_TIER_ENABLED
+        and vector_store_settings.VECTOR_STORE_BACKEND != "local"
+        and namespace == resolve_namespace()
+    )
+
+
+async def _vector_candidates(
+    store,
+    namespace: str,
+    domain: str,
+    domains: List[str],
+    where: Dict[str, Any],
+    top_k: int,
+    query_vector: List[float],
+) -> List[Dict[str, Any]]:
+    # Hot domains are answered from process memory; cold ones go remote.
+    if _hot_tier_active(namespace):
+        results = await run_in_executor(
+            embedding_executor, hot_tier.query, domains, where, top_k, query_vector
+        )
+        if results is not None:
+            return results
+
+    # One namespace, or with domain sharding one per requested domain. Shards
+    # are queried concurrently and share a single timeout.
+    if vector_store_settings.DOMAIN_SHARDING_ENABLED:
+        # May reload the domain catalog (a file and a database read).
+        namespaces = await run_in_executor(
+            io_executor, query_namespaces, namespace, domains
+        )
+    else:
+        namespaces = query_namespaces(namespace, domains)
+    if len(namespaces) > 1:
+        metrics.increment("retrieval.shard_fanouts")
+    searches = [
+        asyncio.ensure_future(
+            store.aquery_similar(
+                query_text=domain,
+                top_k=top_k,
+                where=where,
+                namespace=target,
+                query_vector=query_vector,
+            )
+        )
+        for target in namespaces
+    ]
+    done, pending = await asyncio.wait(
+        searches, timeout=vector_store_settings.VECTOR_QUERY_TIMEOUT_SECONDS
+    )
+    if pending:
+        # A slow vector store should not hold up the interview: use the shards
+        # that answered, or generate instead if none did. Cancelling abandons
+        # the call; its worker thread still runs it to the end.
+        for search in pending:
+            search.cancel()
+        logger.warning(
+            f"Vector store query for '{domain}' timed out on "
+            f"{len(pending)} of {len(searches)} namespace(s)."
+        )
+        metrics.increment("retrieval.vector_query_timeouts")
+    # Failed shards are skipped like timed-out ones.
+    failed = [s for s in searches if s in done and s.exception() is not None]
+    if failed:
+        logger.warning(
+            f"Vector store query for '{domain}' failed on {len(failed)} of "
+            f"{len(searches)} namespace(s): {failed[0].exception()}"
+        )
+        metrics.increment("retrieval.vector_query_errors")
+    return merge_results(
+        [s.result() for s in searches if s in done and s not in failed], top_k
+    )
+
+
+def _first_usable(
+    candidates: List[Dict[str, Any]],
+    domain: str,
+    domains: List[str],
+    asked_ids: List[str] | None,
+) -> Dict[str, Any] | None:
+    """
+    The most relevant candidate in the topic's resolved domains (or, if the
+    topic did not resolve, a suffix-matching domain) that was not asked yet.
+    """
+    for candidate in candidates:
+        candidate_id = str(candidate.get("id", ""))
+        if asked_ids and candidate_id in asked_ids:
+            logger.info(f"Skipping duplicate question ID: {candidate_id}")
+            continue
+        meta_domain = str((candidate.get("metadata", {}) or {}).get("domain", ""))
+        if meta_domain in domains or domain_matches(meta_domain, domain):
+            return candidate
+    return None
+
+
 async def retrieve_question(
     *,
     domain: str,
@@ -150,8 +429,11 @@ async def retrieve_question(
     difficulty_hint: int = 5,
     min_relevance: float = FALLBACK_MIN_RELEVANCE,
     asked_ids: List[str] | None = None,  # <--- NEW PARAMETER
+    profile_embedding: List[float] | None = None,
+    namespace: str | None = None,
 ) -> ConversationalQuestionOutput:
     logger.info(f"--- Agent: Retrieving question for domain: {domain} ---")
+    namespace = resolve_namespace(namespace)
 
     # This logic handles both dicts and Pydantic models
     resume_dict = None
@@ -170,70 +452,84 @@ async def retrieve_question(
         else:
             job_dict = job_analysis.model_dump()
 
-    transformed_query = await _transform_query(
-        resume_summary=resume_dict,
-        job_summary=job_dict,
-        domain=domain,
+    # The profile is normally computed once per session by the caller; the
+    # query itself is a local blend, with no LLM round trip per retrieval.
+    # Encodes run on the embedding pool so the event loop keeps serving
+    # other sessions meanwhile.
+    if profile_embedding is None:
+        profile_embedding = await run_in_executor(
+            embedding_executor, embed_session_profile, resume_dict, job_dict
+        )
+    query_vector = await run_in_executor(
+        embedding_executor, build_query_vector, profile_embedding, domain
     )
-    logger.info(f"Transformed query: {transformed_query}")
 
-    # --- RAG FIX ---
-    # 1. Build a filter *only* for difficulty.
-    difficulty_conditions: List[Dict[str, Any]] = []
+    # 1. Push every constraint into the store query: difficulty band, the
+    # stored domains matching the topic, and the questions already asked.
+    conditions: List[Dict[str, Any]] = []
     if difficulty_hint is not None:
-        difficulty_conditions.append(
-            {"difficulty": {"$gte": max(1, difficulty_hint - 2)}}
-        )
-        difficulty_conditions.append(
-            {"difficulty": {"$lte": min(10, difficulty_hint + 2)}}
-        )
+        conditions.append({"difficulty": {"$gte": max(1, difficulty_hint - 2)}})
+        conditions.append({"difficulty": {"$lte": min(10, difficulty_hint + 2)}})
 
-    where = (
-        {"$and": difficulty_conditions}
-        if len(difficulty_conditions) > 1
-        else (difficulty_conditions[0] if difficulty_conditions else {})
+    # Plan topics are free text ("technical:python-fundamentals"); the taxonomy
+    # maps them onto real bank domains ("technical-python").
+    domains = await run_in_executor(
+        embedding_executor, domain_taxonomy.resolve, domain
     )
+    if domains:
+        conditions.append({"domain": {"$in": domains}})
+    else:
+        # Unresolved; the suffix check in _first_usable still applies.
+        logger.info(f"No bank domain matches '{domain}', not filtering on it.")
+    if asked_ids:
+        conditions.append({"question_id": {"$nin": list(asked_ids)}})
 
-    store = get_vector_store()
-
-    # 2. Fetch more candidates
-    candidates = store.query_similar(
-        query_text=transformed_query,
-        top_k=7,  # Fetch 15 to account for filtered duplicates
-        where=where,
-        namespace="updated-namespace",
+    where = (
+        {"$and": conditions}
+        if len(conditions) > 1
+        else (conditions[0] if conditions else {})
     )
 
-    best_match = None
-
-    if candidates:
-        # 3. Filter in Python
-        for candidate in candidates:
-            # --- FILTERING LOGIC ---
-            candidate_id = str(candidate.get("id", ""))
-            if asked_ids and candidate_id in asked_ids:
-                logger.info(f"Skipping duplicate question ID: {candidate_id}")
-                continue
-            # -----------------------
-
-            meta = candidate.get("metadata", {}) or {}
-            meta_domain = str(meta.get("domain", "")).strip()
-
-            is_match = (
-                meta_domain == domain
-                or meta_domain.endswith(f"-{domain}")
-                or meta_domain.endswith(f":{domain}")
-            )
-
-            if is_match:
-                best_match = candidate
-                break  # Found the best, most relevant match
+    store = get_vector_store()
+    if _hot_tier_active(namespace):
+        hot_tier.record(domains)
+
+    # 2. Widen top_k until a usable candidate turns up or the store runs out
+    top_k = retrieval_settings.RETRIEVAL_TOP_K
+    while True:
+        candidates = await _query_candidates(
+            store, namespace, domain, domains, where, top_k, query_vector
+        )
+        # 3. Re-check in Python: vectors indexed before question_id was stored
+        # in metadata are not caught by the $nin filter.
+        best_match = _first_usable(candidates, domain, domains, asked_ids)
+        if (
+            best_match
+            or len(candidates) < top_k
+            or top_k >= retrieval_settings.RETRIEVAL_MAX_TOP_K
+        ):
+            break
+        top_k = min(
+            top_k * retrieval_settings.RETRIEVAL_TOP_K_GROWTH,
+            retrieval_settings.RETRIEVAL_MAX_TOP_K,
+        )
+        metrics.increment("retrieval.top_k_widened")
+        logger.info(f"No usable candidate for '{domain}', widening top_k to {top_k}.")
 
     if best_match:
-        relevance = float(best_match.get("relevance_score", 0.0))
-        logger.info(f"--- Best candidate relevance: {relevance} ---")
+        # Each retriever's score is held against its own threshold; the
+        # cosine threshold means nothing on the BM25 scale.
+        relevance = best_match.get("relevance_score")
+        if relevance is not None:
+            relevance = float(relevance)
+            logger.info(f"--- Best candidate relevance: {relevance} ---")
+            relevant = relevance >= min_relevance
+        else:
+            lexical = float(best_match.get("lexical_score", 0.0))
+            logger.info(f"--- Best candidate (BM25 only) score: {lexical} ---")
+            relevant = lexical >= retrieval_settings.HYBRID_MIN_LEXICAL_SCORE
 
-        if relevance >= min_relevance:
+        if relevant:
             meta = best_match.get("metadata", {}) or {}
             raw_question = RawQuestionData(
                 question_id=str(best_match.get("id")) if best_match.get("id") else None,
@@ -246,15 +542,54 @@ async def retrieve_question(
                 ),
                 relevance_score=relevance,
             )
+            presented = _present_question(
+                raw_question, meta.get("conversational_variants")
+            )
+            metrics.record_ratio("retrieval.pregenerated_variant", presented is not None)
+            # 'hits' of this ratio are fallbacks, so its hit_rate is the fallback rate.
+            metrics.record_ratio("retrieval.fallback", False)
+            if presented:
+                return presented
             return await _make_question_conversational(raw_question)
 
+    # 4. An earlier session may already have generated a question for this
+    # gap; reuse it while it waits for review instead of generating again.
+    if retrieval_settings.PROVISIONAL_REUSE_ENABLED and namespace == resolve_namespace():
+        provisional = await run_in_executor(
+            io_executor,
+            find_provisional_question,
+            domain,
+            domains,
+            query_vector,
+            difficulty_hint,
+            asked_ids,
+            min_relevance,
+        )
+        metrics.record_ratio("retrieval.provisional_reuse", provisional is not None)
+        if provisional:
+            metrics.record_ratio("retrieval.fallback", False)
+            return ConversationalQuestionOutput(
+                conversational_text=provisional["conversational_text"],
+                raw_question=RawQuestionData(
+                    question_id=provisional["question_id"],
+                    text=provisional["text"],
+                    domain=provisional["domain"],
+                    difficulty=provisional["difficulty"],
+                    ideal_answer_snippet=provisional["ideal_answer_snippet"],
+                    relevance_score=provisional["relevance_score"],
+                    provisional=True,
+                ),
+            )
+
     logger.info(
         "--- Low relevance or no matching domain, triggering LLM fallback generation ---"
     )
+    metrics.record_ratio("retrieval.fallback", True)
     return await _generate_and_present_fallback(
         domain=domain,
         difficulty=difficulty_hint,
         last_topics=last_topics or [],
         resume_summary=resume_dict,  # Pass the dicts
         job_summary=job_dict,
+        domains=domains,
     )
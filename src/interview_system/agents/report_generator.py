@@ -1,50 +1,143 @@
-import json
+import logging
 
+import numpy as np
 from jinja2 import Environment, FileSystemLoader
 
-from interview_system.orchestration.state import SessionState
-from interview_system.schemas.agent_outputs import ReportGenOutput
+from interview_system.orchestration.state import QuestionTurn
+from interview_system.schemas.agent_outputs import (
+    QuestionBreakdownItem,
+    ReportGenOutput,
+    ReportNarrativeOutput,
+)
 from interview_system.services.llm_clients import get_llm
-# 1. Import PromptTemplate
-from langchain_core.prompts import PromptTemplate
 
+logger = logging.getLogger(__name__)
 
-async def generate_report(session_state: SessionState) -> ReportGenOutput:
+
+def build_question_breakdown_item(
+    turn: QuestionTurn, question_number: int
+) -> QuestionBreakdownItem:
     """
-    Generates a final HTML report for the interview session.
+    Builds the report entry for a single completed turn.
+
+    This is called once per turn, as the turn is archived into the history,
+    so the final report never has to re-process the full session.
 
     Args:
-        session_state: The complete final state of the interview.
+        turn: The completed (answered and evaluated) question turn.
+        question_number: The 1-based position of the turn in the session.
 
     Returns:
-        A Pydantic object containing the HTML report and summary data.
+        The breakdown item for this question.
+    """
+    canonical = turn.evals.get("canonical", {})
+    fast_eval = turn.evals.get("fast_eval", {})
+
+    score = canonical.get("final_score")
+    if score is None:
+        score = fast_eval.get("score", 0)
+
+    summary = canonical.get("fast_summary") or fast_eval.get("quick_summary", "")
+    feedback_points = [
+        point.get("bullet", "")
+        for point in turn.feedback.get("improvement_points", [])
+        if point.get("bullet")
+    ]
+
+    return QuestionBreakdownItem(
+        question_number=question_number,
+        question_text=turn.raw_question_text,
+        candidate_answer=turn.answer_text or "",
+        evaluation_score=float(score),
+        evaluation_summary=summary,
+        feedback_points=feedback_points,
+    )
+
+
+def _fallback_narrative(
+    items: list[QuestionBreakdownItem], scores: np.ndarray, overall_score: float
+) -> ReportNarrativeOutput:
+    """
+    Builds a plain narrative from the breakdown when the LLM is unavailable,
+    so a failed narrative call never costs the user their whole report.
+    """
+    improvements: list[str] = []
+    # Walk the questions from weakest to strongest and take their feedback.
+    for index in np.argsort(scores, kind="stable"):
+        for point in items[index].feedback_points:
+            if point not in improvements:
+                improvements.append(point)
+        if len(improvements) >= 3:
+            break
+
+    summary = (
+        f"The candidate answered {len(items)} questions with an overall score "
+        f"of {overall_score}."
+    )
+    return ReportNarrativeOutput(
+        overall_summary=summary, top_3_improvements=improvements[:3]
+    )
+
+
+async def generate_report_narrative(
+    question_breakdown: list[QuestionBreakdownItem], overall_score: float
+) -> ReportNarrativeOutput:
+    """
+    Asks the LLM for the narrative parts of the report only.
+
+    The candidate answers are not sent; the model sees the per-question
+    scores, summaries and feedback, and writes the summary and improvements.
     """
     env = Environment(loader=FileSystemLoader("src/interview_system/prompts/"))
     template = env.get_template("report_generator.j2")
 
-    # 2. Render the prompt string
-    prompt_string = template.render(session_history=session_state["question_history"])
+    digest = [
+        item.model_dump(exclude={"candidate_answer"}) for item in question_breakdown
+    ]
+    prompt_string = template.render(
+        question_breakdown=digest, overall_score=overall_score
+    )
 
-    # 3. Get the Gemini Pro model
-    llm = get_llm(
-        model_type="pro"
-    )  # Use Pro for a comprehensive and well-formatted report
-    
-    # 4. THIS IS THE FIX: Force the LLM to return JSON
-    #    matching the ReportGenOutput schema.
-    structured_llm = llm.with_structured_output(ReportGenOutput)
+    llm = get_llm(model_type="pro")
+    structured_llm = llm.with_structured_output(ReportNarrativeOutput)
 
     try:
-        # 5. Invoke the structured LLM. This will return a Pydantic object, not text.
-        response_data = await structured_llm.ainvoke(prompt_string)
-        return response_data
-        
+        return await structured_llm.ainvoke(prompt_string)
     except Exception as exc:
-        print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-        print("!!! REPORT_GENERATOR FAILED: THIS IS THE REAL ERROR !!!")
-        print(exc)
-        print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-        # Catch any errors during the structured output generation
         raise ValueError(
             f"ReportGenAgent failed to generate structured output: {exc}"
-        ) from exc
\ No newline at end of file
+        ) from exc
+
+
+async def generate_report(question_breakdown: list[dict]) -> ReportGenOutput:
+    """
+    Assembles the final report for the interview session.
+
+    Scores, answers and the per-question breakdown are assembled locally from
+    the precomputed parts; only the narrative is delegated to the LLM.
+
+    Args:
+        question_breakdown: The per-question breakdown items accumulated
+            during the session (see build_question_breakdown_item).
+
+    Returns:
+        A Pydantic object containing the summary and per-question data.
+    """
+    items = [QuestionBreakdownItem(**item) for item in question_breakdown]
+    scores = np.fromiter(
+        (item.evaluation_score for item in items), dtype=np.float64, count=len(items)
+    )
+    overall_score = round(float(scores.mean()), 2) if scores.size else 0.0
+
+    try:
+        narrative = await generate_report_narrative(items, overall_score)
+    except ValueError as exc:
+        logger.error(f"Report narrative failed, using fallback narrative: {exc}")
+        narrative = _fallback_narrative(items, scores, overall_score)
+
+    return ReportGenOutput(
+        overall_summary=narrative.overall_summary,
+        overall_score=overall_score,
+        top_3_improvements=narrative.top_3_improvements[:3],
+        question_breakdown=items,
+    )
@@ -17,6 +17,9 @@ from interview_system.api.routers import session as session_router
 
 # Import the service function to configure Cloudinary
 from interview_system.services.cloudinary_service import configure_cloudinary
+from interview_system.services.domain_taxonomy import domain_taxonomy
+from interview_system.services.index_aliases import index_aliases
+from interview_system.services.vector_store import get_vector_store
 
 # Configure logging at the application's entry point
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -51,6 +54,20 @@ def startup_event():
     """
     logging.info("Application is starting up...")
     configure_cloudinary() # Initialize the Cloudinary SDK
+    # Precompute the topic -> bank domain index so the first retrieval is fast.
+    try:
+        domain_taxonomy.warm()
+    except Exception as e:
+        logging.warning(f"Could not build the domain taxonomy at startup: {e}")
+    # Open the vector store here, off the event loop: the local backend loads
+    # its snapshot or embeds the whole bootstrap file on first use.
+    try:
+        get_vector_store()
+    except Exception as e:
+        logging.warning(f"Could not open the vector store at startup: {e}")
+    # Read the index aliases here, off the event loop; later refreshes run in
+    # the background.
+    index_aliases.refresh()
 
 # --- Include API Routers ---
 #
@@ -9,7 +9,13 @@ from ...auth.dependencies import get_current_user
 from ...models.user import User
 from ...repositories.review_queue_repository import ReviewQueueRepository
 from ...repositories.question_repository import QuestionRepository
+from ...services.domain_catalog import domain_catalog
+from ...services.domain_taxonomy import domain_taxonomy
+from ...services.hot_tier import hot_tier
+from ...services.lexical_index import get_lexical_index
+from ...services.namespaces import upsert_sharded
 from ...services.vector_store import get_vector_store
+from ...services import metrics
 from ...schemas.admin import ReviewQueueItemResponse, ApproveQuestionResponse
 from ...repositories.user_repository import UserRepository
 
@@ -86,14 +92,16 @@ def approve_pending_question(
             "difficulty": new_question.difficulty,
             "ideal_answer_snippet": new_question.ideal_answer_snippet or "",  # Coalesce None to ""
             "rubric_id": new_question.rubric_id or "",  # Coalesce None to ""
+            "conversational_variants": new_question.conversational_variants or [],
         }
         # --- END OF UPDATE ---
 
         # --- THIS IS THE CHANGE ---
-        # Specify the target namespace for the upsert
-        vector_store.upsert_questions(
-            [question_to_upsert], namespace="updated-namespace"
-        )
+        # Into the bank namespace (or the question's domain shard)
+        upsert_sharded(vector_store, [question_to_upsert])
+        domain_catalog.register([new_question.domain])
+        get_lexical_index().add([question_to_upsert])
+        hot_tier.invalidate()
         # --- END OF CHANGE ---
 
     except Exception as e:
@@ -166,4 +174,33 @@ def get_dashboard_stats(
     return {
         "pending_reviews": pending_count,
         "total_users": total_candidates  # Keeping key 'total_users' for frontend compatibility
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/metrics")
+def get_metrics(current_user: User = Depends(get_current_user)):
+    """
+    Returns this worker's in-process metrics (cache hit rates, counters,
+    histograms).
+    """
+    if current_user.get("role") != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
+        )
+
+    return metrics.snapshot()
+
+
+@router.get("/unresolved-topics")
+def get_unresolved_topics(current_user: User = Depends(get_current_user)):
+    """
+    Returns plan topics that matched no question bank domain in this worker,
+    most frequent first. Each one sends its questions to the LLM fallback;
+    add questions or a DOMAIN_ALIASES_FILE entry to cover it.
+    """
+    if current_user.get("role") != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
+        )
+
+    return domain_taxonomy.unresolved_topics()
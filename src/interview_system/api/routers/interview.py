@@ -18,6 +18,7 @@ from ...schemas.session import (
 # --- NEW IMPORTS for structured data models ---
 from ...schemas.agent_outputs import FeedbackGenOutput, ImprovementPoint, Resource 
 from ...services.pdf_parser import extract_text_from_pdf_url
+from ...services.namespaces import validate_namespace
 # We import the uncompiled workflow to add our checkpointer
 from ...orchestration.graph import get_interview_workflow
 from ...orchestration.state import SessionState, QuestionTurn # Import QuestionTurn
@@ -55,6 +56,12 @@ async def create_new_interview_session(
     ...
     """
     logger.info(f"--- Endpoint: Starting New Session for user {current_user['user_id']} ---")
+
+    # The question bank namespace is fixed for the whole session.
+    try:
+        namespace = validate_namespace(request.namespace)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     try: # <--- TRY BLOCK STARTS HERE
         # 1. Get User and Personalization Profile (This is the new feature)
@@ -89,11 +96,12 @@ async def create_new_interview_session(
         initial_state = SessionState(
             session_id=session_id,
             user_id=user_id,
-            namespace="updated-namespace", # Or get from config
+            namespace=namespace,
             initial_resume_text=resume_text,
             initial_job_description_text=request.job_description, # FIX: use 'job_description'
             personalization_profile=user_profile, # This is the loaded profile
             question_history=[],
+            question_breakdown=[],
             interview_plan=[],
         )
 
@@ -215,6 +223,7 @@ async def submit_answer(
                 conversational_text=next_question_dict.get('conversational_text'),
                 raw_question_text=raw_data.get('text', ""), 
                 ideal_answer_snippet=raw_data.get('ideal_answer_snippet', ""), 
+                provisional=next_question_dict.get('provisional', False),
                 answer_text=next_question_dict.get('answer_text'),
                 answer_audio_ref=next_question_dict.get('answer_audio_ref'),
                 evals=next_question_dict.get('evals') or {},
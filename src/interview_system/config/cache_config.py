@@ -0,0 +1,43 @@
+# src/interview_system/config/cache_config.py
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    """
+    Tuning knobs for the in-process and Postgres-backed caches.
+    """
+    model_config = SettingsConfigDict(
+        env_file='.env',
+        env_file_encoding='utf-8',
+        extra='ignore'
+    )
+
+    # In-process LRU in front of the analysis_cache table (entries per kind)
+    ANALYSIS_CACHE_LRU_SIZE: int = 256
+    # Rows not read for this many days are evicted from analysis_cache
+    ANALYSIS_CACHE_MAX_AGE_DAYS: int = 30
+    # Hard cap on rows per kind; least recently used rows are evicted first
+    ANALYSIS_CACHE_MAX_ENTRIES: int = 10000
+    # Run the (cheap, but not free) eviction query once every N writes
+    ANALYSIS_CACHE_EVICT_EVERY: int = 50
+
+    # Job description analyses are shared across users and expire after this long
+    JD_ANALYSIS_CACHE_TTL_HOURS: int = 168
+    # Reuse the analysis of a near-identical posting (embedding similarity)
+    JD_SIMILARITY_ENABLED: bool = False
+    JD_SIMILARITY_THRESHOLD: float = 0.97
+    # How many recent cached embeddings a similarity lookup compares against
+    ANALYSIS_CACHE_SIMILARITY_CANDIDATES: int = 2000
+
+    # Query embeddings kept per process, keyed by query text
+    QUERY_EMBEDDING_CACHE_SIZE: int = 1024
+    # Vector store results keyed by (query vector, filter, namespace, top_k);
+    # kept short so index updates from other processes show up quickly
+    QUERY_RESULT_CACHE_SIZE: int = 512
+    QUERY_RESULT_CACHE_TTL_SECONDS: int = 60
+
+    # Question bodies hydrated from questions_meta for slim vector metadata
+    HYDRATION_CACHE_SIZE: int = 10000
+
+
+cache_settings = CacheSettings()
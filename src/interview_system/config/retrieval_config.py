@@ -0,0 +1,64 @@
+# src/interview_system/config/retrieval_config.py
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RetrievalSettings(BaseSettings):
+    """
+    Tuning knobs for question retrieval from the vector store.
+    """
+    model_config = SettingsConfigDict(
+        env_file='.env',
+        env_file_encoding='utf-8',
+        extra='ignore'
+    )
+
+    # Candidates fetched by the first vector query
+    RETRIEVAL_TOP_K: int = 7
+    # When no candidate is usable, top_k is multiplied by this factor and the
+    # query repeated, up to RETRIEVAL_MAX_TOP_K, before the LLM fallback runs
+    RETRIEVAL_TOP_K_GROWTH: int = 4
+    RETRIEVAL_MAX_TOP_K: int = 112
+
+    # Fuse BM25 results over question text with the vector results
+    HYBRID_RETRIEVAL_ENABLED: bool = True
+    # Reciprocal rank fusion constant; larger values flatten rank differences
+    RRF_K: int = 60
+    # A candidate only BM25 found has no cosine relevance to hold against the
+    # fallback threshold; it is used if its normalized BM25 score reaches this
+    HYBRID_MIN_LEXICAL_SCORE: float = 0.5
+    # The question bank held in memory (lexical index, hot tier) is this file
+    # plus every row of questions_meta
+    QUESTION_BANK_FILE: str = "questions.txt"
+
+    # Serve the most queried domains from an in-process copy (remote backends
+    # only). Up to HOT_TIER_MAX_DOMAINS domains with at least
+    # HOT_TIER_MIN_QUERIES retrievals in the last window are kept hot; the
+    # tier is rebuilt every HOT_TIER_REFRESH_SECONDS.
+    HOT_TIER_ENABLED: bool = True
+    HOT_TIER_MAX_DOMAINS: int = 3
+    HOT_TIER_MIN_QUERIES: int = 20
+    HOT_TIER_REFRESH_SECONDS: int = 600
+    HOT_TIER_MAX_QUESTIONS: int = 20000
+
+    # Before generating a fallback, reuse a still-pending (unreviewed) fallback
+    # question generated earlier for the same domain, if one is relevant
+    # enough. At most PROVISIONAL_MAX_CANDIDATES recent ones are scored.
+    PROVISIONAL_REUSE_ENABLED: bool = True
+    PROVISIONAL_MAX_CANDIDATES: int = 200
+
+    # Known question domains are read from this file and the questions_meta
+    # table, and re-read after this many seconds
+    DOMAIN_CATALOG_FILE: str = "questions.txt"
+    DOMAIN_CATALOG_TTL_SECONDS: int = 300
+
+    # Plan topics without an alias match resolve to the bank domains whose
+    # label embedding is at least this similar, keeping at most
+    # TAXONOMY_MAX_DOMAINS within TAXONOMY_SCORE_MARGIN of the best one
+    TAXONOMY_MIN_SIMILARITY: float = 0.55
+    TAXONOMY_MAX_DOMAINS: int = 3
+    TAXONOMY_SCORE_MARGIN: float = 0.05
+    # Optional JSON file of extra aliases: {"data-science": ["analytics"]}
+    DOMAIN_ALIASES_FILE: str = ""
+
+
+retrieval_settings = RetrievalSettings()
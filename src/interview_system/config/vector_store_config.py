@@ -0,0 +1,88 @@
+# src/interview_system/config/vector_store_config.py
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class VectorStoreSettings(BaseSettings):
+    """
+    Selects and tunes the vector store backend behind get_vector_store().
+    """
+    model_config = SettingsConfigDict(
+        env_file='.env',
+        env_file_encoding='utf-8',
+        extra='ignore'
+    )
+
+    # "pinecone" (remote index) or "local" (in-process NumPy index)
+    VECTOR_STORE_BACKEND: str = "pinecone"
+
+    # --- Embeddings ---
+    # Changing either means reindexing (see scripts/reindex.py). A worker only
+    # serves index versions built with its own model and template.
+    EMBEDDING_MODEL_NAME: str = "all-MiniLM-L6-v2"
+    QUESTION_TEXT_TEMPLATE: str = "Domain: {domain}. Question: {text}"
+
+    # --- Namespaces (see services/namespaces.py) ---
+    # Namespace holding the question bank; used by sessions that name none
+    QUESTION_NAMESPACE: str = "updated-namespace"
+    # Further namespaces (e.g. one per tenant) a session may ask for
+    ALLOWED_NAMESPACES: list[str] = []
+    # Store each domain in its own namespace ("<namespace>__<domain>"), so a
+    # retrieval only scans the shards of the domains it asks for. Topics that
+    # span domains are queried concurrently and merged. Reseed after changing.
+    DOMAIN_SHARDING_ENABLED: bool = False
+    # Namespaces are aliases onto versioned builds (index_aliases table);
+    # workers re-read the aliases after this many seconds
+    INDEX_ALIAS_TTL_SECONDS: int = 15
+
+    # --- Async path (see services/executors.py) ---
+    # Threads running SentenceTransformer encodes for async callers
+    EMBED_WORKERS: int = 2
+    # Query-sized encodes from concurrent requests are collected into one
+    # forward pass of up to EMBED_MAX_BATCH_SIZE texts, waiting at most
+    # EMBED_MAX_WAIT_MS for the batch to fill (see services/embedding_service.py)
+    EMBED_BATCHING_ENABLED: bool = True
+    EMBED_MAX_BATCH_SIZE: int = 64
+    EMBED_MAX_WAIT_MS: float = 5.0
+    # Threads (and pooled HTTP connections) for vector store requests
+    VECTOR_STORE_IO_WORKERS: int = 16
+    # A retrieval gives up on the vector store after this long
+    VECTOR_QUERY_TIMEOUT_SECONDS: float = 5.0
+
+    # "full" stores question bodies in the vector metadata; "slim" stores only
+    # the filterable fields and hydrates bodies from questions_meta at query
+    # time (the seed script then also writes questions_meta)
+    VECTOR_METADATA_MODE: str = "full"
+
+    # --- Bulk upserts ---
+    # Texts per SentenceTransformer forward pass
+    EMBED_BATCH_SIZE: int = 128
+    # Pinecone caps a request at 1000 vectors and 2 MB
+    UPSERT_BATCH_SIZE: int = 200
+    UPSERT_MAX_REQUEST_BYTES: int = 1_800_000
+    # Upsert requests in flight at once
+    UPSERT_CONCURRENCY: int = 4
+    # Per-namespace manifests of what scripts/sync_index.py has indexed
+    SYNC_MANIFEST_DIR: str = "data/sync_manifests"
+    # Streaming ingestion (seed_database.py --stream): questions per batch
+    # moving through the pipeline, batches buffered between two stages, and
+    # where resume checkpoints are kept
+    INGEST_BATCH_SIZE: int = 512
+    INGEST_QUEUE_SIZE: int = 4
+    INGEST_CHECKPOINT_DIR: str = "data/ingest_checkpoints"
+
+    # --- Local backend ---
+    # "exact" scans the whole matrix; "ann" uses an inverted-file index once a
+    # namespace holds at least LOCAL_ANN_MIN_VECTORS vectors.
+    LOCAL_INDEX_MODE: str = "exact"
+    LOCAL_ANN_MIN_VECTORS: int = 50000
+    # Number of inverted lists scanned per query (higher = better recall)
+    LOCAL_ANN_NPROBE: int = 8
+    # Snapshot directory opened on first use, if it exists (see seed_database.py
+    # --snapshot); takes precedence over LOCAL_BOOTSTRAP_FILE. Snapshots hold a
+    # single namespace, so they are skipped when domain sharding is on.
+    LOCAL_SNAPSHOT_DIR: str = "data/question_snapshot"
+    # Question file loaded into QUESTION_NAMESPACE on first use (empty to disable)
+    LOCAL_BOOTSTRAP_FILE: str = "questions.txt"
+
+
+vector_store_settings = VectorStoreSettings()
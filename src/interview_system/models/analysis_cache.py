@@ -0,0 +1,32 @@
+# src/interview_system/models/analysis_cache.py
+from sqlalchemy import Column, String, Integer, DateTime, Float
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.sql import func
+from .base import Base
+
+
+class AnalysisCacheEntry(Base):
+    __tablename__ = "analysis_cache"
+
+    # What was analyzed, e.g. 'resume'
+    kind = Column(String(32), primary_key=True)
+    # SHA-256 hex digest of the normalized input document
+    content_hash = Column(String(64), primary_key=True)
+    # Hash of the prompt template, so prompt edits never serve stale analyses
+    prompt_version = Column(String(16), primary_key=True)
+
+    # The agent's structured output, as produced by model_dump()
+    payload = Column(JSONB, nullable=False)
+    # Optional document embedding, used to reuse analyses of near-identical inputs
+    embedding = Column(ARRAY(Float), nullable=True)
+    # The user whose data produced the entry, for per-user invalidation
+    owner_id = Column(String(64), nullable=True, index=True)
+
+    # Tracking (also drives eviction)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_accessed_at = Column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+    # Null means the entry never expires
+    expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
@@ -0,0 +1,44 @@
+# src/interview_system/models/index_alias.py
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from .base import Base
+
+
+class IndexVersion(Base):
+    __tablename__ = "index_versions"
+
+    # The physical namespace the version was built into, e.g. 'updated-namespace.v2'
+    namespace = Column(String, primary_key=True)
+    # The logical namespace (alias) it was built for
+    alias = Column(String, nullable=False, index=True)
+    version = Column(String, nullable=False)
+
+    # How its vectors were computed; workers only serve versions whose
+    # embedding settings match their own
+    model = Column(String, nullable=False)
+    text_template = Column(Text, nullable=False)
+
+    question_count = Column(Integer, nullable=False, default=0)
+    status = Column(
+        String, nullable=False, default="building"
+    )  # e.g., 'building', 'ready', 'live', 'retired'
+
+    # Tracking
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class IndexAlias(Base):
+    __tablename__ = "index_aliases"
+
+    # The namespace callers use, e.g. 'updated-namespace'
+    alias = Column(String, primary_key=True)
+    # The version it currently points to, and the one before it (for rollback)
+    target = Column(String, ForeignKey("index_versions.namespace"), nullable=False)
+    previous_target = Column(
+        String, ForeignKey("index_versions.namespace"), nullable=True
+    )
+
+    # Tracking
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -1,7 +1,7 @@
 # src/interview_system/models/question.py
 import uuid
 from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 from .base import Base
 
@@ -18,6 +18,8 @@ class Question(Base):
     domain = Column(String, index=True, nullable=False)
     difficulty = Column(Integer, nullable=False, default=5)
     ideal_answer_snippet = Column(Text)
+    # Pre-generated conversational phrasings, so retrieval needs no LLM call
+    conversational_variants = Column(JSONB, nullable=True)
 
     # We will skip this for now, but the column should exist
     rubric_id = Column(String, index=True, nullable=True)
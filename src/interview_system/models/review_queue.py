@@ -1,7 +1,7 @@
 # src/interview_system/models/review_queue.py
 import uuid
-from sqlalchemy import Column, String, DateTime, Text
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, DateTime, Text, Float
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.sql import func
 from .base import Base
 
@@ -18,6 +18,12 @@ class ReviewQueue(Base):
         String, nullable=False, default="pending", index=True
     )  # e.g., 'pending', 'approved', 'rejected'
 
+    # Provisional serving: pending questions are reused by later sessions for
+    # the same domain (the topic's first bank domain, or the normalized topic
+    # if it resolved to none), ranked by this question embedding
+    domain = Column(String, nullable=True, index=True)
+    embedding = Column(ARRAY(Float), nullable=True)
+
     # Tracking
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     # You could also link this to the user/session that generated it
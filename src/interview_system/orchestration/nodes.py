@@ -9,39 +9,87 @@ from ..agents.follow_up_agent import generate_follow_up
 from ..agents.interview_plan_agent import generate_interview_plan
 from ..agents.job_description_analyzer import analyze_job_description
 from ..agents.personalization_agent import create_personalization_plan
-from ..agents.question_retrieval import retrieve_question
-from ..agents.report_generator import generate_report
+from ..agents.question_retrieval import embed_session_profile, retrieve_question
+from ..agents.report_generator import build_question_breakdown_item, generate_report
 from ..agents.resume_analyzer import analyze_resume
 from ..agents.rubric_eval_agent import rubric_eval_answer
 from .state import QuestionTurn, SessionState
 from ..api.database import get_db_session
 from ..repositories.user_repository import UserRepository
+from ..schemas.agent_outputs import InterviewPlanOutput
+from ..services.analysis_cache import (
+    canonical_json,
+    interview_plan_cache,
+    job_description_analysis_cache,
+    resume_analysis_cache,
+)
+from ..services.executors import embedding_executor, run_in_executor
 
 logger = logging.getLogger(__name__)
 
 
+def _archive_turn(state: SessionState, turn: QuestionTurn) -> dict:
+    """
+    Appends a completed turn to the history and builds its report breakdown item
+    at the same time, so the final report never re-processes the whole session.
+    """
+    history = state.get("question_history", [])
+    breakdown = state.get("question_breakdown") or []
+    item = build_question_breakdown_item(turn, question_number=len(history) + 1)
+    return {
+        "question_history": history + [turn],
+        "question_breakdown": breakdown + [item.model_dump()],
+    }
+
+
 # --- Analysis & Planning Nodes ---
 async def analyze_resume_node(state: SessionState) -> dict:
     logger.info("--- Node: Analyzing Resume ---")
-    analysis_result = await analyze_resume(state.get("initial_resume_text"))
+    resume_text = state.get("initial_resume_text")
+
+    # The same resume is re-uploaded across practice sessions; reuse its analysis.
+    analysis_result = await resume_analysis_cache.get(resume_text)
+    if analysis_result is None:
+        analysis_result = await analyze_resume(resume_text)
+        await resume_analysis_cache.put(resume_text, analysis_result)
     return {"resume_summary": analysis_result.model_dump()}
 
 
 async def analyze_job_description_node(state: SessionState) -> dict:
     logger.info("--- Node: Analyzing Job Description ---")
-    analysis_result = await analyze_job_description(
-        state.get("initial_job_description_text")
-    )
+    job_desc_text = state.get("initial_job_description_text")
+
+    # One posting is analyzed once and shared by every candidate who gets it.
+    analysis_result = await job_description_analysis_cache.get(job_desc_text)
+    if analysis_result is None:
+        analysis_result = await analyze_job_description(job_desc_text)
+        await job_description_analysis_cache.put(job_desc_text, analysis_result)
     return {"job_summary": analysis_result.model_dump()}
 
 
 async def create_interview_plan_node(state: SessionState) -> dict:
     logger.info("--- Node: Creating Interview Plan (via Agent) ---")
-    plan = await generate_interview_plan(
-        resume_summary=state.get("resume_summary"),
-        job_summary=state.get("job_summary"),
-        personalization_profile=state.get("personalization_profile"),
+    plan_inputs = canonical_json(
+        {
+            "resume_summary": state.get("resume_summary"),
+            "job_summary": state.get("job_summary"),
+            "personalization_profile": state.get("personalization_profile"),
+        }
     )
+
+    # A restarted session with unchanged inputs gets its plan back instantly.
+    cached_plan = await interview_plan_cache.get(plan_inputs)
+    if cached_plan is not None:
+        plan = cached_plan.plan
+    else:
+        plan = await generate_interview_plan(
+            resume_summary=state.get("resume_summary"),
+            job_summary=state.get("job_summary"),
+            personalization_profile=state.get("personalization_profile"),
+        )
+        await interview_plan_cache.put(
+            plan_inputs, InterviewPlanOutput(plan=plan), owner_id=state.get("user_id")
+        )
     logger.info(f"Generated Plan: {plan}")
     return {"interview_plan": plan}
 
@@ -57,6 +105,7 @@ def set_current_topic_node(state: SessionState) -> dict:
 def introduction_node(state: SessionState) -> dict:
     logger.info("--- Node: Generating Introduction ---")
     turn = QuestionTurn(
+        topic=state.get("current_topic"),
         conversational_text="Welcome, Candidate! Thanks for your time today. To get started, could you please tell me a bit about yourself and walk me through your resume?",
         raw_question_text="Tell me about yourself.",
         ideal_answer_snippet="A concise 'elevator pitch' summarizing background, key skills, and career goals.",
@@ -73,6 +122,16 @@ async def retrieve_question_node(state: SessionState) -> dict:
     # --- EXTRACT ASKED IDs ---
     asked_ids = [turn.question_id for turn in history if turn.question_id is not None]
 
+    # Embed the resume/job profile on the first retrieval and keep it in state.
+    profile_embedding = state.get("profile_embedding")
+    if profile_embedding is None:
+        profile_embedding = await run_in_executor(
+            embedding_executor,
+            embed_session_profile,
+            state.get("resume_summary"),
+            state.get("job_summary"),
+        )
+
     # This is the fix: pass arguments as keywords, not a single dict
     question_output = await retrieve_question(
         domain=topic,
@@ -82,15 +141,19 @@ async def retrieve_question_node(state: SessionState) -> dict:
         # --- ADD THIS LINE BACK ---
         difficulty_hint=state.get("difficulty_hint", 5),  # Uses 5 as a default
         asked_ids=asked_ids,  # <-- Pass the filtered IDs here
+        profile_embedding=profile_embedding,
+        namespace=state.get("namespace"),
     )
 
     turn = QuestionTurn(
         question_id=question_output.raw_question.question_id,
+        topic=topic,
         conversational_text=question_output.conversational_text,
         raw_question_text=question_output.raw_question.text,
         ideal_answer_snippet=question_output.raw_question.ideal_answer_snippet,
+        provisional=question_output.raw_question.provisional,
     )
-    return {"current_question": turn}
+    return {"current_question": turn, "profile_embedding": profile_embedding}
 
 
 async def deep_dive_question_node(state: SessionState) -> dict:
@@ -107,6 +170,7 @@ async def deep_dive_question_node(state: SessionState) -> dict:
     )
     turn = QuestionTurn(
         question_id=None,
+        topic=topic_string,
         conversational_text=question_output.conversational_text,
         raw_question_text=question_output.raw_question.text,
         ideal_answer_snippet=question_output.raw_question.ideal_answer_snippet,
@@ -117,6 +181,7 @@ async def deep_dive_question_node(state: SessionState) -> dict:
 def wrap_up_node(state: SessionState) -> dict:
     logger.info("--- Node: Generating Wrap-up Question ---")
     turn = QuestionTurn(
+        topic=state.get("current_topic"),
         conversational_text="That was the last question I had. Do you have any questions for me?",
         raw_question_text="Do you have any questions for me?",
         ideal_answer_snippet="The candidate should ask thoughtful questions about the role, team, or company.",
@@ -219,6 +284,8 @@ async def handle_follow_up_node(state: SessionState) -> dict:
 
     # Create a new QuestionTurn for the follow-up
     follow_up_turn = QuestionTurn(
+        topic=last_question.topic,
+        is_follow_up=True,
         conversational_text=follow_up_agent_output.question_text,
         raw_question_text=follow_up_agent_output.question_text,
         ideal_answer_snippet="The candidate should provide the specific information missing from their previous answer.",
@@ -226,7 +293,7 @@ async def handle_follow_up_node(state: SessionState) -> dict:
 
     # Add the *last* question to history, and set the *new* follow-up as current
     return {
-        "question_history": state.get("question_history", []) + [last_question],
+        **_archive_turn(state, last_question),
         "current_question": follow_up_turn,
     }
 
@@ -234,14 +301,16 @@ async def handle_follow_up_node(state: SessionState) -> dict:
 # --- Final Reporting & State Management ---
 async def report_generator_node(state: SessionState) -> dict:
     logger.info("--- Node: Generating Final Report ---")
-    serializable_state = dict(state)
-    if state.get("question_history"):
-        serializable_state["question_history"] = [
-            turn.model_dump(mode="json") for turn in state["question_history"]
-        ]
+    history = state.get("question_history", [])
+    breakdown = list(state.get("question_breakdown") or [])
+
+    # Sessions checkpointed before incremental breakdowns existed only have
+    # the raw history; backfill whatever parts are missing.
+    for number, turn in enumerate(history[len(breakdown) :], start=len(breakdown) + 1):
+        breakdown.append(build_question_breakdown_item(turn, number).model_dump())
 
     try:
-        report_result = await generate_report(serializable_state)
+        report_result = await generate_report(breakdown)
 
         if report_result:
             return {"final_report": report_result.model_dump()}
@@ -274,11 +343,10 @@ def final_reporting_entry_node(state: SessionState) -> dict:
 def update_history_and_plan_node(state: SessionState) -> dict:
     logger.info("--- Node: Updating History and Advancing Plan ---")
     last_question = state["current_question"]
-    new_history = state.get("question_history", []) + [last_question]
     updated_plan = state.get("interview_plan", [])[1:]
 
     return {
-        "question_history": new_history,
+        **_archive_turn(state, last_question),
         "interview_plan": updated_plan,
         "current_question": None,  # Clear the current question
     }
@@ -303,5 +371,8 @@ async def save_personalization_node(state: SessionState) -> dict:
         except Exception as e:
             logger.error(f"Failed to save personalization profile: {e}", exc_info=True)
             # Don't crash the graph, just log the error
+        else:
+            # Plans cached for the old profile will never be requested again.
+            await interview_plan_cache.invalidate_owner(str(user_id))
 
     return {}  # This node doesn't modify the graph state
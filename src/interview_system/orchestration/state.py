@@ -7,6 +7,10 @@ from pydantic import BaseModel, Field
 # Using Pydantic for QuestionTurn to get validation within the list
 class QuestionTurn(BaseModel):
     question_id: str | None = None
+    topic: str | None = None  # The interview_plan step this turn was asked for
+    is_follow_up: bool = False
+    # A generated question served from the review queue before approval
+    provisional: bool = False
     conversational_text: str
     raw_question_text: str
     ideal_answer_snippet: str | None = None
@@ -66,8 +70,14 @@ class SessionState(TypedDict):
     final_report: dict | None
     resume_summary: dict | None
     job_summary: dict | None
+    # Embedding of resume_summary + job_summary, computed once per session and
+    # blended with a per-domain vector to build every retrieval query.
+    profile_embedding: list[float] | None
     interview_plan: list[str]
     question_history: list[QuestionTurn]
+    # One QuestionBreakdownItem (as a dict) per completed turn, built as the turn
+    # is archived so the final report only has to reduce over precomputed parts.
+    question_breakdown: list[dict]
     personalization_profile: dict | None
     next_question_override: QuestionTurn | None  # For the robust follow-up logic
 
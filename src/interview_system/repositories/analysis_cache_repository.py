@@ -0,0 +1,142 @@
+# src/interview_system/repositories/analysis_cache_repository.py
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ..models.analysis_cache import AnalysisCacheEntry
+
+
+def _not_expired(now: datetime):
+    return or_(
+        AnalysisCacheEntry.expires_at.is_(None), AnalysisCacheEntry.expires_at > now
+    )
+
+
+class AnalysisCacheRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(
+        self, kind: str, content_hash: str, prompt_version: str
+    ) -> Optional[AnalysisCacheEntry]:
+        """
+        Fetches a live (unexpired) cached analysis and records the access.
+        """
+        now = datetime.now(timezone.utc)
+        entry = self.db.get(AnalysisCacheEntry, (kind, content_hash, prompt_version))
+        if entry is None or (entry.expires_at and entry.expires_at <= now):
+            return None
+        entry.hit_count = (entry.hit_count or 0) + 1
+        entry.last_accessed_at = now
+        # Note: We commit in the caller using a context manager
+        return entry
+
+    def put(
+        self,
+        kind: str,
+        content_hash: str,
+        prompt_version: str,
+        payload: Dict[str, Any],
+        ttl: Optional[timedelta] = None,
+        embedding: Optional[List[float]] = None,
+        owner_id: Optional[str] = None,
+    ) -> AnalysisCacheEntry:
+        """
+        Inserts or replaces a cached analysis.
+        """
+        now = datetime.now(timezone.utc)
+        entry = AnalysisCacheEntry(
+            kind=kind,
+            content_hash=content_hash,
+            prompt_version=prompt_version,
+            payload=payload,
+            embedding=embedding,
+            owner_id=owner_id,
+            hit_count=0,
+            last_accessed_at=now,
+            expires_at=now + ttl if ttl else None,
+        )
+        return self.db.merge(entry)
+
+    def delete_by_owner(self, kind: str, owner_id: str) -> int:
+        """
+        Deletes every entry of a kind produced from this user's data.
+        """
+        return (
+            self.db.query(AnalysisCacheEntry)
+            .filter(
+                AnalysisCacheEntry.kind == kind,
+                AnalysisCacheEntry.owner_id == owner_id,
+            )
+            .delete(synchronize_session=False)
+        )
+
+    def get_embeddings(
+        self, kind: str, prompt_version: str, limit: int
+    ) -> List[Tuple[str, List[float]]]:
+        """
+        Returns (content_hash, embedding) for the most recently used live
+        entries that have an embedding, for similarity lookups.
+        """
+        now = datetime.now(timezone.utc)
+        rows = (
+            self.db.query(AnalysisCacheEntry.content_hash, AnalysisCacheEntry.embedding)
+            .filter(
+                AnalysisCacheEntry.kind == kind,
+                AnalysisCacheEntry.prompt_version == prompt_version,
+                AnalysisCacheEntry.embedding.isnot(None),
+                _not_expired(now),
+            )
+            .order_by(AnalysisCacheEntry.last_accessed_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [(content_hash, embedding) for content_hash, embedding in rows]
+
+    def evict(self, kind: str, max_age_days: int, max_entries: int) -> int:
+        """
+        Deletes expired entries and entries not read within max_age_days, then
+        trims the kind down to max_entries by least recent access. Returns the
+        number of rows removed.
+        """
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=max_age_days)
+        removed = (
+            self.db.query(AnalysisCacheEntry)
+            .filter(
+                AnalysisCacheEntry.kind == kind,
+                or_(
+                    AnalysisCacheEntry.last_accessed_at < cutoff,
+                    AnalysisCacheEntry.expires_at <= now,
+                ),
+            )
+            .delete(synchronize_session=False)
+        )
+
+        overflow = (
+            self.db.query(AnalysisCacheEntry)
+            .filter(AnalysisCacheEntry.kind == kind)
+            .count()
+            - max_entries
+        )
+        if overflow > 0:
+            oldest = (
+                self.db.query(
+                    AnalysisCacheEntry.content_hash, AnalysisCacheEntry.prompt_version
+                )
+                .filter(AnalysisCacheEntry.kind == kind)
+                .order_by(AnalysisCacheEntry.last_accessed_at.asc())
+                .limit(overflow)
+                .all()
+            )
+            for content_hash, prompt_version in oldest:
+                self.db.query(AnalysisCacheEntry).filter(
+                    AnalysisCacheEntry.kind == kind,
+                    AnalysisCacheEntry.content_hash == content_hash,
+                    AnalysisCacheEntry.prompt_version == prompt_version,
+                ).delete(synchronize_session=False)
+            removed += len(oldest)
+
+        return removed
@@ -0,0 +1,94 @@
+# src/interview_system/repositories/index_alias_repository.py
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..models.index_alias import IndexAlias, IndexVersion
+
+
+class IndexAliasRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # --- Versions ---
+
+    def get_version(self, namespace: str) -> Optional[IndexVersion]:
+        """
+        Gets a version by the physical namespace it was built into.
+        """
+        return self.db.get(IndexVersion, namespace)
+
+    def get_versions(self, alias: str) -> List[IndexVersion]:
+        """
+        Fetches every version built for an alias, oldest first.
+        """
+        return (
+            self.db.query(IndexVersion)
+            .filter(IndexVersion.alias == alias)
+            .order_by(IndexVersion.created_at)
+            .all()
+        )
+
+    def save_version(
+        self,
+        namespace: str,
+        alias: str,
+        version: str,
+        model: str,
+        text_template: str,
+        status: str,
+        question_count: int = 0,
+    ) -> IndexVersion:
+        """
+        Creates or updates a version. Note: We commit in the caller using a
+        context manager.
+        """
+        entry = self.db.get(IndexVersion, namespace)
+        if entry is None:
+            entry = IndexVersion(namespace=namespace)
+        entry.alias = alias
+        entry.version = version
+        entry.model = model
+        entry.text_template = text_template
+        entry.status = status
+        entry.question_count = question_count
+        self.db.add(entry)
+        return entry
+
+    # --- Aliases ---
+
+    def get_alias(self, alias: str, for_update: bool = False) -> Optional[IndexAlias]:
+        """
+        Gets an alias; for_update locks its row until the transaction ends.
+        """
+        query = self.db.query(IndexAlias).filter(IndexAlias.alias == alias)
+        if for_update:
+            query = query.with_for_update()
+        return query.first()
+
+    def get_aliases(self) -> List[IndexAlias]:
+        """
+        Fetches every alias.
+        """
+        return self.db.query(IndexAlias).all()
+
+    def point_alias(self, alias: str, target: str) -> IndexAlias:
+        """
+        Points an alias at a version in one row update, remembering the
+        version it pointed at before. Both versions' statuses follow.
+        """
+        entry = self.get_alias(alias, for_update=True)
+        if entry is None:
+            entry = IndexAlias(alias=alias, target=target, previous_target=None)
+            self.db.add(entry)
+        elif entry.target != target:
+            old = self.get_version(entry.target)
+            if old is not None:
+                old.status = "ready"
+            entry.previous_target = entry.target
+            entry.target = target
+        new = self.get_version(target)
+        if new is not None:
+            new.status = "live"
+        self.db.flush()
+        return entry
@@ -1,6 +1,7 @@
 # src/interview_system/repositories/question_repository.py
 import uuid
 import hashlib  # <-- 1. Import hashlib
+from typing import List
 from sqlalchemy.orm import Session
 from ..models.question import Question
 from ..models.review_queue import ReviewQueue
@@ -35,6 +36,12 @@ class QuestionRepository:
             domain=raw_q_data.get("domain"),
             difficulty=raw_q_data.get("difficulty"),
             ideal_answer_snippet=raw_q_data.get("ideal_answer_snippet"),
+            # The fallback agent already phrased it conversationally once
+            conversational_variants=(
+                [review_item.candidate_question_json["conversational_text"]]
+                if review_item.candidate_question_json.get("conversational_text")
+                else None
+            ),
             promoted_by_admin_id=admin_id,
             # rubric_id=raw_q_data.get("rubric_id") # <-- Add this if it exists in your JSON
         )
@@ -51,4 +58,70 @@ class QuestionRepository:
 
         # --- Modifications End ---
 
-        return new_question
\ No newline at end of file
+        return new_question
+
+    def get_without_variants(self) -> List[Question]:
+        """
+        Fetches all questions that have no pre-generated conversational variants.
+        """
+        return (
+            self.db.query(Question)
+            .filter(Question.conversational_variants.is_(None))
+            .all()
+        )
+
+    def set_conversational_variants(
+        self, question_id: str, variants: List[str]
+    ) -> bool:
+        """
+        Stores the conversational variants for a question. Returns False if the
+        question does not exist.
+        """
+        question = self.db.query(Question).filter(Question.id == question_id).first()
+        if not question:
+            return False
+        question.conversational_variants = variants
+        # Note: We commit in the caller using a context manager
+        return True
+
+    def get_distinct_domains(self) -> List[str]:
+        """
+        Fetches every distinct domain in the question bank.
+        """
+        return [row[0] for row in self.db.query(Question.domain).distinct().all()]
+
+    def get_all(self) -> List[Question]:
+        """
+        Fetches every question in the bank.
+        """
+        return self.db.query(Question).all()
+
+    def get_by_ids(self, question_ids: List[str]) -> List[Question]:
+        """
+        Fetches the questions with the given ids in one query. Missing ids are
+        simply absent from the result.
+        """
+        if not question_ids:
+            return []
+        return self.db.query(Question).filter(Question.id.in_(question_ids)).all()
+
+    def upsert_many(self, items: List[dict]) -> int:
+        """
+        Inserts or updates bank questions from seed-file style dicts.
+        Returns the number of rows written.
+        """
+        for item in items:
+            self.db.merge(
+                Question(
+                    id=item["id"],
+                    text=item["text"],
+                    domain=item["domain"],
+                    difficulty=item.get("difficulty") or 5,
+                    ideal_answer_snippet=item.get("ideal_answer_snippet"),
+                    rubric_id=item.get("rubric_id") or None,
+                    conversational_variants=item.get("conversational_variants")
+                    or None,
+                )
+            )
+        # Note: We commit in the caller using a context manager
+        return len(items)
@@ -9,11 +9,22 @@ class ReviewQueueRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_pending_question(self, question_json: dict) -> ReviewQueue:
+    def create_pending_question(
+        self,
+        question_json: dict,
+        domain: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> ReviewQueue:
         """
-        Saves a new fallback question to the review queue.
+        Saves a new fallback question to the review queue. With a domain and
+        embedding, it can be served provisionally until it is reviewed.
         """
-        new_item = ReviewQueue(candidate_question_json=question_json, status="pending")
+        new_item = ReviewQueue(
+            candidate_question_json=question_json,
+            status="pending",
+            domain=domain,
+            embedding=embedding,
+        )
         self.db.add(new_item)
         # Note: We commit in the agent using a context manager
         return new_item
@@ -24,6 +35,27 @@ class ReviewQueueRepository:
         """
         return self.db.query(ReviewQueue).filter(ReviewQueue.status == "pending").all()
 
+    def get_provisional_questions(
+        self, domains: List[str], limit: int
+    ) -> List[ReviewQueue]:
+        """
+        Fetches pending, embedded questions in any of the given domains,
+        newest first. Approved and rejected items are never returned.
+        """
+        if not domains:
+            return []
+        return (
+            self.db.query(ReviewQueue)
+            .filter(
+                ReviewQueue.status == "pending",
+                ReviewQueue.domain.in_(domains),
+                ReviewQueue.embedding.isnot(None),
+            )
+            .order_by(ReviewQueue.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+
     def get_by_id(self, item_id: uuid.UUID) -> Optional[ReviewQueue]:
         """
         Gets a single review item by its ID.
@@ -1,7 +1,7 @@
 # src/interview_system/schemas/admin.py
 import uuid
 from datetime import datetime
-from typing import Any, List
+from typing import Any, List, Optional
 
 from pydantic import BaseModel
 
@@ -10,6 +10,7 @@ class ReviewQueueItemResponse(BaseModel):
     id: uuid.UUID
     candidate_question_json: Any  # The full JSON from the agent
     status: str
+    domain: Optional[str] = None  # Domain it is served under while pending
     created_at: datetime
 
     class Config:
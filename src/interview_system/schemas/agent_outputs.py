@@ -24,6 +24,10 @@ class RawQuestionData(BaseModel):
     relevance_score: float | None = Field(
         None, description="Relevance score from vector search, null if generated."
     )
+    provisional: bool = Field(
+        False,
+        description="True for a generated question reused before an admin reviewed it.",
+    )
 
 
 # --- The output of any question generation/retrieval agent ---
@@ -70,6 +74,13 @@ class JobDescriptionAnalysisOutput(BaseModel):
     )
 
 
+# --- InterviewPlanAgent ---
+class InterviewPlanOutput(BaseModel):
+    plan: list[str] = Field(
+        ..., description="The ordered interview plan steps, e.g. 'technical:python'."
+    )
+
+
 # --- FastEvalAgent ---
 class FastEvalOutput(BaseModel):
     score: int = Field(
@@ -146,6 +157,12 @@ class PersonalizationOutput(BaseModel):
     )
 
 
+class PersonalizationReasonsOutput(BaseModel):
+    reasons: dict[str, str] = Field(
+        ..., description="A short recommendation reason for each focus topic."
+    )
+
+
 class QuestionBreakdownItem(BaseModel):
     """A detailed analysis of a single interview question."""
 
@@ -166,6 +183,19 @@ class QuestionBreakdownItem(BaseModel):
     )
 
 
+class ReportNarrativeOutput(BaseModel):
+    """The only part of the final report that is written by the LLM."""
+
+    overall_summary: str = Field(
+        ...,
+        description="A comprehensive overview of the candidate's performance during the session.",
+    )
+    top_3_improvements: List[str] = Field(
+        ...,
+        description="A list of the top 3 most important areas for improvement for the candidate.",
+    )
+
+
 class ReportGenOutput(BaseModel):
     """The final structured JSON report for the interview session."""
 
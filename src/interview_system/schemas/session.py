@@ -38,6 +38,10 @@ class StartInterviewRequest(BaseModel):
         None, 
         description="The job description to tailor the interview."
     )
+    namespace: Optional[str] = Field(
+        None,
+        description="Question bank namespace (e.g. per tenant); must be the default or listed in ALLOWED_NAMESPACES.",
+    )
 
     class Config:
         from_attributes = True
@@ -74,6 +78,7 @@ class QuestionInSessionResponse(BaseModel):
     conversational_text: str = Field(..., description="The natural, conversational text to show to the user.")
     raw_question_text: str = Field(..., description="The raw, un-formatted text of the interview question.")
     ideal_answer_snippet: str = Field(..., description="A snippet of the ideal answer for internal guidance/evaluation.")
+    provisional: bool = Field(False, description="True if the question was generated and has not been reviewed by an admin yet.")
     answer_text: Optional[str] = Field(None, description="The user's submitted text answer for this question.")
     answer_audio_ref: Optional[str] = Field(None, description="Reference to the user's submitted audio answer, if applicable.")
     evals: Dict[str, Any] = Field(..., description="A dictionary of all evaluation outputs for the last answer.")
@@ -0,0 +1,278 @@
+# src/interview_system/services/analysis_cache.py
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Generic, Type, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from interview_system.api.database import get_db_session
+from interview_system.config.cache_config import cache_settings
+from interview_system.repositories.analysis_cache_repository import (
+    AnalysisCacheRepository,
+)
+from interview_system.schemas.agent_outputs import (
+    InterviewPlanOutput,
+    JobDescriptionAnalysisOutput,
+    ResumeAnalysisOutput,
+)
+from interview_system.services import metrics
+from interview_system.services.embeddings import embed_document
+from interview_system.services.memory_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = "src/interview_system/prompts/"
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+
+def normalize_document(text: str) -> str:
+    """
+    Normalizes a document so trivially different copies hash the same:
+    Unicode NFKC, unified line endings and collapsed whitespace.
+    """
+    text = unicodedata.normalize("NFKC", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def canonical_json(value: Any) -> str:
+    """
+    A stable serialization of structured inputs (sorted keys, no spacing),
+    so equal inputs always produce the same fingerprint.
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of the normalized document."""
+    return hashlib.sha256(normalize_document(text).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def prompt_version(template_name: str) -> str:
+    """
+    A short hash of the prompt template source. Editing a prompt changes its
+    version, so analyses produced by the old prompt are never served again.
+    """
+    with open(f"{PROMPTS_DIR}{template_name}", "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+class AnalysisCache(Generic[OutputT]):
+    """
+    A two-level cache for structured analyses of input documents: an
+    in-process LRU in front of the Postgres analysis_cache table.
+
+    Entries optionally expire after a TTL, and when a similarity threshold is
+    set, a miss falls back to reusing the analysis of the most similar cached
+    document (by embedding) if it is at least that similar.
+
+    Cache failures are logged and treated as misses; they never fail the
+    interview. Hit rates are published as 'analysis_cache.<kind>.hit_rate'.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        output_model: Type[OutputT],
+        template_name: str,
+        ttl: timedelta | None = None,
+        similarity_threshold: float | None = None,
+    ):
+        self.kind = kind
+        self.output_model = output_model
+        self.template_name = template_name
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self._memory = LRUCache(
+            maxsize=cache_settings.ANALYSIS_CACHE_LRU_SIZE,
+            ttl_seconds=ttl.total_seconds() if ttl else None,
+        )
+        # Embeddings computed during a missed lookup, reused by the following put
+        self._embeddings = LRUCache(maxsize=32)
+        # Memory keys written on behalf of each owner, for invalidate_owner()
+        self._owner_keys: dict[str, set[tuple[str, str]]] = {}
+        self._writes = 0
+
+    def _key(self, text: str) -> tuple[str, str]:
+        return content_hash(text), prompt_version(self.template_name)
+
+    def _load(self, digest: str, version: str) -> dict | None:
+        with get_db_session() as db:
+            entry = AnalysisCacheRepository(db).get(self.kind, digest, version)
+            return dict(entry.payload) if entry else None
+
+    def _find_similar(self, text: str, digest: str, version: str) -> dict | None:
+        embedding = embed_document(normalize_document(text))
+        self._embeddings.put(digest, embedding)
+
+        with get_db_session() as db:
+            repo = AnalysisCacheRepository(db)
+            candidates = repo.get_embeddings(
+                self.kind,
+                version,
+                limit=cache_settings.ANALYSIS_CACHE_SIMILARITY_CANDIDATES,
+            )
+            if not candidates:
+                return None
+
+            matrix = np.asarray([vector for _, vector in candidates], dtype=np.float32)
+            similarities = matrix @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                return None
+
+            entry = repo.get(self.kind, candidates[best][0], version)
+            if entry is None:
+                return None
+            logger.info(
+                f"Reusing '{self.kind}' analysis of a similar document "
+                f"(similarity={similarities[best]:.3f})."
+            )
+            return dict(entry.payload)
+
+    def _store(
+        self,
+        text: str,
+        digest: str,
+        version: str,
+        payload: dict,
+        evict: bool,
+        owner_id: str | None,
+    ) -> None:
+        embedding = None
+        if self.similarity_threshold is not None:
+            embedding = self._embeddings.pop(digest)
+            if embedding is None:
+                embedding = embed_document(normalize_document(text))
+            embedding = embedding.tolist()
+
+        with get_db_session() as db:
+            repo = AnalysisCacheRepository(db)
+            repo.put(
+                self.kind, digest, version, payload, self.ttl, embedding, owner_id
+            )
+            if evict:
+                removed = repo.evict(
+                    self.kind,
+                    max_age_days=cache_settings.ANALYSIS_CACHE_MAX_AGE_DAYS,
+                    max_entries=cache_settings.ANALYSIS_CACHE_MAX_ENTRIES,
+                )
+                if removed:
+                    logger.info(f"Evicted {removed} '{self.kind}' analysis cache rows.")
+
+    async def get(self, text: str | None) -> OutputT | None:
+        """Returns the cached analysis for this document, or None on a miss."""
+        if not text:
+            return None
+        key = self._key(text)
+
+        cached = self._memory.get(key)
+        if cached is not None:
+            logger.info(f"'{self.kind}' analysis served from memory cache.")
+            metrics.record_ratio(f"analysis_cache.{self.kind}", hit=True)
+            return cached
+
+        try:
+            payload = await asyncio.to_thread(self._load, *key)
+            if payload is None and self.similarity_threshold is not None:
+                payload = await asyncio.to_thread(self._find_similar, text, *key)
+                if payload is not None:
+                    metrics.increment(f"analysis_cache.{self.kind}.similar_hits")
+        except Exception as e:
+            logger.error(f"'{self.kind}' analysis cache lookup failed: {e}")
+            payload = None
+
+        metrics.record_ratio(f"analysis_cache.{self.kind}", hit=payload is not None)
+        if payload is None:
+            return None
+
+        result = self.output_model(**payload)
+        self._memory.put(key, result)
+        logger.info(f"'{self.kind}' analysis served from database cache.")
+        return result
+
+    async def put(
+        self, text: str | None, result: OutputT, owner_id: str | None = None
+    ) -> None:
+        """
+        Stores a fresh analysis in both cache levels. Entries written with an
+        owner_id can later be dropped together with invalidate_owner().
+        """
+        if not text:
+            return
+        key = self._key(text)
+        self._memory.put(key, result)
+        if owner_id:
+            self._owner_keys.setdefault(owner_id, set()).add(key)
+
+        self._writes += 1
+        evict = self._writes % cache_settings.ANALYSIS_CACHE_EVICT_EVERY == 0
+        try:
+            await asyncio.to_thread(
+                self._store,
+                text,
+                *key,
+                result.model_dump(mode="json"),
+                evict,
+                owner_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to persist '{self.kind}' analysis to cache: {e}")
+
+    def _delete_owner(self, owner_id: str) -> int:
+        with get_db_session() as db:
+            return AnalysisCacheRepository(db).delete_by_owner(self.kind, owner_id)
+
+    async def invalidate_owner(self, owner_id: str | None) -> None:
+        """Drops every entry written on behalf of this owner, in both levels."""
+        if not owner_id:
+            return
+        for key in self._owner_keys.pop(owner_id, set()):
+            self._memory.pop(key)
+        try:
+            removed = await asyncio.to_thread(self._delete_owner, owner_id)
+            logger.info(
+                f"Invalidated {removed} cached '{self.kind}' entries for {owner_id}."
+            )
+        except Exception as e:
+            logger.error(f"Failed to invalidate '{self.kind}' cache for {owner_id}: {e}")
+
+
+resume_analysis_cache: AnalysisCache[ResumeAnalysisOutput] = AnalysisCache(
+    kind="resume",
+    output_model=ResumeAnalysisOutput,
+    template_name="resume_analyzer.j2",
+)
+
+# Recruiters send one posting to many candidates, so this cache is shared
+# across users. Postings change over time, hence the TTL.
+job_description_analysis_cache: AnalysisCache[JobDescriptionAnalysisOutput] = (
+    AnalysisCache(
+        kind="job_description",
+        output_model=JobDescriptionAnalysisOutput,
+        template_name="job_description_analyzer.j2",
+        ttl=timedelta(hours=cache_settings.JD_ANALYSIS_CACHE_TTL_HOURS),
+        similarity_threshold=(
+            cache_settings.JD_SIMILARITY_THRESHOLD
+            if cache_settings.JD_SIMILARITY_ENABLED
+            else None
+        ),
+    )
+)
+
+# The plan is fully determined by its three inputs; the cache key is their
+# canonical JSON. Entries are owned by the user so a new personalization
+# profile can drop that user's plans.
+interview_plan_cache: AnalysisCache[InterviewPlanOutput] = AnalysisCache(
+    kind="interview_plan",
+    output_model=InterviewPlanOutput,
+    template_name="interview_plan_generator.j2",
+)
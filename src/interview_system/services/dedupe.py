@@ -0,0 +1,175 @@
+# src/interview_system/services/dedupe.py
+import json
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.services.embeddings import embed_texts
+
+logger = logging.getLogger(__name__)
+
+# Cosine similarity above which two question texts count as the same question.
+DEFAULT_THRESHOLD = 0.92
+# Rows per block of the similarity matrix; a block pair costs
+# BLOCK_SIZE**2 * 4 bytes (16 MB at 2048).
+BLOCK_SIZE = 2048
+
+
+def similar_pairs(
+    vectors: np.ndarray, threshold: float, block_size: int = BLOCK_SIZE
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    All pairs (i, j), i < j, of unit vectors with cosine similarity of at
+    least threshold, as (rows, cols, scores) arrays.
+
+    The full n x n matrix never exists: it is computed one block pair of the
+    upper triangle at a time, each a single matrix multiplication, and only
+    the entries above the threshold are kept.
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    n = len(vectors)
+    rows, cols, scores = [], [], []
+    for start in range(0, n, block_size):
+        left = vectors[start : start + block_size]
+        for other in range(start, n, block_size):
+            block = left @ vectors[other : other + block_size].T
+            if other == start:
+                # Diagonal block: only pairs above the diagonal.
+                block = np.triu(block, k=1)
+            i, j = np.nonzero(block >= threshold)
+            if i.size:
+                rows.append(i + start)
+                cols.append(j + other)
+                scores.append(block[i, j])
+    if not rows:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float32)
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(scores)
+
+
+def _components(n: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Connected-component label of every node (union-find with path halving)."""
+    parent = list(range(n))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in zip(rows.tolist(), cols.tolist()):
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+    return np.array([find(x) for x in range(n)])
+
+
+def _canonical_rank(item: Dict[str, Any]) -> tuple:
+    # Prefer the most complete copy: a rubric, pre-generated variants, the
+    # longest ideal answer.
+    return (
+        bool(item.get("rubric_id")),
+        len(item.get("conversational_variants") or []),
+        len(item.get("ideal_answer_snippet") or ""),
+    )
+
+
+class DuplicateCluster:
+    """A group of near-duplicate questions and the one to keep."""
+
+    def __init__(self, canonical: int, members: List[int], similarities: List[float]):
+        self.canonical = canonical
+        # Indices into the question list, canonical included
+        self.members = members
+        # Similarity of each member to the canonical question
+        self.similarities = similarities
+
+    @property
+    def duplicates(self) -> List[int]:
+        return [m for m in self.members if m != self.canonical]
+
+
+def cluster_near_duplicates(
+    items: List[Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    block_size: int = BLOCK_SIZE,
+) -> List[DuplicateCluster]:
+    """
+    Groups questions whose texts embed within threshold of each other.
+    Similarity is transitive here: if A~B and B~C, all three form one
+    cluster. Texts are embedded without the domain prefix, so two different
+    questions in the same domain are not pulled together by it.
+    """
+    if len(items) < 2:
+        return []
+    vectors = embed_texts(
+        [item["text"] for item in items],
+        batch_size=vector_store_settings.EMBED_BATCH_SIZE,
+    )
+    rows, cols, _ = similar_pairs(vectors, threshold, block_size)
+    if not rows.size:
+        return []
+
+    labels = _components(len(items), rows, cols)
+    nodes = np.unique(np.concatenate([rows, cols]))
+    groups: Dict[int, List[int]] = {}
+    for node in nodes.tolist():
+        groups.setdefault(int(labels[node]), []).append(node)
+
+    clusters = []
+    for members in groups.values():
+        # max() keeps the first of equals, i.e. the earliest in the file.
+        canonical = max(members, key=lambda m: _canonical_rank(items[m]))
+        similarities = (vectors[members] @ vectors[canonical]).tolist()
+        clusters.append(DuplicateCluster(canonical, members, similarities))
+    clusters.sort(key=lambda c: -len(c.members))
+    logger.info(
+        f"Found {len(clusters)} near-duplicate clusters covering "
+        f"{sum(len(c.members) for c in clusters)} of {len(items)} questions."
+    )
+    return clusters
+
+
+def drop_duplicates(
+    items: List[Dict[str, Any]], clusters: List[DuplicateCluster]
+) -> List[Dict[str, Any]]:
+    """The questions with only the canonical member of each cluster kept."""
+    dropped = {m for cluster in clusters for m in cluster.duplicates}
+    return [item for i, item in enumerate(items) if i not in dropped]
+
+
+def write_report(
+    path: str,
+    items: List[Dict[str, Any]],
+    clusters: List[DuplicateCluster],
+    threshold: float,
+) -> None:
+    """Writes the clusters as JSON, canonical question first in each."""
+    report = {
+        "threshold": threshold,
+        "questions": len(items),
+        "clusters": len(clusters),
+        "duplicates": sum(len(c.duplicates) for c in clusters),
+        "groups": [
+            {
+                "canonical_id": items[cluster.canonical]["id"],
+                "members": sorted(
+                    (
+                        {
+                            "id": items[m]["id"],
+                            "domain": items[m].get("domain"),
+                            "text": items[m]["text"],
+                            "similarity": round(similarity, 4),
+                        }
+                        for m, similarity in zip(cluster.members, cluster.similarities)
+                    ),
+                    key=lambda member: -member["similarity"],
+                ),
+            }
+            for cluster in clusters
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,78 @@
+# src/interview_system/services/domain_catalog.py
+import json
+import logging
+import threading
+import time
+from typing import Iterable, Set
+
+from interview_system.api.database import get_db_session
+from interview_system.config.retrieval_config import retrieval_settings
+from interview_system.repositories.question_repository import QuestionRepository
+
+logger = logging.getLogger(__name__)
+
+
+def domain_matches(candidate: str, domain: str) -> bool:
+    """
+    Whether a stored question domain serves a requested topic. The seed script
+    prefixes domains with their category ("technical-python"), so a suffix
+    match counts as well as an exact one.
+    """
+    candidate = candidate.strip()
+    return (
+        candidate == domain
+        or candidate.endswith(f"-{domain}")
+        or candidate.endswith(f":{domain}")
+    )
+
+
+class DomainCatalog:
+    """
+    The set of domains present in the question bank. The vector stores can
+    only filter on exact metadata values, so plan topics are resolved against
+    this set (see domain_taxonomy.py) before being pushed into the query.
+    """
+
+    def __init__(self, seed_file: str, ttl_seconds: float):
+        self.seed_file = seed_file
+        self.ttl_seconds = ttl_seconds
+        self._domains: Set[str] = set()
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Set[str]:
+        domains: Set[str] = set()
+        try:
+            with open(self.seed_file, "r", encoding="utf-8") as f:
+                domains.update(q["domain"] for q in json.load(f) if q.get("domain"))
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read domains from {self.seed_file}: {e}")
+        try:
+            with get_db_session() as db:
+                domains.update(
+                    d for d in QuestionRepository(db).get_distinct_domains() if d
+                )
+        except Exception as e:
+            logger.warning(f"Could not read domains from questions_meta: {e}")
+        return domains
+
+    def domains(self) -> Set[str]:
+        with self._lock:
+            if (
+                self._loaded_at is None
+                or time.monotonic() - self._loaded_at > self.ttl_seconds
+            ):
+                self._domains = self._load()
+                self._loaded_at = time.monotonic()
+            return self._domains
+
+    def register(self, domains: Iterable[str]) -> None:
+        """Adds domains written to the index since the last refresh."""
+        with self._lock:
+            self._domains.update(d for d in domains if d)
+
+
+domain_catalog = DomainCatalog(
+    seed_file=retrieval_settings.DOMAIN_CATALOG_FILE,
+    ttl_seconds=retrieval_settings.DOMAIN_CATALOG_TTL_SECONDS,
+)
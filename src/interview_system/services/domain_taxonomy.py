@@ -0,0 +1,213 @@
+# src/interview_system/services/domain_taxonomy.py
+import json
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Set
+
+import numpy as np
+
+from interview_system.config.retrieval_config import retrieval_settings
+from interview_system.services import metrics
+from interview_system.services.domain_catalog import domain_catalog
+from interview_system.services.embedding_service import embedding_batcher
+from interview_system.services.embeddings import embed_texts
+from interview_system.services.memory_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Category prefixes the seed script puts in front of bank domains.
+CATEGORIES = {
+    "technical": "technical",
+    "behavioral": "behavioral",
+    "behavioural": "behavioral",
+}
+
+# Short forms interview plans use for bank subjects (subject -> alias list).
+DEFAULT_ALIASES: Dict[str, List[str]] = {
+    "machine-learning": ["ml"],
+    "deep-learning": ["dl", "neural-networks"],
+    "data-science": ["ds", "tech-ds", "data-analysis"],
+    "c-plus-plus": ["cpp", "c++"],
+    "statistics": ["stats"],
+    "probability": ["probability-theory"],
+    "tech-sysdesign": ["system-design", "sysdesign"],
+    "programming": ["coding", "programming-fundamentals"],
+}
+
+
+def normalize_topic(text: str) -> str:
+    """'Technical: Data Science' -> 'technical-data-science'."""
+    text = text.strip().lower().replace("_", "-")
+    text = re.sub(r"[\s:/]+", "-", text)
+    return re.sub(r"-{2,}", "-", text).strip("-")
+
+
+def split_category(key: str) -> tuple[str | None, str]:
+    """'technical-data-science' -> ('technical', 'data-science')."""
+    head, _, rest = key.partition("-")
+    if head in CATEGORIES:
+        return CATEGORIES[head], rest or head
+    return None, key
+
+
+class DomainTaxonomy:
+    """
+    Maps free-text plan topics ("technical:python-fundamentals") onto the
+    domains that actually exist in the question bank ("technical-python").
+
+    The index is rebuilt whenever the domain catalog changes: an alias table
+    (full names, bare subjects, spelling variants, DEFAULT_ALIASES and an
+    optional aliases file) plus one embedding per domain. A topic is resolved
+    by alias first and by nearest embedding second, and the answer is cached,
+    so a repeated topic costs a dictionary lookup.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._source: frozenset[str] = frozenset()
+        self._aliases: Dict[str, Set[str]] = defaultdict(set)
+        # (sorted domains, their label embeddings), swapped in one assignment
+        self._index: tuple[List[str], np.ndarray] = ([], np.empty((0, 0)))
+        self._resolved = LRUCache(4096)
+        # topic -> [count, last seen (epoch seconds)]
+        self._unresolved: Dict[str, List[float]] = {}
+
+    # --- Index building ---
+
+    def warm(self) -> None:
+        """Builds the index now rather than on the first retrieval."""
+        self._ensure_index()
+
+    def _ensure_index(self) -> None:
+        domains = frozenset(domain_catalog.domains())
+        if domains == self._source:
+            return
+        with self._lock:
+            if domains == self._source:
+                return
+            self._build(domains)
+
+    def _build(self, domains: frozenset[str]) -> None:
+        aliases: Dict[str, Set[str]] = defaultdict(set)
+        subject_aliases = _load_aliases()
+
+        for domain in domains:
+            key = normalize_topic(domain)
+            category, subject = split_category(key)
+            keys = {key, subject, subject.replace("-", "")}
+            for alias in subject_aliases.get(subject, []):
+                keys.add(normalize_topic(alias))
+            for k in keys:
+                aliases[k].add(domain)
+                if category:
+                    aliases[f"{category}-{k}"].add(domain)
+
+        ordered = sorted(domains)
+        labels = [normalize_topic(d).replace("-", " ") for d in ordered]
+        vectors = (
+            embed_texts(labels) if labels else np.empty((0, 0), dtype=np.float32)
+        )
+
+        self._aliases = aliases
+        self._index = (ordered, vectors)
+        self._source = domains
+        self._resolved.clear()
+        logger.info(f"Built domain taxonomy over {len(ordered)} domains.")
+
+    # --- Resolution ---
+
+    def resolve(self, topic: str) -> List[str]:
+        """
+        The bank domains a plan topic should draw questions from, best first.
+        Returns [] (and records the topic for admins) if nothing is close.
+        """
+        self._ensure_index()
+        domains = self._resolved.get(topic)
+        if domains is None:
+            key = normalize_topic(topic)
+            category, subject = split_category(key)
+            domains = self._by_alias(key, category, subject) or self._by_embedding(
+                key, category
+            )
+            self._resolved.put(topic, domains)
+
+        metrics.record_ratio("taxonomy.resolved", bool(domains))
+        if not domains:
+            self._record_unresolved(topic)
+        return domains
+
+    def _by_alias(self, key: str, category: str | None, subject: str) -> List[str]:
+        for candidate in (key, subject, subject.replace("-", "")):
+            matches = self._aliases.get(candidate)
+            if matches:
+                return sorted(self._prefer_category(matches, category))
+        return []
+
+    def _by_embedding(self, key: str, category: str | None) -> List[str]:
+        domains, vectors = self._index
+        if not domains:
+            return []
+        query = embedding_batcher.embed([key.replace("-", " ")])[0]
+        scores = vectors @ query
+        if category:
+            # Never answer a technical topic with behavioral questions.
+            in_category = np.array(
+                [split_category(normalize_topic(d))[0] == category for d in domains]
+            )
+            if in_category.any():
+                scores = np.where(in_category, scores, -1.0)
+
+        best = float(scores.max())
+        if best < retrieval_settings.TAXONOMY_MIN_SIMILARITY:
+            return []
+        order = np.argsort(-scores)[: retrieval_settings.TAXONOMY_MAX_DOMAINS]
+        return [
+            domains[i]
+            for i in order
+            if scores[i] >= best - retrieval_settings.TAXONOMY_SCORE_MARGIN
+        ]
+
+    @staticmethod
+    def _prefer_category(domains: Set[str], category: str | None) -> Set[str]:
+        if not category:
+            return domains
+        same = {d for d in domains if split_category(normalize_topic(d))[0] == category}
+        return same or domains
+
+    # --- Unresolved topics ---
+
+    def _record_unresolved(self, topic: str) -> None:
+        logger.warning(f"Plan topic '{topic}' matches no question bank domain.")
+        with self._lock:
+            entry = self._unresolved.setdefault(topic, [0, 0.0])
+            entry[0] += 1
+            entry[1] = time.time()
+
+    def unresolved_topics(self) -> List[Dict[str, object]]:
+        """Topics that resolved to no domain in this worker, most frequent first."""
+        with self._lock:
+            items = sorted(self._unresolved.items(), key=lambda kv: -kv[1][0])
+        return [
+            {"topic": topic, "count": int(count), "last_seen": last_seen}
+            for topic, (count, last_seen) in items
+        ]
+
+
+def _load_aliases() -> Dict[str, List[str]]:
+    """DEFAULT_ALIASES merged with DOMAIN_ALIASES_FILE ({subject: [aliases]})."""
+    aliases = {subject: list(names) for subject, names in DEFAULT_ALIASES.items()}
+    path = retrieval_settings.DOMAIN_ALIASES_FILE
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for subject, names in json.load(f).items():
+                    aliases.setdefault(normalize_topic(subject), []).extend(names)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read domain aliases from {path}: {e}")
+    return aliases
+
+
+domain_taxonomy = DomainTaxonomy()
@@ -0,0 +1,159 @@
+# src/interview_system/services/embedding_service.py
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List
+
+import numpy as np
+
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.services import metrics
+from interview_system.services.embeddings import embed_texts
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class _Request:
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class EmbeddingBatcher:
+    """
+    Owns the embedding model for query-sized encodes and runs them in
+    micro-batches on one dedicated thread.
+
+    Callers submit texts and get a Future back. The worker takes the oldest
+    request, collects whatever else arrives within max_wait_ms of it (up to
+    max_batch_size texts), and encodes all of it in one forward pass, so
+    concurrent retrievals share a batch instead of each running its own.
+    Under load the queue fills while a batch is encoding and the next batch
+    leaves without waiting; when idle a lone request waits at most
+    max_wait_ms. Identical texts within a batch are encoded once.
+
+    The model releases the GIL inside torch, so the event loop keeps running
+    while a batch encodes. Bulk jobs (seeding, reindexing) already hand the
+    model large batches and call embed_texts directly.
+    """
+
+    def __init__(
+        self, max_batch_size: int, max_wait_ms: float, enabled: bool = True
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        self.enabled = enabled
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, texts: List[str]) -> Future:
+        """
+        Queues texts for embedding. The future resolves to an (n, dim) float32
+        matrix of unit vectors, row-aligned with texts.
+        """
+        request = _Request(list(texts))
+        if not self.enabled:
+            # Run inline, but keep the same contract for callers.
+            request.future.set_running_or_notify_cancel()
+            self._run_batch([request], time.monotonic())
+            return request.future
+        self._ensure_worker()
+        self._queue.put(request)
+        return request.future
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Blocking embed through the batcher, for sync callers."""
+        return self.submit(texts).result()
+
+    async def aembed(self, texts: List[str]) -> np.ndarray:
+        """
+        Awaits an embed without occupying a thread. Cancelling the awaiting
+        task drops the request if its batch has not started yet.
+        """
+        return await asyncio.wrap_future(self.submit(texts))
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="embed-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if not batch:
+                continue
+            started = time.monotonic()
+            for request in batch:
+                metrics.observe(
+                    "embedding.queue_wait_ms", (started - request.enqueued_at) * 1000
+                )
+            self._run_batch(batch, started)
+
+    def _collect(self) -> List[_Request]:
+        first = self._queue.get()
+        batch, size = [], 0
+        deadline = first.enqueued_at + self.max_wait_seconds
+        request = first
+        while True:
+            # Skips requests whose caller has already given up.
+            if request.future.set_running_or_notify_cancel():
+                batch.append(request)
+                size += len(request.texts)
+            if size >= self.max_batch_size:
+                break
+            try:
+                # A timeout of 0 only takes what is already queued.
+                request = self._queue.get(
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+            except queue.Empty:
+                break
+        return batch
+
+    def _run_batch(self, batch: List[_Request], started: float) -> None:
+        unique = list(dict.fromkeys(text for r in batch for text in r.texts))
+        try:
+            vectors = embed_texts(
+                unique, batch_size=vector_store_settings.EMBED_BATCH_SIZE
+            )
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(unique)} texts failed: {e}")
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        elapsed = time.monotonic() - started
+        rows = {text: i for i, text in enumerate(unique)}
+        for request in batch:
+            request.future.set_result(vectors[[rows[t] for t in request.texts]])
+
+        metrics.increment("embedding.batches")
+        metrics.increment("embedding.texts", len(unique))
+        metrics.observe("embedding.batch_size", len(unique), BATCH_SIZE_BUCKETS)
+        metrics.observe(
+            "embedding.requests_per_batch", len(batch), BATCH_SIZE_BUCKETS
+        )
+        metrics.observe("embedding.encode_ms", elapsed * 1000)
+        if elapsed > 0:
+            metrics.set_gauge(
+                "embedding.texts_per_second", round(len(unique) / elapsed, 1)
+            )
+
+
+embedding_batcher = EmbeddingBatcher(
+    max_batch_size=vector_store_settings.EMBED_MAX_BATCH_SIZE,
+    max_wait_ms=vector_store_settings.EMBED_MAX_WAIT_MS,
+    enabled=vector_store_settings.EMBED_BATCHING_ENABLED,
+)
@@ -0,0 +1,209 @@
+# src/interview_system/services/embedding_snapshot.py
+"""
+On-disk snapshot format for the question bank's embeddings.
+
+A snapshot is a directory holding:
+
+  * manifest.json   - format version, embedding model, dimension, count, dtype
+  * embeddings.npy  - (count, dim) float32, float16 or int8 matrix
+  * scales.npy      - per-row float32 scales (int8 snapshots only)
+  * metadata.json   - columnar metadata: the id list plus one list per field;
+                      low-cardinality columns are dictionary-encoded
+
+The matrices are opened with np.load(mmap_mode="r"), so opening a snapshot
+costs milliseconds and every worker process on the host shares the same
+page-cache pages instead of holding its own copy.
+"""
+import json
+import os
+import shutil
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from interview_system.services.embeddings import EMBEDDING_MODEL_NAME
+
+FORMAT_VERSION = 1
+QUANTIZATIONS = ("float32", "float16", "int8")
+
+MANIFEST_FILE = "manifest.json"
+EMBEDDINGS_FILE = "embeddings.npy"
+SCALES_FILE = "scales.npy"
+METADATA_FILE = "metadata.json"
+
+
+class EmbeddingSnapshot:
+    """A loaded snapshot. `vectors` and `scales` are read-only memory maps."""
+
+    def __init__(
+        self,
+        manifest: Dict[str, Any],
+        ids: List[str],
+        vectors: np.ndarray,
+        scales: Optional[np.ndarray],
+        columns: Dict[str, List[Any]],
+    ):
+        self.manifest = manifest
+        self.ids = ids
+        self.vectors = vectors
+        self.scales = scales
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def metadata_rows(self) -> List[Dict[str, Any]]:
+        """Turns the columnar metadata back into one dict per row."""
+        fields = list(self.columns)
+        return [
+            {field: self.columns[field][i] for field in fields}
+            for i in range(len(self.ids))
+        ]
+
+
+def quantize(vectors: np.ndarray, dtype: str) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Converts a float32 matrix of unit vectors to the snapshot dtype.
+
+    int8 uses symmetric per-row scaling: row * 127 / max|row|, rounded, with
+    the scale kept so scores can be rescaled at query time.
+    """
+    if dtype not in QUANTIZATIONS:
+        raise ValueError(f"Unsupported quantization '{dtype}'.")
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if dtype == "float32":
+        return vectors, None
+    if dtype == "float16":
+        return vectors.astype(np.float16), None
+
+    peak = np.abs(vectors).max(axis=1)
+    scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+    codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales
+
+
+def dequantize(vectors: np.ndarray, scales: Optional[np.ndarray]) -> np.ndarray:
+    """Returns a float32 copy of a (possibly quantized) matrix."""
+    dense = np.asarray(vectors, dtype=np.float32)
+    if scales is not None:
+        dense = dense * scales[:, None]
+    return dense
+
+
+def _encode_column(values: List[Any]) -> Dict[str, Any]:
+    # Domains and difficulties repeat across thousands of rows; store each
+    # distinct value once and reference it by index.
+    try:
+        distinct = list(dict.fromkeys(values))
+    except TypeError:  # unhashable values, e.g. lists of variants
+        return {"values": values}
+    if len(distinct) * 2 > len(values):
+        return {"values": values}
+    index = {value: i for i, value in enumerate(distinct)}
+    return {"dictionary": distinct, "codes": [index[v] for v in values]}
+
+
+def _decode_column(column: Dict[str, Any]) -> List[Any]:
+    if "dictionary" in column:
+        dictionary = column["dictionary"]
+        return [dictionary[code] for code in column["codes"]]
+    return column["values"]
+
+
+def write_snapshot(
+    directory: str,
+    ids: List[str],
+    vectors: np.ndarray,
+    metadata: List[Dict[str, Any]],
+    dtype: str = "float16",
+) -> Dict[str, Any]:
+    """
+    Writes a snapshot of unit-length embeddings and their metadata.
+
+    The snapshot is written into a sibling directory that then replaces the
+    old one, so a reader sees either the old snapshot or the new one, never
+    files of both. Returns the manifest.
+    """
+    if len(ids) != len(vectors) or len(ids) != len(metadata):
+        raise ValueError("ids, vectors and metadata must have the same length.")
+    final_directory = os.path.normpath(directory)
+    directory = f"{final_directory}.tmp-{os.getpid()}"
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+    codes, scales = quantize(vectors, dtype)
+    fields = list(dict.fromkeys(field for meta in metadata for field in meta))
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "model": EMBEDDING_MODEL_NAME,
+        "dim": int(codes.shape[1]) if codes.ndim == 2 else 0,
+        "count": len(ids),
+        "dtype": dtype,
+        "created_at": time.time(),
+    }
+
+    def _write(name: str, write) -> None:
+        with open(os.path.join(directory, name), "wb") as f:
+            write(f)
+
+    _write(EMBEDDINGS_FILE, lambda f: np.save(f, codes))
+    if scales is not None:
+        _write(SCALES_FILE, lambda f: np.save(f, scales))
+
+    columns = {
+        field: _encode_column([meta.get(field) for meta in metadata])
+        for field in fields
+    }
+    _write(
+        METADATA_FILE,
+        lambda f: f.write(
+            json.dumps({"ids": ids, "columns": columns}, ensure_ascii=False).encode(
+                "utf-8"
+            )
+        ),
+    )
+    _write(MANIFEST_FILE, lambda f: f.write(json.dumps(manifest, indent=2).encode()))
+
+    # A directory cannot be renamed over a non-empty one: move the old
+    # snapshot aside first. Until the second rename the snapshot is briefly
+    # absent, which readers already treat as "no snapshot". Workers that
+    # memory-mapped the old files keep reading them after they are removed.
+    previous = f"{final_directory}.old-{os.getpid()}"
+    if os.path.exists(final_directory):
+        os.replace(final_directory, previous)
+    os.replace(directory, final_directory)
+    shutil.rmtree(previous, ignore_errors=True)
+    return manifest
+
+
+def read_snapshot(directory: str) -> EmbeddingSnapshot:
+    """Opens a snapshot written by write_snapshot, memory-mapping its matrices."""
+    with open(os.path.join(directory, MANIFEST_FILE), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot format version {manifest.get('format_version')}."
+        )
+    if manifest.get("model") != EMBEDDING_MODEL_NAME:
+        raise ValueError(
+            f"Snapshot was built with '{manifest.get('model')}', "
+            f"but the configured embedding model is '{EMBEDDING_MODEL_NAME}'."
+        )
+
+    vectors = np.load(os.path.join(directory, EMBEDDINGS_FILE), mmap_mode="r")
+    scales = None
+    if manifest["dtype"] == "int8":
+        scales = np.load(os.path.join(directory, SCALES_FILE), mmap_mode="r")
+
+    with open(os.path.join(directory, METADATA_FILE), "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    columns = {field: _decode_column(col) for field, col in raw["columns"].items()}
+
+    return EmbeddingSnapshot(
+        manifest=manifest,
+        ids=raw["ids"],
+        vectors=vectors,
+        scales=scales,
+        columns=columns,
+    )
@@ -0,0 +1,72 @@
+# src/interview_system/services/embeddings.py
+import threading
+from typing import Any, Dict, List
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from interview_system.config.vector_store_config import vector_store_settings
+
+# The one embedding model used for the question bank and all similarity checks.
+EMBEDDING_MODEL_NAME = vector_store_settings.EMBEDDING_MODEL_NAME
+# The text a bank question is indexed under.
+QUESTION_TEXT_TEMPLATE = vector_store_settings.QUESTION_TEXT_TEMPLATE
+
+# Other models are only loaded by reindexing tools comparing two versions.
+_models: Dict[str, SentenceTransformer] = {}
+_model_lock = threading.Lock()
+
+
+def get_embedding_model(model_name: str | None = None) -> SentenceTransformer:
+    """Get a singleton instance of the SentenceTransformer model."""
+    model_name = model_name or EMBEDDING_MODEL_NAME
+    model = _models.get(model_name)
+    if model is None:
+        with _model_lock:
+            model = _models.get(model_name)
+            if model is None:
+                model = _models[model_name] = SentenceTransformer(
+                    model_name, device="cpu"
+                )
+    return model
+
+
+def question_embedding_text(item: Dict[str, Any], template: str | None = None) -> str:
+    """The text a bank question is indexed under. Includes the domain."""
+    return (template or QUESTION_TEXT_TEMPLATE).format(
+        domain=item["domain"], text=item["text"]
+    )
+
+
+def embed_texts(
+    texts: List[str], batch_size: int = 32, model_name: str | None = None
+) -> np.ndarray:
+    """
+    Embeds a batch of texts into an (n, dim) float32 matrix of unit vectors,
+    so dot products are cosine similarities. batch_size is the number of
+    texts per forward pass of the model.
+    """
+    vectors = get_embedding_model(model_name).encode(
+        texts,
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def embed_document(text: str, window_words: int = 200) -> np.ndarray:
+    """
+    Embeds a long document as the normalized mean of fixed-size word windows.
+
+    The model truncates its input, so embedding a whole document at once would
+    ignore everything past the first few hundred tokens.
+    """
+    words = text.split()
+    windows = [
+        " ".join(words[i : i + window_words])
+        for i in range(0, max(len(words), 1), window_words)
+    ]
+    mean = embed_texts(windows).mean(axis=0)
+    norm = np.linalg.norm(mean)
+    return mean / norm if norm else mean
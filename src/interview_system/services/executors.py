@@ -0,0 +1,34 @@
+# src/interview_system/services/executors.py
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from interview_system.config.vector_store_config import vector_store_settings
+
+T = TypeVar("T")
+
+# Dedicated pools keep blocking work off the event loop without competing for
+# the default executor that asyncio.to_thread and FastAPI's sync routes share.
+# Embedding is CPU-bound (the model releases the GIL inside torch), so its pool
+# is small; vector store calls mostly wait on the network, so theirs is wider.
+embedding_executor = ThreadPoolExecutor(
+    max_workers=vector_store_settings.EMBED_WORKERS,
+    thread_name_prefix="embed",
+)
+io_executor = ThreadPoolExecutor(
+    max_workers=vector_store_settings.VECTOR_STORE_IO_WORKERS,
+    thread_name_prefix="vector-io",
+)
+
+
+async def run_in_executor(
+    executor: ThreadPoolExecutor, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """
+    Runs fn on the given pool and awaits it. Cancelling the awaiting task
+    cancels the call if it has not started yet; a call already running
+    finishes in its thread and its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
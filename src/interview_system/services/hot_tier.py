@@ -0,0 +1,168 @@
+# src/interview_system/services/hot_tier.py
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from interview_system.config.retrieval_config import retrieval_settings
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.services import metrics
+from interview_system.services.embeddings import embed_texts, question_embedding_text
+from interview_system.services.local_store import LocalVectorStore
+from interview_system.services.question_bank import load_question_bank
+
+logger = logging.getLogger(__name__)
+
+
+class HotDomainTier:
+    """
+    A process-local copy of every question in the most queried domains.
+
+    Retrievals record which bank domains they asked for. Every
+    HOT_TIER_REFRESH_SECONDS a background thread picks the busiest domains,
+    embeds their questions (reusing vectors from the previous refresh) into
+    an exact in-memory index, and swaps it in. Lookups whose domains are all
+    hot are then answered with one matrix-vector product instead of a remote
+    query; anything else returns None and goes to the vector store.
+    """
+
+    def __init__(
+        self,
+        max_domains: int,
+        min_queries: int,
+        refresh_seconds: float,
+        max_questions: int,
+    ):
+        self.max_domains = max_domains
+        self.min_queries = min_queries
+        self.refresh_seconds = refresh_seconds
+        self.max_questions = max_questions
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._refreshed_at = time.monotonic()
+        # Swapped as a unit by _refresh: (hot domains, index over them)
+        self._tier: tuple[frozenset[str], Optional[LocalVectorStore]] = (
+            frozenset(),
+            None,
+        )
+        # question id -> (embedding text, vector), so refreshes only embed
+        # questions that are new or changed
+        self._vectors: Dict[str, tuple[str, np.ndarray]] = {}
+
+    @property
+    def hot_domains(self) -> frozenset[str]:
+        return self._tier[0]
+
+    def record(self, domains: List[str]) -> None:
+        """Counts one retrieval against each domain, refreshing when due."""
+        with self._lock:
+            self._counts.update(domains)
+            due = (
+                not self._refreshing
+                and time.monotonic() - self._refreshed_at >= self.refresh_seconds
+            )
+            if due:
+                self._refreshing = True
+        if due:
+            threading.Thread(
+                target=self._refresh, name="hot-tier-refresh", daemon=True
+            ).start()
+
+    def invalidate(self) -> None:
+        """Makes the next recorded retrieval trigger a refresh (e.g. after a write)."""
+        with self._lock:
+            self._refreshed_at = float("-inf")
+
+    def query(
+        self,
+        domains: List[str],
+        where: Dict[str, Any],
+        top_k: int,
+        query_vector: List[float],
+    ) -> List[Dict[str, Any]] | None:
+        """Candidates from memory, or None if any requested domain is cold."""
+        hot, store = self._tier
+        served = bool(domains) and store is not None and hot.issuperset(domains)
+        metrics.record_ratio("retrieval.hot_tier", served)
+        if not served:
+            return None
+        return store.query_similar("", top_k, where, query_vector=query_vector)
+
+    def _refresh(self) -> None:
+        try:
+            with self._lock:
+                window = self._counts
+                # Each window counts on its own, so the tier follows shifts in
+                # traffic rather than all-time totals.
+                self._counts = Counter()
+            candidates = [
+                domain
+                for domain, count in window.most_common(self.max_domains)
+                if count >= self.min_queries
+            ]
+            if not candidates:
+                self._tier = (frozenset(), None)
+                return
+
+            by_domain: Dict[str, List[Dict[str, Any]]] = {d: [] for d in candidates}
+            for q in load_question_bank():
+                if q.get("domain") in by_domain:
+                    by_domain[q["domain"]].append(q)
+            # Whole domains only, busiest first: a partly loaded (or empty)
+            # domain would be answered from memory with too few candidates.
+            hot, items = set(), []
+            for domain in candidates:
+                size = len(by_domain[domain])
+                if not size or len(items) + size > self.max_questions:
+                    continue
+                hot.add(domain)
+                items.extend(by_domain[domain])
+            hot = frozenset(hot)
+            vectors = self._embed(items)
+
+            store = LocalVectorStore()
+            if items:
+                store.upsert_vectors(items, vectors)
+            self._tier = (hot, store) if hot else (frozenset(), None)
+            logger.info(
+                f"Hot tier refreshed: {len(items)} questions in {sorted(hot)}."
+            )
+        except Exception as e:
+            logger.warning(f"Hot tier refresh failed, keeping previous tier: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+                self._refreshed_at = time.monotonic()
+
+    def _embed(self, items: List[Dict[str, Any]]) -> np.ndarray:
+        texts = [question_embedding_text(item) for item in items]
+        missing = [
+            i
+            for i, (item, text) in enumerate(zip(items, texts))
+            if self._vectors.get(item["id"], (None,))[0] != text
+        ]
+        if missing:
+            fresh = embed_texts(
+                [texts[i] for i in missing],
+                batch_size=vector_store_settings.EMBED_BATCH_SIZE,
+            )
+            for i, vector in zip(missing, fresh):
+                self._vectors[items[i]["id"]] = (texts[i], vector)
+        # Drop vectors of questions that left the tier.
+        keep = {item["id"] for item in items}
+        self._vectors = {k: v for k, v in self._vectors.items() if k in keep}
+        if not items:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([self._vectors[item["id"]][1] for item in items])
+
+
+hot_tier = HotDomainTier(
+    max_domains=retrieval_settings.HOT_TIER_MAX_DOMAINS,
+    min_queries=retrieval_settings.HOT_TIER_MIN_QUERIES,
+    refresh_seconds=retrieval_settings.HOT_TIER_REFRESH_SECONDS,
+    max_questions=retrieval_settings.HOT_TIER_MAX_QUESTIONS,
+)
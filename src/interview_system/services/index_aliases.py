@@ -0,0 +1,152 @@
+# src/interview_system/services/index_aliases.py
+import logging
+import threading
+import time
+from typing import Dict
+
+from interview_system.api.database import get_db_session
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.repositories.index_alias_repository import IndexAliasRepository
+from interview_system.services.embeddings import (
+    EMBEDDING_MODEL_NAME,
+    QUESTION_TEXT_TEMPLATE,
+)
+from interview_system.services.namespaces import SHARD_SEPARATOR
+
+logger = logging.getLogger(__name__)
+
+
+def version_namespace(alias: str, version: str) -> str:
+    """'updated-namespace' + 'v2' -> 'updated-namespace.v2'."""
+    return f"{alias}.{version}"
+
+
+def is_compatible(version) -> bool:
+    """Whether this worker embeds queries the way the version was built."""
+    return (
+        version.model == EMBEDDING_MODEL_NAME
+        and version.text_template == QUESTION_TEXT_TEMPLATE
+    )
+
+
+class IndexAliasResolver:
+    """
+    Maps the namespaces callers use onto the versioned builds behind them.
+
+    Routes are read from index_aliases and refreshed every
+    INDEX_ALIAS_TTL_SECONDS, so a flip reaches every worker within that time.
+    Flipping is one row update, so a worker sees either the old version or
+    the new one, never a mix. A worker whose embedding settings do not match
+    the live version (e.g. during a model rollout) keeps serving the previous
+    version instead. Namespaces without an alias are used as they are.
+
+    resolve() is called on the event loop by async retrievals, so it only
+    reads the cached routes: expired routes are re-read on a background
+    thread while the old ones keep being served. Only the very first
+    resolve of a process waits for the table; the app loads it at startup
+    (see api/main.py), so for requests that only happens in scripts.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        # Guards the swap of _routes/_loaded_at only; never held during a read
+        # of the table.
+        self._lock = threading.Lock()
+        # Held by the one background refresh in flight; taken without blocking.
+        self._refresh_lock = threading.Lock()
+        # Serializes the synchronous first load.
+        self._first_load_lock = threading.Lock()
+        self._routes: Dict[str, str] = {}
+        self._loaded_at = float("-inf")
+        self._loaded = False
+
+    def resolve(self, namespace: str | None) -> str | None:
+        """The physical namespace behind a logical one (domain shards included)."""
+        if not namespace:
+            return namespace
+        base, separator, shard = namespace.partition(SHARD_SEPARATOR)
+        return self._current().get(base, base) + separator + shard
+
+    def refresh(self) -> None:
+        """Reads the aliases now (at startup, or after a flip in a script)."""
+        self._store(self._load())
+
+    def invalidate(self) -> None:
+        """Re-reads the aliases in the background on the next resolve."""
+        with self._lock:
+            self._loaded_at = float("-inf")
+
+    def _current(self) -> Dict[str, str]:
+        if not self._loaded:
+            with self._first_load_lock:
+                if not self._loaded:
+                    self.refresh()
+        elif time.monotonic() - self._loaded_at >= self.ttl_seconds:
+            self._refresh_in_background()
+        return self._routes
+
+    def _refresh_in_background(self) -> None:
+        if not self._refresh_lock.acquire(blocking=False):
+            return  # A refresh is already running.
+        try:
+            threading.Thread(
+                target=self._background_load, name="index-aliases", daemon=True
+            ).start()
+        except BaseException:
+            self._refresh_lock.release()
+            raise
+
+    def _background_load(self) -> None:
+        try:
+            self._store(self._load())
+        finally:
+            self._refresh_lock.release()
+
+    def _load(self) -> Dict[str, str] | None:
+        """Reads the routes from the table; None if it cannot be read."""
+        try:
+            routes = {}
+            with get_db_session() as db:
+                repo = IndexAliasRepository(db)
+                for entry in repo.get_aliases():
+                    routes[entry.alias] = self._route(repo, entry)
+            return routes
+        except Exception as e:
+            # Keep serving the last known routes rather than failing retrievals.
+            logger.warning(f"Could not read index aliases, keeping previous: {e}")
+            return None
+
+    def _store(self, routes: Dict[str, str] | None) -> None:
+        with self._lock:
+            if routes is not None:
+                if routes != self._routes:
+                    logger.info(f"Index aliases: {routes}")
+                self._routes = routes
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+
+    @staticmethod
+    def _route(repo: IndexAliasRepository, entry) -> str:
+        target = repo.get_version(entry.target)
+        if target is None or is_compatible(target):
+            return entry.target
+        previous = (
+            repo.get_version(entry.previous_target) if entry.previous_target else None
+        )
+        if previous is not None and is_compatible(previous):
+            logger.warning(
+                f"'{entry.alias}' points at {entry.target} (model {target.model}); "
+                f"this worker embeds with {EMBEDDING_MODEL_NAME}, serving "
+                f"{entry.previous_target} instead."
+            )
+            return entry.previous_target
+        logger.error(
+            f"'{entry.alias}' points at {entry.target}, built with model "
+            f"{target.model}, which does not match this worker's embedding settings."
+        )
+        return entry.target
+
+
+index_aliases = IndexAliasResolver(
+    ttl_seconds=vector_store_settings.INDEX_ALIAS_TTL_SECONDS
+)
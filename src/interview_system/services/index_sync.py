@@ -0,0 +1,183 @@
+# src/interview_system/services/index_sync.py
+import hashlib
+import json
+import logging
+import os
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from interview_system.services.embeddings import (
+    EMBEDDING_MODEL_NAME,
+    QUESTION_TEXT_TEMPLATE,
+)
+from interview_system.services.namespaces import group_by_namespace
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+
+# Every field that ends up in the vector or its metadata. A change to any of
+# them changes the content hash and re-upserts the question.
+HASHED_FIELDS = (
+    "text",
+    "domain",
+    "difficulty",
+    "ideal_answer_snippet",
+    "rubric_id",
+    "conversational_variants",
+)
+
+
+def content_hash(item: Dict[str, Any]) -> str:
+    """SHA-256 over the indexed fields of a question. Missing and empty are equal."""
+    payload = {field: item.get(field) or None for field in HASHED_FIELDS}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SyncPlan:
+    """What one sync run has to write: upserts and deletes per namespace."""
+
+    def __init__(self):
+        self.upserts: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.deletes: Dict[str, List[str]] = defaultdict(list)
+        self.added = 0
+        self.changed = 0
+        self.removed = 0
+        self.unchanged = 0
+
+    @property
+    def empty(self) -> bool:
+        return not self.upserts and not self.deletes
+
+    def summary(self) -> str:
+        return (
+            f"{self.added} new, {self.changed} changed, {self.removed} removed, "
+            f"{self.unchanged} unchanged"
+        )
+
+
+class IndexSync:
+    """
+    Keeps a vector store namespace in step with the question bank.
+
+    A manifest file records, for every question the store holds, the content
+    hash it was indexed with and the namespace (or domain shard) it went to.
+    A sync diffs the source questions against it, so only new and changed
+    questions are embedded and upserted, and removed ones are deleted. A
+    question that moved to another shard is deleted from the old one.
+
+    The manifest is rewritten after every namespace that is written, so an
+    interrupted run resumes where it stopped. It is only valid for the store,
+    embedding model, text template and metadata mode it was written with; if
+    any of those differ it is discarded and everything is upserted again.
+    """
+
+    def __init__(self, store, namespace: str, manifest_path: str, backend: str):
+        self.store = store
+        self.namespace = namespace
+        self.manifest_path = manifest_path
+        self.header = {
+            "format": MANIFEST_FORMAT_VERSION,
+            "backend": backend,
+            "namespace": namespace,
+            "model": EMBEDDING_MODEL_NAME,
+            "text_template": QUESTION_TEXT_TEMPLATE,
+            "metadata_mode": getattr(store, "metadata_mode", "full"),
+        }
+        # question id -> {"hash": content hash, "namespace": where it is stored}
+        self.entries: Dict[str, Dict[str, str]] = {}
+
+    # --- Manifest ---
+
+    def load_manifest(self) -> None:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            logger.info(f"No sync manifest at {self.manifest_path}; full sync.")
+            return
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring unreadable sync manifest: {e}")
+            return
+        if manifest.get("header") != self.header:
+            logger.warning(
+                "Sync manifest was written for another store, model or metadata "
+                "mode; re-upserting everything."
+            )
+            return
+        self.entries = manifest.get("entries", {})
+
+    def save_manifest(self) -> None:
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"header": self.header, "entries": self.entries}, f)
+        # Atomic, so a crash never leaves a half-written manifest behind.
+        os.replace(tmp_path, self.manifest_path)
+
+    def verify(self) -> int:
+        """
+        Drops manifest entries whose vector is missing from the store (for
+        example after a manual delete), so the next plan re-upserts them.
+        Returns the number of entries dropped.
+        """
+        by_namespace: Dict[str, List[str]] = defaultdict(list)
+        for question_id, entry in self.entries.items():
+            by_namespace[entry["namespace"]].append(question_id)
+        missing = []
+        for namespace, ids in by_namespace.items():
+            present = self.store.existing_ids(ids, namespace=namespace)
+            missing.extend(i for i in ids if i not in present)
+        for question_id in missing:
+            del self.entries[question_id]
+        return len(missing)
+
+    # --- Diffing and applying ---
+
+    def plan(self, items: List[Dict[str, Any]]) -> SyncPlan:
+        plan = SyncPlan()
+        seen = set()
+        for target, group in group_by_namespace(items, self.namespace).items():
+            for item in group:
+                seen.add(item["id"])
+                entry = self.entries.get(item["id"])
+                if entry is None:
+                    plan.added += 1
+                elif entry["namespace"] != target:
+                    # Moved to another domain shard.
+                    plan.changed += 1
+                    plan.deletes[entry["namespace"]].append(item["id"])
+                elif entry["hash"] != content_hash(item):
+                    plan.changed += 1
+                else:
+                    plan.unchanged += 1
+                    continue
+                plan.upserts[target].append(item)
+
+        for question_id, entry in self.entries.items():
+            if question_id not in seen:
+                plan.removed += 1
+                plan.deletes[entry["namespace"]].append(question_id)
+        return plan
+
+    def apply(self, plan: SyncPlan) -> None:
+        # Deletes first, so a question moving between shards is never served
+        # from both.
+        for namespace, ids in plan.deletes.items():
+            self.store.delete_questions(ids, namespace=namespace)
+            for question_id in ids:
+                if self.entries.get(question_id, {}).get("namespace") == namespace:
+                    del self.entries[question_id]
+            self.save_manifest()
+
+        for namespace, items in plan.upserts.items():
+            self.store.upsert_questions(items, namespace=namespace)
+            for item in items:
+                self.entries[item["id"]] = {
+                    "hash": content_hash(item),
+                    "namespace": namespace,
+                }
+            self.save_manifest()
@@ -0,0 +1,370 @@
+# src/interview_system/services/ingestion.py
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterator, List
+
+from interview_system.api.database import get_db_session
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.repositories.question_repository import QuestionRepository
+from interview_system.services.embeddings import (
+    EMBEDDING_MODEL_NAME,
+    QUESTION_TEXT_TEMPLATE,
+    embed_texts,
+    question_embedding_text,
+)
+from interview_system.services.executors import (
+    embedding_executor,
+    io_executor,
+    run_in_executor,
+)
+from interview_system.services.namespaces import group_by_namespace
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT_VERSION = 1
+
+# Characters read from the source per call.
+READ_CHUNK_SIZE = 1 << 20
+# An array element still incomplete after this many characters is malformed.
+MAX_RECORD_CHARS = 16 * READ_CHUNK_SIZE
+
+_SEPARATORS = " \t\r\n,"
+
+
+# --- Parsing ---
+
+
+def iter_json_records(
+    path: str, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the objects of a JSON array file or a JSON Lines file one at a
+    time. The format is taken from the first character ('[' is an array).
+    Only one chunk and the record being decoded are held in memory.
+    """
+    with open(path, "r", encoding="utf-8-sig") as f:
+        buffer = f.read(chunk_size)
+        start = buffer.lstrip()
+        if not start:
+            return
+        if start[0] != "[":
+            f.seek(0)
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}, line {line_number}: {e}") from e
+                yield _check_record(record, path)
+            return
+
+        decoder = json.JSONDecoder()
+        pos = buffer.index("[") + 1
+        while True:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            if pos == len(buffer):
+                buffer, pos = f.read(chunk_size), 0
+                if not buffer:
+                    raise ValueError(f"{path}: the JSON array is never closed.")
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                record, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                # Most likely the record runs past the chunk: read more.
+                chunk = f.read(chunk_size)
+                if not chunk or len(buffer) - pos > MAX_RECORD_CHARS:
+                    raise ValueError(f"{path}: {e}") from e
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            yield _check_record(record, path)
+
+
+def _check_record(record: Any, path: str) -> Dict[str, Any]:
+    if not isinstance(record, dict):
+        raise ValueError(f"{path}: expected question objects, got {record!r:.80}")
+    return record
+
+
+# --- Transforming ---
+
+
+def transform_question(q: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turns a raw questions-file entry into a bank question: the id becomes the
+    SHA-256 of the text, and a 'q-<topic>-<n>' id folds its topic into the
+    domain. Modifies and returns q.
+    """
+    original_id = q.get("id", "")
+    original_domain = q.get("domain", "")
+    question_text = q.get("text", "")
+    new_id = hashlib.sha256(question_text.encode("utf-8")).hexdigest()
+    new_domain = original_domain
+    if original_id.startswith("q-") and original_id.count("-") >= 2:
+        parts = original_id.split("-")
+        topic = "-".join(parts[1:-1])
+        if topic:
+            new_domain = f"{original_domain}-{topic}"
+    if q.get("rubric_id") is None:
+        q["rubric_id"] = ""
+    q["id"] = new_id
+    q["domain"] = new_domain
+    return q
+
+
+# --- Checkpointing ---
+
+
+class IngestCheckpoint:
+    """
+    How far an ingestion of one source file into one namespace has got: the
+    number of leading records that are fully written to the store.
+
+    Stages hand batches on in source order, so everything before that offset
+    is done and everything after it is not. A rerun skips straight to it.
+    The checkpoint only applies to the same file (path, size, modification
+    time), namespace, store and embedding settings; otherwise it starts over.
+    """
+
+    def __init__(self, path: str, header: Dict[str, Any]):
+        self.path = path
+        self.header = {"format": CHECKPOINT_FORMAT_VERSION, **header}
+        self.records_done = 0
+        self.complete = False
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring unreadable ingest checkpoint: {e}")
+            return
+        if checkpoint.get("header") != self.header:
+            logger.warning(
+                "Ingest checkpoint was written for another file, namespace or "
+                "embedding model; starting from the beginning."
+            )
+            return
+        self.records_done = checkpoint.get("records_done", 0)
+        self.complete = checkpoint.get("complete", False)
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "header": self.header,
+                    "records_done": self.records_done,
+                    "complete": self.complete,
+                },
+                f,
+            )
+        # Atomic, so a crash never leaves a half-written checkpoint behind.
+        os.replace(tmp_path, self.path)
+
+
+def checkpoint_header(source: str, namespace: str, store) -> Dict[str, Any]:
+    stat = os.stat(source)
+    return {
+        "source": os.path.abspath(source),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "namespace": namespace,
+        "backend": vector_store_settings.VECTOR_STORE_BACKEND,
+        "model": EMBEDDING_MODEL_NAME,
+        "text_template": QUESTION_TEXT_TEMPLATE,
+        "metadata_mode": getattr(store, "metadata_mode", "full"),
+    }
+
+
+# --- Pipeline ---
+
+
+class StageStats:
+    """Records handled by one stage and the time it spent working on them."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.records = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Records per second of work, i.e. the stage's own throughput."""
+        return self.records / self.busy_seconds if self.busy_seconds else 0.0
+
+
+class _Batch:
+    def __init__(self, end: int, items: List[Dict[str, Any]]):
+        # Source offset just past the last record of the batch
+        self.end = end
+        self.items = items
+        self.vectors = None
+
+
+class IngestionPipeline:
+    """
+    Streams a questions file into the vector store in four concurrent
+    stages: parse -> transform -> embed -> upsert.
+
+    Stages are joined by queues of at most INGEST_QUEUE_SIZE batches, so a
+    slow stage holds the ones before it back instead of letting parsed
+    records pile up in memory. Parsing runs on a worker thread, embedding on
+    the embedding pool and upserts on the io pool, so while one batch is
+    being upserted the next is being embedded and the one after parsed.
+
+    Each stage has one worker and queues are FIFO, so batches are written in
+    source order and the checkpoint can be a single offset, saved after every
+    batch. Questions are upserted by content id, so the batch in flight when
+    a run is interrupted is simply written again on resume.
+    """
+
+    def __init__(
+        self,
+        store,
+        source: str,
+        namespace: str,
+        checkpoint: IngestCheckpoint,
+        batch_size: int = vector_store_settings.INGEST_BATCH_SIZE,
+        queue_size: int = vector_store_settings.INGEST_QUEUE_SIZE,
+        progress_seconds: float = 10.0,
+    ):
+        self.store = store
+        self.source = source
+        self.namespace = namespace
+        self.checkpoint = checkpoint
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.progress_seconds = progress_seconds
+        self.stats = {
+            name: StageStats(name) for name in ("parse", "transform", "embed", "upsert")
+        }
+        self.skipped = 0
+        self.duplicate_texts = 0
+        self.elapsed_seconds = 0.0
+        # Slim vectors hold no question bodies; they go to questions_meta too.
+        self._write_meta = getattr(store, "metadata_mode", "full") == "slim"
+        self._seen_ids: set[str] = set()
+
+    async def run(self) -> None:
+        started = time.perf_counter()
+        parsed: asyncio.Queue = asyncio.Queue(self.queue_size)
+        transformed: asyncio.Queue = asyncio.Queue(self.queue_size)
+        embedded: asyncio.Queue = asyncio.Queue(self.queue_size)
+        try:
+            # A failing stage cancels the others.
+            async with asyncio.TaskGroup() as stages:
+                stages.create_task(self._parse(parsed))
+                stages.create_task(self._transform(parsed, transformed))
+                stages.create_task(self._embed(transformed, embedded))
+                stages.create_task(self._upsert(embedded))
+        except ExceptionGroup as group:
+            # Surface the failing stage's own error.
+            raise group.exceptions[0]
+        finally:
+            self.elapsed_seconds = time.perf_counter() - started
+        self.checkpoint.complete = True
+        self.checkpoint.save()
+
+    async def _timed(self, stage: str, fn, *args, executor=None):
+        """Runs fn off the event loop and adds its duration to the stage."""
+        start = time.perf_counter()
+        if executor is None:
+            result = await asyncio.to_thread(fn, *args)
+        else:
+            result = await run_in_executor(executor, fn, *args)
+        self.stats[stage].busy_seconds += time.perf_counter() - start
+        return result
+
+    async def _parse(self, out: asyncio.Queue) -> None:
+        records = iter_json_records(self.source)
+        offset = 0
+
+        def next_batch() -> tuple[int, List[Dict[str, Any]]]:
+            # Records before the checkpoint are parsed (to find where the
+            # next one starts) but not passed on.
+            nonlocal offset
+            items = []
+            for record in records:
+                offset += 1
+                if offset <= self.checkpoint.records_done:
+                    self.skipped += 1
+                    continue
+                items.append(record)
+                if len(items) == self.batch_size:
+                    break
+            return offset, items
+
+        while True:
+            end, items = await self._timed("parse", next_batch)
+            self.stats["parse"].records += len(items)
+            if not items:
+                break
+            await out.put(_Batch(end, items))
+        await out.put(None)
+
+    async def _transform(self, inp: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (batch := await inp.get()) is not None:
+            start = time.perf_counter()
+            batch.items = [transform_question(q) for q in batch.items]
+            for item in batch.items:
+                if item["id"] in self._seen_ids:
+                    self.duplicate_texts += 1
+                self._seen_ids.add(item["id"])
+            stats = self.stats["transform"]
+            stats.busy_seconds += time.perf_counter() - start
+            stats.records += len(batch.items)
+            await out.put(batch)
+        await out.put(None)
+
+    async def _embed(self, inp: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (batch := await inp.get()) is not None:
+            texts = [question_embedding_text(item) for item in batch.items]
+            batch.vectors = await self._timed(
+                "embed",
+                embed_texts,
+                texts,
+                vector_store_settings.EMBED_BATCH_SIZE,
+                executor=embedding_executor,
+            )
+            self.stats["embed"].records += len(texts)
+            await out.put(batch)
+        await out.put(None)
+
+    async def _upsert(self, inp: asyncio.Queue) -> None:
+        last_report = time.perf_counter()
+        while (batch := await inp.get()) is not None:
+            await self._timed("upsert", self._write, batch, executor=io_executor)
+            self.stats["upsert"].records += len(batch.items)
+            self.checkpoint.records_done = batch.end
+            self.checkpoint.save()
+            if time.perf_counter() - last_report >= self.progress_seconds:
+                last_report = time.perf_counter()
+                print(f"  {self.checkpoint.records_done} records done ({self.rates()})")
+
+    def _write(self, batch: _Batch) -> None:
+        if self._write_meta:
+            with get_db_session() as db:
+                QuestionRepository(db).upsert_many(batch.items)
+        rows = {id(item): row for row, item in enumerate(batch.items)}
+        for target, group in group_by_namespace(batch.items, self.namespace).items():
+            vectors = batch.vectors[[rows[id(item)] for item in group]]
+            self.store.upsert_vectors(group, vectors, namespace=target)
+
+    def rates(self) -> str:
+        return ", ".join(
+            f"{stats.name} {stats.rate:.0f}/s" for stats in self.stats.values()
+        )
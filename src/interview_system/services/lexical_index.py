@@ -0,0 +1,192 @@
+# src/interview_system/services/lexical_index.py
+import logging
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from interview_system.services.metadata_filter import matches_filter
+from interview_system.services.question_bank import load_question_bank
+
+logger = logging.getLogger(__name__)
+
+# This global variable will hold our single index instance.
+_lexical_index_instance: Optional["LexicalIndex"] = None
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how in is it its of on or "
+    "the to what when which why with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens; keeps '+' and '#' so 'c++' and 'c#' survive."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+class LexicalIndex:
+    """
+    An in-memory BM25 inverted index over question text and domain.
+
+    Embeddings from a small model blur short, rare technical terms ("GIL",
+    "CAP theorem"); exact term matching catches them. Results use the same
+    candidate format as the vector stores, so the two can be fused.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._ids: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        # term -> (doc indices, term frequencies)
+        self._postings: Dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._idf: Dict[str, float] = {}
+        self._doc_len = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def build(self, items: List[Dict[str, Any]]) -> None:
+        """(Re)builds the index from question documents, keyed by their id."""
+        with self._lock:
+            self._items = {item["id"]: item for item in items}
+            self._rebuild()
+
+    def add(self, items: List[Dict[str, Any]]) -> None:
+        """Adds or replaces questions. Rebuilds the postings; meant for rare writes."""
+        with self._lock:
+            self._items.update({item["id"]: item for item in items})
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        ids, metadata, lengths = [], [], []
+        postings: Dict[str, tuple[List[int], List[int]]] = defaultdict(
+            lambda: ([], [])
+        )
+        for doc, (question_id, item) in enumerate(self._items.items()):
+            domain = item.get("domain") or ""
+            tokens = tokenize(f"{item.get('text', '')} {domain.replace('-', ' ')}")
+            for term, tf in Counter(tokens).items():
+                postings[term][0].append(doc)
+                postings[term][1].append(tf)
+            ids.append(question_id)
+            metadata.append(_metadata(item))
+            lengths.append(len(tokens))
+
+        n = len(ids)
+        self._ids = ids
+        self._metadata = metadata
+        self._doc_len = np.asarray(lengths, dtype=np.float32)
+        self._postings = {
+            term: (np.asarray(docs, dtype=np.int64), np.asarray(tfs, dtype=np.float32))
+            for term, (docs, tfs) in postings.items()
+        }
+        # Lucene's idf variant, which never goes negative for very common terms.
+        self._idf = {
+            term: math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, (docs, _) in self._postings.items()
+        }
+
+    def search(
+        self, query_text: str, top_k: int, where: Dict[str, Any] | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        BM25 search. lexical_score is the BM25 score divided by the best
+        score any document could get for this query, so it lies in [0, 1].
+        It is not comparable to a vector relevance_score.
+        """
+        with self._lock:
+            ids, metadata = self._ids, self._metadata
+            terms = list(dict.fromkeys(tokenize(query_text)))
+            if not terms or not ids:
+                return []
+            # A query term no question contains still counts against the best
+            # possible score (at the idf of a term seen nowhere).
+            unseen_idf = math.log(1 + (len(ids) + 0.5) / 0.5)
+            avg_len = float(self._doc_len.mean()) or 1.0
+            norm = self.k1 * (1 - self.b + self.b * self._doc_len / avg_len)
+            scores = np.zeros(len(ids), dtype=np.float32)
+            best_possible = 0.0
+            for term in terms:
+                idf = self._idf.get(term, unseen_idf)
+                best_possible += idf * (self.k1 + 1)
+                if term in self._postings:
+                    docs, tfs = self._postings[term]
+                    scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norm[docs])
+
+        ranked = np.flatnonzero(scores)
+        ranked = ranked[np.argsort(-scores[ranked], kind="stable")]
+
+        results = []
+        for doc in ranked:
+            if where and not matches_filter(metadata[doc], where):
+                continue
+            results.append(
+                {
+                    "id": ids[doc],
+                    "text": metadata[doc].get("text", ""),
+                    "lexical_score": float(scores[doc] / best_possible),
+                    "metadata": metadata[doc],
+                }
+            )
+            if len(results) >= top_k:
+                break
+        return results
+
+
+def _metadata(item: Dict[str, Any]) -> Dict[str, Any]:
+    # Same fields the vector stores keep, so candidates look alike.
+    meta = {
+        "question_id": item["id"],
+        "text": item.get("text", ""),
+        "domain": item.get("domain"),
+        "difficulty": item.get("difficulty"),
+        "ideal_answer_snippet": item.get("ideal_answer_snippet") or "",
+        "rubric_id": item.get("rubric_id") or "",
+    }
+    if item.get("conversational_variants"):
+        meta["conversational_variants"] = item["conversational_variants"]
+    return meta
+
+
+def get_lexical_index() -> LexicalIndex:
+    """Get a singleton instance of the LexicalIndex, built on first use."""
+    global _lexical_index_instance
+    if _lexical_index_instance is None:
+        index = LexicalIndex()
+        index.build(load_question_bank())
+        logger.info(f"Built lexical index over {len(index)} questions.")
+        _lexical_index_instance = index
+    return _lexical_index_instance
+
+
+def reciprocal_rank_fusion(
+    result_lists: List[List[Dict[str, Any]]], k: int = 60
+) -> List[Dict[str, Any]]:
+    """
+    Merges ranked candidate lists by reciprocal rank fusion: each candidate
+    scores sum(1 / (k + rank)) over the lists it appears in. Scores on
+    different scales (cosine, BM25) never have to be compared directly.
+
+    A candidate found by several retrievers keeps its first list's fields
+    plus any field only a later list has, so each retriever's own score
+    (relevance_score from vectors, lexical_score from BM25) survives as is.
+    Every candidate gains a fused_score.
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    for results in result_lists:
+        for rank, candidate in enumerate(results, start=1):
+            entry = fused.get(candidate["id"])
+            if entry is None:
+                entry = fused[candidate["id"]] = {**candidate, "fused_score": 0.0}
+            else:
+                for field, value in candidate.items():
+                    entry.setdefault(field, value)
+            entry["fused_score"] += 1.0 / (k + rank)
+    return sorted(fused.values(), key=lambda c: c["fused_score"], reverse=True)
@@ -0,0 +1,528 @@
+# src/interview_system/services/local_store.py
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.services.embedding_snapshot import (
+    MANIFEST_FILE,
+    dequantize,
+    read_snapshot,
+    write_snapshot,
+)
+from interview_system.services.embedding_service import embedding_batcher
+from interview_system.services.embeddings import embed_texts, question_embedding_text
+from interview_system.services.executors import embedding_executor, run_in_executor
+from interview_system.services.namespaces import resolve_namespace, upsert_sharded
+
+logger = logging.getLogger(__name__)
+
+# This global variable will hold our single store instance.
+_vector_store_instance: Optional["LocalVectorStore"] = None
+
+# Metadata fields stored with every question, same as the Pinecone backend.
+METADATA_FIELDS = ("text", "domain", "difficulty", "ideal_answer_snippet", "rubric_id")
+
+_COMPARATORS = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+# Rows scored or assigned to IVF lists per step. Bounds the float32 copy made
+# of a quantized snapshot to CHUNK_ROWS x dim at a time.
+CHUNK_ROWS = 16384
+
+
+class _Partition:
+    """
+    One namespace of the local index: a contiguous float32 matrix of unit
+    vectors plus row-aligned ids and metadata.
+
+    A partition loaded from a snapshot scores straight off the read-only,
+    possibly quantized memory map, and is copied into a float32 matrix on
+    its first write.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.metadata: List[Dict[str, Any]] = []
+        self.vectors = np.empty((0, 0), dtype=np.float32)
+        # Per-row scales of an int8 snapshot; None for float matrices.
+        self.scales: Optional[np.ndarray] = None
+        self.read_only = False
+        self.size = 0
+        # Filter columns are built on demand and dropped on every write.
+        self._columns: Dict[tuple[str, str], np.ndarray] = {}
+        self.ann: Optional["_IVFIndex"] = None
+
+    @classmethod
+    def from_snapshot(cls, directory: str) -> "_Partition":
+        snapshot = read_snapshot(directory)
+        partition = cls()
+        partition.ids = list(snapshot.ids)
+        partition.rows = {question_id: i for i, question_id in enumerate(snapshot.ids)}
+        partition.metadata = snapshot.metadata_rows()
+        partition.vectors = snapshot.vectors
+        partition.scales = snapshot.scales
+        partition.read_only = True
+        partition.size = len(snapshot)
+        return partition
+
+    def dense(self) -> np.ndarray:
+        """The live rows as a float32 matrix (a view unless quantized)."""
+        if self.scales is None and self.vectors.dtype == np.float32:
+            return self.vectors[: self.size]
+        return dequantize(self.vectors[: self.size], self.scales)
+
+    def block(self, rows: np.ndarray | slice) -> np.ndarray:
+        """The given rows as float32 vectors (a view unless quantized)."""
+        scales = None if self.scales is None else self.scales[rows]
+        return dequantize(self.vectors[rows], scales)
+
+    def top_k(
+        self, rows: np.ndarray, query: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The k of the given rows most similar to the query, best first, and
+        their cosine similarities. Rows are scored CHUNK_ROWS at a time with
+        a running top k, so a quantized memory map is only ever converted to
+        float32 one chunk at a time.
+        """
+        # Unfiltered scan: slice the matrix instead of fancy-indexing a copy.
+        contiguous = self._is_all_rows(rows)
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        for start in range(0, rows.size, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, rows.size)
+            chunk = slice(start, stop) if contiguous else rows[start:stop]
+            scores = self.vectors[chunk].astype(np.float32, copy=False) @ query
+            if self.scales is not None:
+                scores *= self.scales[chunk]
+            best_rows = np.concatenate([best_rows, rows[start:stop]])
+            best_scores = np.concatenate([best_scores, scores])
+            if best_scores.size > k:
+                keep = np.argpartition(-best_scores, k - 1)[:k]
+                best_rows, best_scores = best_rows[keep], best_scores[keep]
+        order = np.argsort(-best_scores)
+        return best_rows[order], best_scores[order]
+
+    def _is_all_rows(self, rows: np.ndarray) -> bool:
+        # Every row in storage order. ANN candidates can cover every row but
+        # come grouped by inverted list, so the size alone is not enough.
+        return (
+            rows.size == self.size
+            and rows.size > 0
+            and rows[0] == 0
+            and bool(np.all(rows[1:] > rows[:-1]))
+        )
+
+    def upsert(self, ids: List[str], vectors: np.ndarray, metadata: List[Dict]) -> None:
+        if self.read_only:
+            self.vectors = self.dense().copy()
+            self.scales = None
+            self.read_only = False
+        if self.vectors.shape[1] == 0:
+            self.vectors = np.empty((0, vectors.shape[1]), dtype=np.float32)
+
+        # The last occurrence of an id within one batch wins, like Pinecone.
+        order = list({question_id: i for i, question_id in enumerate(ids)}.values())
+
+        fresh = []
+        for i in order:
+            row = self.rows.get(ids[i])
+            if row is None:
+                self.rows[ids[i]] = self.size + len(fresh)
+                self.ids.append(ids[i])
+                self.metadata.append(metadata[i])
+                fresh.append(i)
+            else:
+                self.metadata[row] = metadata[i]
+                self.vectors[row] = vectors[i]
+
+        if fresh:
+            # Grow geometrically so repeated small upserts stay amortized O(1).
+            needed = self.size + len(fresh)
+            if needed > self.vectors.shape[0]:
+                capacity = max(needed, 2 * self.vectors.shape[0], 64)
+                grown = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+                grown[: self.size] = self.vectors[: self.size]
+                self.vectors = grown
+            self.vectors[self.size : needed] = vectors[fresh]
+            if self.ann is not None:
+                self.ann.add(np.arange(self.size, needed), self)
+            self.size = needed
+
+        self._columns.clear()
+
+    def delete(self, ids: List[str]) -> int:
+        """Removes the given ids, compacting the matrix. Returns the number removed."""
+        doomed = {self.rows[i] for i in ids if i in self.rows}
+        if not doomed:
+            return 0
+        keep = np.array(
+            [row for row in range(self.size) if row not in doomed], dtype=np.int64
+        )
+        # Fancy indexing copies, which also materializes a read-only partition.
+        self.vectors = self.dense()[keep]
+        self.scales = None
+        self.read_only = False
+        self.ids = [self.ids[row] for row in keep]
+        self.metadata = [self.metadata[row] for row in keep]
+        self.rows = {question_id: i for i, question_id in enumerate(self.ids)}
+        self.size = len(self.ids)
+        # Row numbers changed; the IVF index is rebuilt if still warranted.
+        self.ann = None
+        self._columns.clear()
+        return len(doomed)
+
+    # --- Metadata filtering (Pinecone filter syntax) ---
+
+    def _column(self, field: str, numeric: bool) -> np.ndarray:
+        key = (field, "num" if numeric else "obj")
+        column = self._columns.get(key)
+        if column is None:
+            if field == "id":
+                values = self.ids
+            else:
+                values = [meta.get(field) for meta in self.metadata[: self.size]]
+            if numeric:
+                column = np.array(
+                    [
+                        v if isinstance(v, (int, float)) and not isinstance(v, bool)
+                        else np.nan
+                        for v in values
+                    ],
+                    dtype=np.float64,
+                )
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            self._columns[key] = column
+        return column
+
+    def mask(self, where: Dict[str, Any] | None) -> np.ndarray:
+        """Evaluates a Pinecone-style filter into a boolean row mask."""
+        mask = np.ones(self.size, dtype=bool)
+        for key, condition in (where or {}).items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self.mask(clause)
+            elif key == "$or":
+                any_mask = np.zeros(self.size, dtype=bool)
+                for clause in condition:
+                    any_mask |= self.mask(clause)
+                mask &= any_mask
+            elif isinstance(condition, dict):
+                for op, value in condition.items():
+                    mask &= self._compare(key, op, value)
+            else:
+                mask &= self._compare(key, "$eq", condition)
+        return mask
+
+    def _compare(self, field: str, op: str, value: Any) -> np.ndarray:
+        if op in _COMPARATORS:
+            column = self._column(field, numeric=True)
+            with np.errstate(invalid="ignore"):
+                return _COMPARATORS[op](column, float(value))
+        column = self._column(field, numeric=False)
+        if op == "$eq":
+            return column == value
+        if op == "$ne":
+            return column != value
+        if op in ("$in", "$nin"):
+            hits = np.isin(column, np.array(list(value), dtype=object))
+            return hits if op == "$in" else ~hits
+        raise ValueError(f"Unsupported filter operator: {op}")
+
+
+class _IVFIndex:
+    """
+    An inverted-file approximate nearest neighbour index: vectors are bucketed
+    by their nearest k-means centroid, and a query scans only the nprobe
+    buckets whose centroids are closest to it.
+    """
+
+    def __init__(self, partition: _Partition, n_lists: int, iterations: int = 10):
+        rng = np.random.default_rng(0)
+        n = partition.size
+        # Sorted, so a memory-mapped snapshot is read front to back.
+        sample_rows = np.sort(rng.choice(n, size=min(n, n_lists * 64), replace=False))
+        sample = partition.block(sample_rows)
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+
+        # Spherical k-means on a sample; vectors are unit length.
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = sample[assignment == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    centroids[c] = centroid / (np.linalg.norm(centroid) or 1.0)
+
+        self.centroids = centroids
+        self.lists: List[np.ndarray] = [np.empty(0, dtype=np.int64)] * n_lists
+        self.add(np.arange(n), partition)
+
+    def add(self, rows: np.ndarray, partition: _Partition) -> None:
+        """Assigns the given rows of the partition to their nearest lists."""
+        pieces: Dict[int, List[np.ndarray]] = {}
+        for start in range(0, len(rows), CHUNK_ROWS):
+            chunk = rows[start : start + CHUNK_ROWS]
+            assignment = np.argmax(partition.block(chunk) @ self.centroids.T, axis=1)
+            for c in np.unique(assignment):
+                pieces.setdefault(int(c), []).append(chunk[assignment == c])
+        for c, added in pieces.items():
+            self.lists[c] = np.concatenate([self.lists[c], *added])
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        probe = np.argsort(-(self.centroids @ query))[:nprobe]
+        return np.concatenate([self.lists[c] for c in probe])
+
+
+class LocalVectorStore:
+    """
+    An in-process vector store with the same contract as PineconeVectorStore.
+
+    Exact mode scores the whole namespace with one matrix-vector product.
+    ANN mode (LOCAL_INDEX_MODE=ann) builds an inverted-file index for large
+    namespaces and only scores the vectors in the closest lists.
+    """
+
+    def __init__(
+        self,
+        mode: str = "exact",
+        ann_min_vectors: int = 50000,
+        nprobe: int = 8,
+    ):
+        if mode not in ("exact", "ann"):
+            raise ValueError("LOCAL_INDEX_MODE must be 'exact' or 'ann'.")
+        self.mode = mode
+        self.ann_min_vectors = ann_min_vectors
+        self.nprobe = nprobe
+        self._partitions: Dict[str, _Partition] = {}
+        self._lock = threading.Lock()
+
+    def _partition(self, namespace: str | None) -> _Partition:
+        return self._partitions.setdefault(namespace or "", _Partition())
+
+    def upsert_questions(
+        self, items: List[Dict[str, Any]], namespace: str | None = None
+    ) -> None:
+        """
+        Embeds and upserts a list of question documents into the local index,
+        optionally into a specific namespace.
+        """
+        if not items:
+            return
+        vectors = embed_texts(
+            [question_embedding_text(item) for item in items],
+            batch_size=vector_store_settings.EMBED_BATCH_SIZE,
+        )
+        self.upsert_vectors(items, vectors, namespace=namespace)
+        logger.info(
+            f"Upserted {len(items)} questions to local namespace '{namespace or ''}'."
+        )
+
+    def upsert_vectors(
+        self,
+        items: List[Dict[str, Any]],
+        vectors: np.ndarray,
+        namespace: str | None = None,
+    ) -> None:
+        """Upserts question documents with already computed, row-aligned vectors."""
+        metadata = []
+        for item in items:
+            meta = {field: item.get(field) for field in METADATA_FIELDS}
+            meta["question_id"] = item["id"]
+            if item.get("conversational_variants"):
+                meta["conversational_variants"] = item["conversational_variants"]
+            metadata.append(meta)
+
+        with self._lock:
+            partition = self._partition(namespace)
+            partition.upsert(
+                [item["id"] for item in items],
+                np.asarray(vectors, dtype=np.float32),
+                metadata,
+            )
+            self._maybe_build_ann(partition)
+
+    def delete_questions(self, ids: List[str], namespace: str | None = None) -> None:
+        """Deletes questions by id, optionally from a specific namespace."""
+        with self._lock:
+            partition = self._partitions.get(namespace or "")
+            removed = partition.delete(ids) if partition is not None else 0
+            if removed:
+                self._maybe_build_ann(partition)
+        logger.info(
+            f"Deleted {removed} questions from local namespace '{namespace or ''}'."
+        )
+
+    def existing_ids(self, ids: List[str], namespace: str | None = None) -> set[str]:
+        """The subset of ids that are present in the index."""
+        with self._lock:
+            partition = self._partitions.get(namespace or "")
+            rows = partition.rows if partition is not None else {}
+            return {question_id for question_id in ids if question_id in rows}
+
+    def _maybe_build_ann(self, partition: _Partition) -> None:
+        if (
+            self.mode == "ann"
+            and partition.ann is None
+            and partition.size >= self.ann_min_vectors
+        ):
+            n_lists = int(np.sqrt(partition.size))
+            logger.info(f"Building IVF index with {n_lists} lists...")
+            partition.ann = _IVFIndex(partition, n_lists)
+
+    def query_similar(
+        self,
+        query_text: str,
+        top_k: int,
+        where: Dict[str, Any],
+        namespace: str | None = None,
+        query_vector: List[float] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Queries the index for similar questions based on text and metadata filters,
+        optionally from a specific namespace. A precomputed query_vector, if given,
+        is used as-is and query_text is not embedded.
+        """
+        if query_vector is None:
+            query = embedding_batcher.embed([query_text])[0]
+        else:
+            query = np.asarray(query_vector, dtype=np.float32)
+
+        # Queries run on executor threads; hold the lock so an upsert cannot
+        # grow the matrix between building the mask and scoring it.
+        with self._lock:
+            partition = self._partitions.get(namespace or "")
+            if partition is None or partition.size == 0:
+                return []
+
+            mask = partition.mask(where)
+            if partition.ann is not None:
+                rows = partition.ann.candidates(query, self.nprobe)
+                rows = rows[mask[rows]]
+                if rows.size < min(top_k, int(mask.sum())):
+                    # A selective filter can leave the probed lists with too
+                    # few matches; the matching rows are few enough to scan.
+                    rows = np.flatnonzero(mask)
+            else:
+                rows = np.flatnonzero(mask)
+            if rows.size == 0:
+                return []
+
+            best, scores = partition.top_k(rows, query, top_k)
+
+            formatted_candidates = []
+            for row, score in zip(best.tolist(), scores.tolist()):
+                meta = partition.metadata[row]
+                formatted_candidates.append(
+                    {
+                        "id": partition.ids[row],
+                        "text": meta.get("text", ""),
+                        "relevance_score": score,
+                        "metadata": meta,
+                    }
+                )
+        return formatted_candidates
+
+    async def aquery_similar(
+        self,
+        query_text: str,
+        top_k: int,
+        where: Dict[str, Any],
+        namespace: str | None = None,
+        query_vector: List[float] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Async query_similar; the encode and the scan run on the embedding pool."""
+        return await run_in_executor(
+            embedding_executor,
+            self.query_similar,
+            query_text,
+            top_k,
+            where,
+            namespace=namespace,
+            query_vector=query_vector,
+        )
+
+    async def aupsert_questions(
+        self, items: List[Dict[str, Any]], namespace: str | None = None
+    ) -> None:
+        """Async upsert_questions, run on the embedding pool."""
+        await run_in_executor(
+            embedding_executor, self.upsert_questions, items, namespace=namespace
+        )
+
+    def save_snapshot(
+        self, directory: str, namespace: str | None = None, dtype: str = "float16"
+    ) -> Dict[str, Any]:
+        """Writes a namespace to an on-disk snapshot (see embedding_snapshot.py)."""
+        with self._lock:
+            partition = self._partition(namespace)
+            return write_snapshot(
+                directory,
+                partition.ids[: partition.size],
+                partition.dense(),
+                partition.metadata[: partition.size],
+                dtype=dtype,
+            )
+
+    def load_snapshot(self, directory: str, namespace: str | None = None) -> int:
+        """
+        Replaces a namespace with a memory-mapped snapshot. Opening is cheap:
+        only the metadata is parsed, the embeddings stay on disk.
+        """
+        partition = _Partition.from_snapshot(directory)
+        with self._lock:
+            self._partitions[namespace or ""] = partition
+            self._maybe_build_ann(partition)
+        return partition.size
+
+    def load_questions_file(self, path: str, namespace: str | None = None) -> int:
+        """Loads an already-processed questions file (see seed_database.py)."""
+        with open(path, "r", encoding="utf-8") as f:
+            questions = json.load(f)
+        self.upsert_questions(questions, namespace=namespace)
+        return len(questions)
+
+
+def get_vector_store() -> LocalVectorStore:
+    """Get a singleton instance of the LocalVectorStore."""
+    global _vector_store_instance
+    if _vector_store_instance is None:
+        store = LocalVectorStore(
+            mode=vector_store_settings.LOCAL_INDEX_MODE,
+            ann_min_vectors=vector_store_settings.LOCAL_ANN_MIN_VECTORS,
+            nprobe=vector_store_settings.LOCAL_ANN_NPROBE,
+        )
+        namespace = resolve_namespace()
+        snapshot_dir = vector_store_settings.LOCAL_SNAPSHOT_DIR
+        if (
+            snapshot_dir
+            and not vector_store_settings.DOMAIN_SHARDING_ENABLED
+            and os.path.exists(os.path.join(snapshot_dir, MANIFEST_FILE))
+        ):
+            count = store.load_snapshot(snapshot_dir, namespace=namespace)
+            logger.info(f"Opened local vector store snapshot with {count} questions.")
+        elif vector_store_settings.LOCAL_BOOTSTRAP_FILE:
+            try:
+                path = vector_store_settings.LOCAL_BOOTSTRAP_FILE
+                with open(path, "r", encoding="utf-8") as f:
+                    questions = json.load(f)
+                upsert_sharded(store, questions, namespace)
+                logger.info(
+                    f"Bootstrapped local vector store with {len(questions)} questions."
+                )
+            except FileNotFoundError:
+                logger.warning("Local vector store bootstrap file not found.")
+        _vector_store_instance = store
+    return _vector_store_instance
@@ -0,0 +1,38 @@
+# src/interview_system/services/metadata_filter.py
+from typing import Any, Dict
+
+# Pinecone filter operators, evaluated in Python for indexes outside Pinecone.
+_OPERATORS = {
+    "$eq": lambda value, arg: value == arg,
+    "$ne": lambda value, arg: value != arg,
+    "$in": lambda value, arg: value in arg,
+    "$nin": lambda value, arg: value not in arg,
+    "$gt": lambda value, arg: value is not None and value > arg,
+    "$gte": lambda value, arg: value is not None and value >= arg,
+    "$lt": lambda value, arg: value is not None and value < arg,
+    "$lte": lambda value, arg: value is not None and value <= arg,
+}
+
+
+def matches_filter(metadata: Dict[str, Any], where: Dict[str, Any] | None) -> bool:
+    """Whether one metadata dict satisfies a Pinecone-style filter."""
+    for key, condition in (where or {}).items():
+        if key == "$and":
+            if not all(matches_filter(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_filter(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for op, arg in condition.items():
+                if op not in _OPERATORS:
+                    raise ValueError(f"Unsupported filter operator: {op}")
+                try:
+                    if not _OPERATORS[op](value, arg):
+                        return False
+                except TypeError:  # e.g. comparing a string with a number
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
@@ -0,0 +1,95 @@
+# src/interview_system/services/metrics.py
+import bisect
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Sequence
+
+# A deliberately small, process-local metrics registry. Values are exposed
+# through the admin /metrics endpoint; each worker process reports its own.
+_lock = threading.Lock()
+_counters: Dict[str, float] = defaultdict(float)
+_gauges: Dict[str, float] = {}
+_histograms: Dict[str, "_Histogram"] = {}
+
+# Upper bounds suited to millisecond latencies.
+DEFAULT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.bounds = sorted(buckets)
+        # One count per bound, plus one for values above the last
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Cumulative, like Prometheus: "le_10" counts every value <= 10.
+        buckets, running = {}, 0
+        for bound, count in zip(self.bounds + ["inf"], self.counts):
+            running += count
+            buckets[f"le_{bound}"] = running
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "mean": round(self.sum / self.count, 3) if self.count else 0.0,
+            "buckets": buckets,
+        }
+
+
+def increment(name: str, amount: float = 1.0) -> None:
+    """Adds amount to a monotonically increasing counter."""
+    with _lock:
+        _counters[name] += amount
+
+
+def set_gauge(name: str, value: float) -> None:
+    """Records the latest value of a gauge."""
+    with _lock:
+        _gauges[name] = value
+
+
+def observe(
+    name: str, value: float, buckets: Sequence[float] = DEFAULT_BUCKETS
+) -> None:
+    """
+    Adds a value to a histogram. The buckets given with the first observation
+    of a name are the ones it keeps.
+    """
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = _Histogram(buckets)
+        histogram.observe(value)
+
+
+def get_counter(name: str) -> float:
+    with _lock:
+        return _counters.get(name, 0.0)
+
+
+def record_ratio(name: str, hit: bool) -> None:
+    """
+    Counts one event in '<name>.hits' or '<name>.misses' and refreshes the
+    '<name>.hit_rate' gauge from the two counters.
+    """
+    with _lock:
+        _counters[f"{name}.hits" if hit else f"{name}.misses"] += 1
+        hits = _counters[f"{name}.hits"]
+        total = hits + _counters[f"{name}.misses"]
+        _gauges[f"{name}.hit_rate"] = round(hits / total, 4)
+
+
+def snapshot() -> Dict[str, Any]:
+    """Returns a copy of all current metric values."""
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "gauges": dict(_gauges),
+            "histograms": {name: h.to_dict() for name, h in _histograms.items()},
+        }
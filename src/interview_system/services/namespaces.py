@@ -0,0 +1,72 @@
+# src/interview_system/services/namespaces.py
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.services.domain_catalog import domain_catalog
+
+# Joins a base namespace and a domain into a shard name.
+SHARD_SEPARATOR = "__"
+
+
+def resolve_namespace(namespace: str | None = None) -> str:
+    """The namespace a session or write uses: the given one or QUESTION_NAMESPACE."""
+    return namespace or vector_store_settings.QUESTION_NAMESPACE
+
+
+def validate_namespace(namespace: str | None) -> str:
+    """
+    Resolves a namespace requested by a client. Only QUESTION_NAMESPACE and
+    those listed in ALLOWED_NAMESPACES may be used; raises ValueError otherwise.
+    """
+    resolved = resolve_namespace(namespace)
+    allowed = {vector_store_settings.QUESTION_NAMESPACE}
+    allowed.update(vector_store_settings.ALLOWED_NAMESPACES)
+    if resolved not in allowed:
+        raise ValueError(f"Unknown question namespace '{resolved}'.")
+    return resolved
+
+
+def shard_namespace(namespace: str, domain: str) -> str:
+    """'updated-namespace' + 'technical-python' -> 'updated-namespace__technical-python'."""
+    return f"{namespace}{SHARD_SEPARATOR}{domain}"
+
+
+def query_namespaces(namespace: str, domains: List[str]) -> List[str]:
+    """
+    The namespaces a retrieval over these domains has to query. Unsharded
+    banks live in one namespace; sharded ones in one namespace per domain, so
+    an unresolved topic (no domains) has to ask every known shard.
+    """
+    if not vector_store_settings.DOMAIN_SHARDING_ENABLED:
+        return [namespace]
+    return [shard_namespace(namespace, d) for d in domains or domain_catalog.domains()]
+
+
+def group_by_namespace(
+    items: List[Dict[str, Any]], namespace: str
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Splits questions into the namespaces they are stored in."""
+    if not vector_store_settings.DOMAIN_SHARDING_ENABLED:
+        return {namespace: list(items)}
+    groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for item in items:
+        groups[shard_namespace(namespace, item.get("domain") or "unknown")].append(item)
+    return dict(groups)
+
+
+def upsert_sharded(store, items: List[Dict[str, Any]], namespace: str | None = None) -> None:
+    """Upserts questions into their namespace, or into their domain shards."""
+    for target, group in group_by_namespace(items, resolve_namespace(namespace)).items():
+        store.upsert_questions(group, namespace=target)
+
+
+def merge_results(
+    result_lists: List[List[Dict[str, Any]]], top_k: int
+) -> List[Dict[str, Any]]:
+    """The top_k candidates across shards, best relevance first."""
+    if len(result_lists) == 1:
+        return result_lists[0][:top_k]
+    merged = [candidate for results in result_lists for candidate in results]
+    merged.sort(key=lambda c: c.get("relevance_score", 0.0), reverse=True)
+    return merged[:top_k]
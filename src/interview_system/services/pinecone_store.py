@@ -1,8 +1,26 @@
+import hashlib
+import json
 import os
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from pinecone import Pinecone
-from sentence_transformers import SentenceTransformer
+
+from interview_system.config.cache_config import cache_settings
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.services import metrics
+from interview_system.services.embedding_service import embedding_batcher
+from interview_system.services.embeddings import (
+    embed_texts,
+    get_embedding_model,
+    question_embedding_text,
+)
+from interview_system.services.executors import io_executor, run_in_executor
+from interview_system.services.memory_cache import LRUCache
+from interview_system.services.question_hydration import question_hydrator
 
 # This global variable will hold our single store instance.
 _vector_store_instance: Optional["PineconeVectorStore"] = None
@@ -11,6 +29,50 @@ _vector_store_instance: Optional["PineconeVectorStore"] = None
 PINECONE_INDEX_NAME = "agentic-rag"
 
 
+# Pinecone caps delete and fetch requests at 1000 ids.
+ID_BATCH_SIZE = 1000
+
+# What a slim index keeps: only the fields queries filter on.
+SLIM_METADATA_FIELDS = ("question_id", "domain", "difficulty", "rubric_id")
+
+
+def _question_metadata(item: Dict[str, Any], mode: str = "full") -> Dict[str, Any]:
+    metadata = {
+        # The vector id cannot be filtered on; this copy lets queries exclude
+        # already-asked questions with a $nin filter.
+        "question_id": item["id"],
+        "text": item["text"],
+        "domain": item["domain"],
+        "difficulty": item["difficulty"],
+        "ideal_answer_snippet": item["ideal_answer_snippet"],
+        "rubric_id": item.get("rubric_id"),
+    }
+    if item.get("conversational_variants"):
+        metadata["conversational_variants"] = item["conversational_variants"]
+    if mode == "slim":
+        metadata = {k: v for k, v in metadata.items() if k in SLIM_METADATA_FIELDS}
+    return metadata
+
+
+def _split_requests(records: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Splits records into upsert requests under the count and byte limits."""
+    requests, current, current_bytes = [], [], 0
+    for record in records:
+        # A JSON estimate of the payload; float lists dominate the size.
+        size = len(json.dumps(record))
+        if current and (
+            len(current) >= vector_store_settings.UPSERT_BATCH_SIZE
+            or current_bytes + size > vector_store_settings.UPSERT_MAX_REQUEST_BYTES
+        ):
+            requests.append(current)
+            current, current_bytes = [], 0
+        current.append(record)
+        current_bytes += size
+    if current:
+        requests.append(current)
+    return requests
+
+
 class PineconeVectorStore:
     """A wrapper for the Pinecone vector store."""
 
@@ -33,9 +95,73 @@ class PineconeVectorStore:
                 f"Pinecone index '{PINECONE_INDEX_NAME}' does not exist. Please create it first."
             )
 
-        self.index = pc.Index(PINECONE_INDEX_NAME)
+        # pool_threads sizes the client's HTTP connection pool to match the
+        # io executor, so concurrent queries reuse warm connections.
+        self.index = pc.Index(
+            PINECONE_INDEX_NAME,
+            pool_threads=vector_store_settings.VECTOR_STORE_IO_WORKERS,
+        )
 
-        self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2", device="cpu")
+        # Shared with every other embedding user in the process.
+        self.embedding_model = get_embedding_model()
+        self.metadata_mode = vector_store_settings.VECTOR_METADATA_MODE
+        if self.metadata_mode not in ("full", "slim"):
+            raise ValueError("VECTOR_METADATA_MODE must be 'full' or 'slim'.")
+
+        # Repeated queries skip both the CPU encode and the remote round trip.
+        self._embedding_cache = LRUCache(cache_settings.QUERY_EMBEDDING_CACHE_SIZE)
+        self._result_cache = LRUCache(
+            cache_settings.QUERY_RESULT_CACHE_SIZE,
+            ttl_seconds=cache_settings.QUERY_RESULT_CACHE_TTL_SECONDS,
+        )
+        # Bumped on every upsert; part of the result cache key, so results
+        # cached before a write to the namespace are never served again.
+        self._namespace_generations: Dict[str, int] = defaultdict(int)
+
+    def _invalidate(self, namespace: str | None) -> None:
+        self._namespace_generations[namespace or ""] += 1
+        # Query embeddings do not depend on the index contents; clearing them
+        # too keeps both caches on one lifetime, and writes are rare.
+        self._embedding_cache.clear()
+
+    def _cached_query_embedding(self, query_text: str) -> List[float] | None:
+        vector = self._embedding_cache.get(query_text)
+        metrics.record_ratio("vector_store.query_embedding_cache", vector is not None)
+        return vector
+
+    def _embed_query(self, query_text: str) -> List[float]:
+        vector = self._cached_query_embedding(query_text)
+        if vector is None:
+            # Batched with concurrent queries (see embedding_service.py).
+            vector = embedding_batcher.embed([query_text])[0].tolist()
+            self._embedding_cache.put(query_text, vector)
+        return vector
+
+    async def _aembed_query(self, query_text: str) -> List[float]:
+        vector = self._cached_query_embedding(query_text)
+        if vector is None:
+            vector = (await embedding_batcher.aembed([query_text]))[0].tolist()
+            self._embedding_cache.put(query_text, vector)
+        return vector
+
+    def _result_key(
+        self,
+        query_vector: List[float],
+        top_k: int,
+        where: Dict[str, Any],
+        namespace: str | None,
+    ) -> tuple:
+        vector_hash = hashlib.sha1(
+            np.asarray(query_vector, dtype=np.float32).tobytes()
+        ).hexdigest()
+        filter_key = json.dumps(where, sort_keys=True, default=str)
+        return (
+            vector_hash,
+            filter_key,
+            namespace or "",
+            self._namespace_generations[namespace or ""],
+            top_k,
+        )
 
     def upsert_questions(
         self, items: List[Dict[str, Any]], namespace: str | None = None
@@ -43,40 +169,143 @@ class PineconeVectorStore:
         """
         Embeds and upserts a list of question documents into the Pinecone index,
         optionally into a specific namespace.
+
+        Items are embedded EMBED_BATCH_SIZE at a time, and each embedded batch
+        is split into requests under Pinecone's size limits that are sent on
+        a small thread pool while the next batch is being embedded.
         """
-        vectors_to_upsert = []
-        for item in items:
-            metadata = {
-                "text": item["text"],
-                "domain": item["domain"],
-                "difficulty": item["difficulty"],
-                "ideal_answer_snippet": item["ideal_answer_snippet"],
-                "rubric_id": item.get("rubric_id"),
+        if not items:
+            return
+
+        target = f"namespace: '{namespace}'" if namespace else "default namespace"
+        print(f"Upserting {len(items)} questions to {target}")
+
+        upsert_kwargs = {"namespace": namespace} if namespace else {}
+        embed_batch = vector_store_settings.EMBED_BATCH_SIZE
+        max_in_flight = 2 * vector_store_settings.UPSERT_CONCURRENCY
+        started = time.perf_counter()
+        embedded = upserted = 0
+
+        with ThreadPoolExecutor(
+            max_workers=vector_store_settings.UPSERT_CONCURRENCY
+        ) as executor:
+            in_flight: set[Future] = set()
+
+            def _drain(limit: int) -> None:
+                nonlocal in_flight, upserted
+                while len(in_flight) > limit:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        # Re-raises the first failed request.
+                        upserted += future.result()
+
+            try:
+                for offset in range(0, len(items), embed_batch):
+                    batch = items[offset : offset + embed_batch]
+                    vectors = embed_texts(
+                        [question_embedding_text(item) for item in batch],
+                        batch_size=embed_batch,
+                    )
+                    records = [
+                        {
+                            "id": item["id"],
+                            "values": vector.tolist(),
+                            "metadata": _question_metadata(item, self.metadata_mode),
+                        }
+                        for item, vector in zip(batch, vectors)
+                    ]
+                    embedded += len(records)
+
+                    for request in _split_requests(records):
+                        _drain(max_in_flight - 1)
+                        in_flight.add(
+                            executor.submit(self._send_upsert, request, upsert_kwargs)
+                        )
+
+                    if (offset // embed_batch) % 10 == 0 or embedded == len(items):
+                        elapsed = time.perf_counter() - started
+                        print(
+                            f"  Embedded {embedded}/{len(items)}, upserted {upserted} "
+                            f"({embedded / elapsed:.0f} questions/s)"
+                        )
+                _drain(0)
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+            finally:
+                self._invalidate(namespace)
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"Upserted {upserted} questions in {elapsed:.1f}s "
+            f"({upserted / elapsed:.0f} questions/s)."
+        )
+
+    def _send_upsert(self, records: List[Dict[str, Any]], kwargs: Dict) -> int:
+        self.index.upsert(vectors=records, **kwargs)
+        return len(records)
+
+    def upsert_vectors(
+        self,
+        items: List[Dict[str, Any]],
+        vectors: np.ndarray,
+        namespace: str | None = None,
+    ) -> None:
+        """
+        Upserts question documents with already computed, row-aligned vectors,
+        sending up to UPSERT_CONCURRENCY requests at once.
+        """
+        if not items:
+            return
+        upsert_kwargs = {"namespace": namespace} if namespace else {}
+        records = [
+            {
+                "id": item["id"],
+                "values": vector.tolist(),
+                "metadata": _question_metadata(item, self.metadata_mode),
             }
-            # This is the corrected embedding logic that includes the domain.
-            text_to_embed = f"Domain: {item['domain']}. Question: {item['text']}"
-            vector = self.embedding_model.encode(text_to_embed).tolist()
-
-            vectors_to_upsert.append(
-                {
-                    "id": item["id"],
-                    "values": vector,
-                    "metadata": metadata,
-                }
-            )
+            for item, vector in zip(items, vectors)
+        ]
+        try:
+            with ThreadPoolExecutor(
+                max_workers=vector_store_settings.UPSERT_CONCURRENCY
+            ) as executor:
+                futures = [
+                    executor.submit(self._send_upsert, request, upsert_kwargs)
+                    for request in _split_requests(records)
+                ]
+                for future in futures:
+                    # Re-raises the first failed request.
+                    future.result()
+        finally:
+            self._invalidate(namespace)
 
-        if vectors_to_upsert:
-            # Pass the namespace to the upsert call if it's provided.
-            if namespace:
-                print(
-                    f"Upserting {len(vectors_to_upsert)} questions to namespace: '{namespace}'"
+    def delete_questions(self, ids: List[str], namespace: str | None = None) -> None:
+        """Deletes questions by id, optionally from a specific namespace."""
+        if not ids:
+            return
+        delete_kwargs = {"namespace": namespace} if namespace else {}
+        try:
+            for offset in range(0, len(ids), ID_BATCH_SIZE):
+                self.index.delete(
+                    ids=ids[offset : offset + ID_BATCH_SIZE], **delete_kwargs
                 )
-                self.index.upsert(vectors=vectors_to_upsert, namespace=namespace)
-            else:
-                print(
-                    f"Upserting {len(vectors_to_upsert)} questions to default namespace."
-                )
-                self.index.upsert(vectors=vectors_to_upsert)
+        finally:
+            self._invalidate(namespace)
+        target = f"namespace: '{namespace}'" if namespace else "default namespace"
+        print(f"Deleted {len(ids)} questions from {target}")
+
+    def existing_ids(self, ids: List[str], namespace: str | None = None) -> set[str]:
+        """The subset of ids that are present in the index."""
+        fetch_kwargs = {"namespace": namespace} if namespace else {}
+        found: set[str] = set()
+        for offset in range(0, len(ids), ID_BATCH_SIZE):
+            response = self.index.fetch(
+                ids=ids[offset : offset + ID_BATCH_SIZE], **fetch_kwargs
+            )
+            found.update(response.vectors.keys())
+        return found
 
     def query_similar(
         self,
@@ -84,17 +313,79 @@ class PineconeVectorStore:
         top_k: int,
         where: Dict[str, Any],
         namespace: str | None = None,
+        query_vector: List[float] | None = None,
     ) -> List[Dict[str, Any]]:
         """
         Queries the index for similar questions based on text and metadata filters,
-        optionally from a specific namespace.
+        optionally from a specific namespace. A precomputed query_vector, if given,
+        is used as-is and query_text is not embedded.
+        """
+        if query_vector is None:
+            query_vector = self._embed_query(query_text)
+
+        cache_key = self._result_key(query_vector, top_k, where, namespace)
+        cached = self._cached_results(cache_key)
+        if cached is not None:
+            return cached
+        return self._query_index(cache_key, query_vector, top_k, where, namespace)
+
+    async def aquery_similar(
+        self,
+        query_text: str,
+        top_k: int,
+        where: Dict[str, Any],
+        namespace: str | None = None,
+        query_vector: List[float] | None = None,
+    ) -> List[Dict[str, Any]]:
         """
-        query_vector = self.embedding_model.encode(query_text).tolist()
+        Async query_similar for graph nodes. The encode is awaited on the
+        embedding batcher and the Pinecone request runs on the io pool, so the
+        event loop only does the cache lookup.
+        """
+        if query_vector is None:
+            query_vector = await self._aembed_query(query_text)
+
+        cache_key = self._result_key(query_vector, top_k, where, namespace)
+        cached = self._cached_results(cache_key)
+        if cached is not None:
+            return cached
+        return await run_in_executor(
+            io_executor,
+            self._query_index,
+            cache_key,
+            query_vector,
+            top_k,
+            where,
+            namespace,
+        )
+
+    async def aupsert_questions(
+        self, items: List[Dict[str, Any]], namespace: str | None = None
+    ) -> None:
+        """Async upsert_questions; the whole bulk upsert runs off the event loop."""
+        await run_in_executor(
+            io_executor, self.upsert_questions, items, namespace=namespace
+        )
+
+    def _cached_results(self, cache_key: tuple) -> List[Dict[str, Any]] | None:
+        cached = self._result_cache.get(cache_key)
+        metrics.record_ratio("vector_store.query_result_cache", cached is not None)
+        if cached is None:
+            return None
+        return [dict(candidate) for candidate in cached]
 
-        # This handles the filter format correctly.
-        pinecone_filter = where.get("$and", where)
-        if isinstance(pinecone_filter, list):
-            pinecone_filter = {k: v for d in pinecone_filter for k, v in d.items()}
+    def _query_index(
+        self,
+        cache_key: tuple,
+        query_vector: List[float],
+        top_k: int,
+        where: Dict[str, Any],
+        namespace: str | None,
+    ) -> List[Dict[str, Any]]:
+        # Pinecone understands $and/$or natively. Flattening an $and list into
+        # one dict would drop all but one condition per field (e.g. $gte and
+        # $lte on difficulty).
+        pinecone_filter = where or None
 
         # Pass the namespace to the query call if it's provided.
         if namespace:
@@ -124,7 +415,13 @@ class PineconeVectorStore:
                 "metadata": meta,
             }
             formatted_candidates.append(candidate)
-        return formatted_candidates
+
+        # Slim vectors carry no bodies; fill them in with one batched read.
+        # Checked per candidate, so namespaces in either mode work.
+        formatted_candidates = question_hydrator.hydrate(formatted_candidates)
+
+        self._result_cache.put(cache_key, formatted_candidates)
+        return [dict(candidate) for candidate in formatted_candidates]
 
 
 def get_vector_store() -> PineconeVectorStore:
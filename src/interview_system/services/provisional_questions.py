@@ -0,0 +1,103 @@
+# src/interview_system/services/provisional_questions.py
+import hashlib
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+
+from interview_system.api.database import get_db_session
+from interview_system.config.retrieval_config import retrieval_settings
+from interview_system.repositories.review_queue_repository import ReviewQueueRepository
+from interview_system.services.domain_taxonomy import normalize_topic
+
+logger = logging.getLogger(__name__)
+
+# Same band the bank retrieval filters on.
+DIFFICULTY_BAND = 2
+
+
+def provisional_domain(topic: str, domains: List[str]) -> str:
+    """
+    The domain a fallback for this topic is filed under: the topic's first
+    bank domain, or the normalized topic if it resolved to none (the usual
+    case for gaps in the bank).
+    """
+    return domains[0] if domains else normalize_topic(topic)
+
+
+def provisional_question_id(text: str) -> str:
+    """The id the question will get once approved, so asked_ids carry over."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def question_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The question inside a fallback agent output, in either of its shapes."""
+    raw = data.get("raw_question")
+    if isinstance(raw, dict):
+        return raw
+    return {
+        "text": data.get("raw_question_text"),
+        "ideal_answer_snippet": data.get("ideal_answer_snippet"),
+    }
+
+
+def find_provisional_question(
+    topic: str,
+    domains: List[str],
+    query_vector: List[float],
+    difficulty_hint: int | None,
+    asked_ids: List[str] | None,
+    min_relevance: float,
+) -> Dict[str, Any] | None:
+    """
+    The most relevant pending fallback question for this topic that the
+    session has not seen, or None. Pending questions are scored against the
+    same query vector as the bank, and must clear the same relevance bar.
+    """
+    keys = list(domains) if domains else [normalize_topic(topic)]
+    with get_db_session() as db:
+        items = ReviewQueueRepository(db).get_provisional_questions(
+            keys, limit=retrieval_settings.PROVISIONAL_MAX_CANDIDATES
+        )
+        rows = [(item.candidate_question_json, item.embedding) for item in items]
+
+    candidates, vectors = [], []
+    for data, embedding in rows:
+        fields = question_fields(data)
+        text = fields.get("text")
+        if not text or not data.get("conversational_text"):
+            continue
+        question_id = provisional_question_id(text)
+        if asked_ids and question_id in asked_ids:
+            continue
+        difficulty = int(fields.get("difficulty") or difficulty_hint or 5)
+        if (
+            difficulty_hint is not None
+            and abs(difficulty - difficulty_hint) > DIFFICULTY_BAND
+        ):
+            continue
+        candidates.append(
+            {
+                "question_id": question_id,
+                "text": text,
+                "domain": fields.get("domain") or topic,
+                "difficulty": difficulty,
+                "ideal_answer_snippet": fields.get("ideal_answer_snippet") or "",
+                "conversational_text": data["conversational_text"],
+            }
+        )
+        vectors.append(embedding)
+    if not candidates:
+        return None
+
+    scores = np.asarray(vectors, dtype=np.float32) @ np.asarray(
+        query_vector, dtype=np.float32
+    )
+    best = int(np.argmax(scores))
+    if scores[best] < min_relevance:
+        return None
+    logger.info(
+        f"Reusing unreviewed fallback question for '{topic}' "
+        f"(relevance {float(scores[best]):.3f})."
+    )
+    return {**candidates[best], "relevance_score": float(scores[best])}
@@ -0,0 +1,40 @@
+# src/interview_system/services/question_bank.py
+import json
+import logging
+from typing import Any, Dict, List
+
+from interview_system.api.database import get_db_session
+from interview_system.config.retrieval_config import retrieval_settings
+from interview_system.repositories.question_repository import QuestionRepository
+
+logger = logging.getLogger(__name__)
+
+
+def load_question_bank() -> List[Dict[str, Any]]:
+    """
+    Every bank question as a seed-file style dict: the seed file plus every
+    row of questions_meta (approved fallbacks). The database wins on
+    conflicting ids.
+    """
+    items: Dict[str, Dict[str, Any]] = {}
+    path = retrieval_settings.QUESTION_BANK_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            items.update({q["id"]: q for q in json.load(f)})
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not read {path}: {e}")
+    try:
+        with get_db_session() as db:
+            for row in QuestionRepository(db).get_all():
+                items[row.id] = {
+                    "id": row.id,
+                    "text": row.text,
+                    "domain": row.domain,
+                    "difficulty": row.difficulty,
+                    "ideal_answer_snippet": row.ideal_answer_snippet,
+                    "rubric_id": row.rubric_id,
+                    "conversational_variants": row.conversational_variants,
+                }
+    except Exception as e:
+        logger.warning(f"Could not read questions_meta: {e}")
+    return list(items.values())
@@ -0,0 +1,91 @@
+# src/interview_system/services/question_hydration.py
+import logging
+from typing import Any, Dict, List
+
+from interview_system.api.database import get_db_session
+from interview_system.config.cache_config import cache_settings
+from interview_system.repositories.question_repository import QuestionRepository
+from interview_system.services import metrics
+from interview_system.services.memory_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Fields kept in questions_meta but left out of slim vector metadata.
+BODY_FIELDS = ("text", "ideal_answer_snippet", "conversational_variants")
+
+
+class QuestionHydrator:
+    """
+    Fills in question bodies for candidates from a slim vector index.
+
+    Bodies are read through an in-process LRU; all misses of one result set
+    are fetched from questions_meta in a single query.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache = LRUCache(maxsize)
+
+    def hydrate(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Returns the candidates with text, ideal_answer_snippet and variants in
+        their metadata. Candidates that already carry a text (full metadata)
+        pass through; ones whose question is missing from the table are dropped.
+        """
+        bodies: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for candidate in candidates:
+            if "text" in (candidate.get("metadata") or {}):
+                continue
+            body = self._cache.get(candidate["id"])
+            if body is None:
+                missing.append(candidate["id"])
+            else:
+                bodies[candidate["id"]] = body
+
+        lookups = len(bodies) + len(missing)
+        if lookups:
+            metrics.increment("hydration.cache_hits", len(bodies))
+            metrics.increment("hydration.cache_misses", len(missing))
+        if missing:
+            bodies.update(self._fetch(missing))
+
+        hydrated = []
+        for candidate in candidates:
+            meta = candidate.get("metadata") or {}
+            if "text" in meta:
+                hydrated.append(candidate)
+                continue
+            body = bodies.get(candidate["id"])
+            if body is None:
+                logger.warning(
+                    f"Question {candidate['id']} is in the index but not in "
+                    "questions_meta; skipping it."
+                )
+                continue
+            hydrated.append(
+                {**candidate, "text": body["text"], "metadata": {**meta, **body}}
+            )
+        return hydrated
+
+    def _fetch(self, question_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with get_db_session() as db:
+            rows = QuestionRepository(db).get_by_ids(question_ids)
+            bodies = {
+                row.id: {
+                    "text": row.text,
+                    "ideal_answer_snippet": row.ideal_answer_snippet or "",
+                    "conversational_variants": row.conversational_variants or [],
+                }
+                for row in rows
+            }
+        for question_id, body in bodies.items():
+            self._cache.put(question_id, body)
+        return bodies
+
+    def invalidate(self, question_ids: List[str]) -> None:
+        """Forgets cached bodies, e.g. after their rows were rewritten."""
+        for question_id in question_ids:
+            self._cache.pop(question_id)
+
+
+question_hydrator = QuestionHydrator(maxsize=cache_settings.HYDRATION_CACHE_SIZE)
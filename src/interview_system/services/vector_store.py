@@ -1,7 +1,113 @@
 # src/interview_system/services/vector_store.py
+from typing import Any, Dict, List, Optional
 
-from interview_system.services.pinecone_store import get_vector_store
+import numpy as np
+
+from interview_system.config.vector_store_config import vector_store_settings
+from interview_system.services.index_aliases import index_aliases
 
 # This file now acts as the single source of truth for getting the vector store.
-# By changing the import here, the entire application switches from Chroma to Pinecone
-# without needing any changes in the agent files that call get_vector_store().
\ No newline at end of file
+# VECTOR_STORE_BACKEND selects the backend, so the entire application switches
+# between Pinecone and the in-process NumPy index without needing any changes
+# in the agent files that call get_vector_store().
+if vector_store_settings.VECTOR_STORE_BACKEND == "local":
+    from interview_system.services.local_store import (
+        get_vector_store as _get_backend_store,
+    )
+elif vector_store_settings.VECTOR_STORE_BACKEND == "pinecone":
+    from interview_system.services.pinecone_store import (
+        get_vector_store as _get_backend_store,
+    )
+else:
+    raise ValueError(
+        f"Unknown VECTOR_STORE_BACKEND: {vector_store_settings.VECTOR_STORE_BACKEND!r}"
+    )
+
+# This global variable will hold our single store instance.
+_vector_store_instance: Optional["AliasedVectorStore"] = None
+
+
+class AliasedVectorStore:
+    """
+    The backend store, with every namespace resolved through index_aliases
+    (see scripts/reindex.py) before it is used. Everything else, including
+    attribute access, passes straight through to the backend store.
+    """
+
+    def __init__(self, store):
+        object.__setattr__(self, "store", store)
+
+    def __getattr__(self, name: str):
+        return getattr(self.store, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.store, name, value)
+
+    def upsert_questions(
+        self, items: List[Dict[str, Any]], namespace: str | None = None
+    ) -> None:
+        return self.store.upsert_questions(items, namespace=_resolve(namespace))
+
+    async def aupsert_questions(
+        self, items: List[Dict[str, Any]], namespace: str | None = None
+    ) -> None:
+        return await self.store.aupsert_questions(items, namespace=_resolve(namespace))
+
+    def upsert_vectors(
+        self,
+        items: List[Dict[str, Any]],
+        vectors: np.ndarray,
+        namespace: str | None = None,
+    ) -> None:
+        return self.store.upsert_vectors(items, vectors, namespace=_resolve(namespace))
+
+    def query_similar(
+        self,
+        query_text: str,
+        top_k: int,
+        where: Dict[str, Any],
+        namespace: str | None = None,
+        query_vector: List[float] | None = None,
+    ) -> List[Dict[str, Any]]:
+        return self.store.query_similar(
+            query_text, top_k, where, _resolve(namespace), query_vector
+        )
+
+    async def aquery_similar(
+        self,
+        query_text: str,
+        top_k: int,
+        where: Dict[str, Any],
+        namespace: str | None = None,
+        query_vector: List[float] | None = None,
+    ) -> List[Dict[str, Any]]:
+        return await self.store.aquery_similar(
+            query_text, top_k, where, _resolve(namespace), query_vector
+        )
+
+    def delete_questions(self, ids: List[str], namespace: str | None = None) -> None:
+        return self.store.delete_questions(ids, namespace=_resolve(namespace))
+
+    def existing_ids(self, ids: List[str], namespace: str | None = None) -> set[str]:
+        return self.store.existing_ids(ids, namespace=_resolve(namespace))
+
+
+def _resolve(namespace: str | None) -> str | None:
+    return index_aliases.resolve(namespace)
+
+
+def get_vector_store():
+    """
+    Get a singleton instance of the configured vector store. The local backend
+    is rebuilt in-process on every start, so it has no versions to alias and
+    is returned as it is.
+    """
+    global _vector_store_instance
+    if vector_store_settings.VECTOR_STORE_BACKEND == "local":
+        return _get_backend_store()
+    if _vector_store_instance is None:
+        _vector_store_instance = AliasedVectorStore(_get_backend_store())
+    return _vector_store_instance
+
+
+__all__ = ["get_vector_store", "AliasedVectorStore"]
@@ -0,0 +1,51 @@
+# tests/test_index_aliases.py
+import threading
+import time
+
+from interview_system.services.index_aliases import IndexAliasResolver
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_resolve_serves_stale_routes_while_a_slow_refresh_runs(monkeypatch):
+    resolver = IndexAliasResolver(ttl_seconds=0)
+    resolver._store({"bank": "bank.v1"})
+
+    started, release = threading.Event(), threading.Event()
+    loads = []
+
+    def slow_load():
+        loads.append(time.monotonic())
+        started.set()
+        release.wait(5)
+        return {"bank": "bank.v2"}
+
+    monkeypatch.setattr(resolver, "_load", slow_load)
+
+    # The expired TTL starts a background refresh; resolve does not wait for it.
+    begin = time.monotonic()
+    assert resolver.resolve("bank__python") == "bank.v1__python"
+    assert started.wait(1)
+    for _ in range(10):
+        assert resolver.resolve("bank") == "bank.v1"
+    assert time.monotonic() - begin < 0.5
+    # Only one refresh runs at a time.
+    assert len(loads) == 1
+
+    release.set()
+    assert _wait_for(lambda: resolver.resolve("bank") == "bank.v2")
+
+
+def test_failed_refresh_keeps_previous_routes(monkeypatch):
+    resolver = IndexAliasResolver(ttl_seconds=60)
+    resolver._store({"bank": "bank.v1"})
+    resolver._store(None)
+    assert resolver.resolve("bank") == "bank.v1"
+    assert resolver.resolve("other") == "other"
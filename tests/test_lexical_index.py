@@ -0,0 +1,22 @@
+# tests/test_lexical_index.py
+from interview_system.services.lexical_index import reciprocal_rank_fusion
+
+
+def test_fusion_keeps_each_retrievers_own_score():
+    vector = [
+        {"id": "a", "relevance_score": 0.42},
+        {"id": "b", "relevance_score": 0.31},
+    ]
+    lexical = [
+        {"id": "b", "lexical_score": 0.95},
+        {"id": "c", "lexical_score": 0.80},
+    ]
+    fused = {c["id"]: c for c in reciprocal_rank_fusion([vector, lexical], k=60)}
+
+    # The BM25 score does not overwrite the cosine one.
+    assert fused["b"]["relevance_score"] == 0.31
+    assert fused["b"]["lexical_score"] == 0.95
+    assert fused["b"]["fused_score"] == 1 / 62 + 1 / 61
+    # Found by BM25 only: no cosine relevance to gate on.
+    assert "relevance_score" not in fused["c"]
+    assert fused["c"]["lexical_score"] == 0.80
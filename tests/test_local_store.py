@@ -0,0 +1,63 @@
+# tests/test_local_store.py
+import numpy as np
+
+from interview_system.services import local_store
+from interview_system.services.local_store import LocalVectorStore
+
+
+def _bank(n: int, dim: int, domains: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    items = [
+        {"id": f"q{i}", "text": f"question {i}", "domain": f"d{i % domains}"}
+        for i in range(n)
+    ]
+    return items, vectors
+
+
+def test_filtered_ann_query_returns_top_k():
+    items, vectors = _bank(n=400, dim=16, domains=20)
+    ann = LocalVectorStore(mode="ann", ann_min_vectors=100, nprobe=1)
+    exact = LocalVectorStore(mode="exact")
+    ann.upsert_vectors(items, vectors)
+    exact.upsert_vectors(items, vectors)
+    assert ann._partition(None).ann is not None
+
+    query = vectors[7].tolist()
+    where = {"domain": "d3"}
+    results = ann.query_similar("", 5, where, query_vector=query)
+
+    assert len(results) == 5
+    assert all(r["metadata"]["domain"] == "d3" for r in results)
+    expected = exact.query_similar("", 5, where, query_vector=query)
+    assert [r["id"] for r in results] == [r["id"] for r in expected]
+
+
+def test_chunked_scan_of_quantized_snapshot_matches_dense_scan(
+    tmp_path, monkeypatch
+):
+    items, vectors = _bank(n=1000, dim=16, domains=4)
+    store = LocalVectorStore(mode="exact")
+    store.upsert_vectors(items, vectors)
+    store.save_snapshot(str(tmp_path), dtype="int8")
+
+    # Several chunks per scan and IVF build, including a partial last one.
+    monkeypatch.setattr(local_store, "CHUNK_ROWS", 96)
+    snapshot = LocalVectorStore(mode="ann", ann_min_vectors=100, nprobe=64)
+    snapshot.load_snapshot(str(tmp_path))
+    partition = snapshot._partition(None)
+    assert partition.vectors.dtype == np.int8
+    assert partition.ann is not None
+
+    dense = partition.dense()
+    query = vectors[11]
+    expected = np.argsort(-(dense @ query))[:10]
+
+    rows, scores = partition.top_k(np.arange(partition.size), query, 10)
+    assert rows.tolist() == expected.tolist()
+    assert np.allclose(scores, (dense @ query)[expected], atol=1e-5)
+
+    # Every row lands in exactly one IVF list.
+    listed = np.sort(np.concatenate(partition.ann.lists))
+    assert listed.tolist() == list(range(partition.size))